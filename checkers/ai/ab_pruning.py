@@ -1,36 +1,94 @@
-from copy import deepcopy
 from math import inf
+from time import perf_counter
 
-from checkers.logic.piece import Player, Rank
+from checkers.ai.cancel import CancellationToken
+from checkers.ai.evaluation import Evaluation, Material
+from checkers.ai.ordering import MoveOrdering
+from checkers.ai.stats import Callback, IterationStats, SearchResult, SearchStats
+from checkers.ai.tablebase import Tablebase
+from checkers.ai.transposition import Bound, TranspositionTable
+from checkers.exceptions.search import SearchAborted
+from checkers.logic.moves import Move
+from checkers.logic.piece import Player
+
+# Bound seen from the other player's point of view
+FLIP = {Bound.EXACT: Bound.EXACT, Bound.LOWER: Bound.UPPER, Bound.UPPER: Bound.LOWER}
+
+# Iterative deepening
+MAX_DEPTH = 64
+CLOCK_INTERVAL = 64  # nodes between two clock reads
 
 
 class AlphaBetaPruning:
+    def __init__(
+        self,
+        table: TranspositionTable | None = None,
+        quiesce: bool = True,
+        evaluation: Evaluation | None = None,
+        tablebase: Tablebase | None = None,
+    ) -> None:
+        """
+        Initialize the search.
+
+        :param TranspositionTable | None table: transposition table, defaults to None (disabled)
+        :param bool quiesce: resolve pending captures at the horizon, defaults to True
+        :param Evaluation | None evaluation: evaluation function, defaults to None ('Material')
+        :param Tablebase | None tablebase: endgame tablebases, defaults to None (disabled)
+        :ivar ordering: move ordering (killer and history tables)
+        :ivar nodes: number of nodes visited by the current search
+        :ivar stats: statistics of the last search (see 'iterative_deepening')
+        """
+        self.table = table
+        self.quiesce = quiesce
+        self.evaluation = evaluation or Material()
+        self.tablebase = tablebase
+        self.ordering = MoveOrdering()
+        self.nodes = 0
+        self.stats = SearchStats()
+        self._deadline: float | None = None
+        self._node_limit: int | None = None
+        self._token: CancellationToken | None = None
+
     def evaluate(self, game, max_player: Player) -> int:
         """
-        Evaluate the game state for the specified player.
+        Evaluate the game state for the specified player (see <evaluation>).
 
         :param Game game: current game state
         :param Player max_player: maximizing player
         :return int: evaluation score for the given game state
         """
-        score = 0
-        for player in [Player.BLACK, Player.WHITE]:
-            for rank in [Rank.PAWN, Rank.KING]:
-                pieces = dict(
-                    filter(
-                        lambda x: x[1].player is player and x[1].rank is rank,
-                        game.board.pieces.items(),
-                    )
-                )
+        self.stats.evaluations += 1
+        return self.evaluation(game.board, max_player)
+
+    def _probe(self, game) -> float | None:
+        """
+        Return the tablebase score of the game state, if it has few enough pieces.
+        Tablebase scores (see 'checkers.ai.tablebase') are scaled to the evaluation: wins are
+        worth more than any evaluation, and shorter wins more than longer ones.
 
-                pieces_score = len(pieces) * rank.value
+        :param Game game: current game state
+        :return float | None: score from the point of view of the player to move, or None
+        """
+        if len(game.board.pieces) > self.tablebase.pieces:  # type: ignore
+            return None
 
-                if player is max_player:
-                    score += pieces_score
-                else:
-                    score -= pieces_score
+        score = self.tablebase.probe(game.board, game.player)  # type: ignore
+        if score is None:
+            return None
+        return score * self.evaluation.pawn
 
-        return int(score)
+    @staticmethod
+    def _is_game_over(game) -> bool:
+        """
+        Return True if either player ran out of moves.
+        Unlike 'Game.is_game_over', the game (searched in place) is left untouched.
+
+        :param Game game: current game state
+        :return bool: True if game is over, False otherwise
+        """
+        return not all(
+            game.board.has_moves(player) for player in [Player.BLACK, Player.WHITE]
+        )
 
     def minimax(
         self,
@@ -40,9 +98,11 @@ class AlphaBetaPruning:
         max_player: Player,
         alpha: float = -inf,
         beta: float = inf,
-    ) -> tuple[list | None, float]:
+        ply: int = 0,
+    ) -> tuple[Move | None, float]:
         """
         Perform the alpha-beta pruning minimax search to find the best move.
+        Every legal move is searched, best candidates first (see 'MoveOrdering').
 
         :param Game game: current game state
         :param int depth: depth of the search tree
@@ -50,60 +110,316 @@ class AlphaBetaPruning:
         :param Player max_player: maximizing player
         :param float alpha: alpha value for alpha-beta pruning
         :param float beta: beta value for alpha-beta pruning
-        :return tuple[list | None, float]: best move found by the search and its evaluation score
+        :param int ply: distance from the root of the search, defaults to 0
+        :return tuple[Move | None, float]: best move found by the search and its evaluation score
         """
-        if depth == 0 or game.is_game_over():
+        if ply > self.stats.max_ply:
+            self.stats.max_ply = ply
+
+        if self.tablebase is not None and ply:
+            score = self._probe(game)
+            if score is not None:
+                self.nodes += 1
+                return None, score if game.player is max_player else -score
+
+        if depth == 0 and self.quiesce:
+            if game.player is max_player:
+                return None, self.quiescence(game, alpha, beta)
+            return None, -self.quiescence(game, -beta, -alpha)
+
+        self.nodes += 1
+        if (
+            self._deadline is not None
+            or self._node_limit is not None
+            or self._token is not None
+        ):
+            self._check_budget()
+
+        if depth == 0 or self._is_game_over(game):
             score = self.evaluate(game, max_player)
             return None, score
 
-        if maximizer:
-            best_score = -inf
+        # Transposition table (scores stored from the point of view of the player to move)
+        key = game.hash
+        hash_move = None
+        window = alpha, beta
+        if self.table is not None:
+            entry = self.table.probe(key)
+            if entry is not None:
+                stored_depth, score, bound, hash_move = entry
+                if stored_depth >= depth:
+                    if not maximizer:
+                        score, bound = -score, FLIP[bound]
 
-            for piece in game.board.get_player_moves(game.player):
-                move = game.board._get_player_tree(game.player)[piece][0]
-                move_copy = deepcopy(move)
+                    if bound is Bound.EXACT:
+                        return hash_move, score
+                    elif bound is Bound.LOWER:
+                        alpha = max(alpha, score)
+                    else:
+                        beta = min(beta, score)
 
-                game_copy = deepcopy(game)
-                game_copy._make_move(move)
-                game_copy.next_turn()
+                    if alpha >= beta:
+                        return hash_move, score
+
+        best_move = None
+        best_score = -inf if maximizer else inf
 
+        for i, move in enumerate(self.ordering.moves(game, hash_move, ply)):
+            record = game.make_move(move)
+            try:
                 score = self.minimax(
-                    game_copy, depth - 1, False, max_player, alpha, beta
+                    game, depth - 1, not maximizer, max_player, alpha, beta, ply + 1
                 )[1]
+            finally:
+                game.unmake_move(record)
 
+            if maximizer:
                 if score > best_score:
                     best_score = score
-                    best_move = move_copy
+                    best_move = move
 
-                if alpha and beta:
-                    alpha = max(alpha, score)
-                    if alpha >= beta:
-                        break
+                alpha = max(alpha, score)
+                if alpha >= beta:
+                    self.ordering.update(move, depth, ply)
+                    self.stats.cutoff(i)
+                    break
 
-            return best_move, best_score
+            else:
+                if score < best_score:
+                    best_score = score
+                    best_move = move
 
-        else:
-            best_score = inf
+                beta = min(beta, score)
+                if alpha >= beta:
+                    self.ordering.update(move, depth, ply)
+                    self.stats.cutoff(i)
+                    break
 
-            for piece in game.board.get_player_moves(game.player):
-                move = game.board._get_player_tree(game.player)[piece][0]
-                move_copy = deepcopy(move)
+        if self.table is not None:
+            if best_score <= window[0]:
+                bound = Bound.UPPER
+            elif best_score >= window[1]:
+                bound = Bound.LOWER
+            else:
+                bound = Bound.EXACT
 
-                game_copy = deepcopy(game)
-                game_copy._make_move(move)
-                game_copy.next_turn()
+            if maximizer:
+                self.table.store(key, depth, best_score, bound, best_move)
+            else:
+                self.table.store(key, depth, -best_score, FLIP[bound], best_move)
 
-                score = self.minimax(
-                    game_copy, depth - 1, True, max_player, alpha, beta
-                )[1]
+        return best_move, best_score
 
-                if score < best_score:
-                    best_score = score
-                    best_move = move_copy
+    def quiescence(self, game, alpha: float = -inf, beta: float = inf) -> float:
+        """
+        Search the captures pending at the horizon until the position is quiet.
+        Captures are compulsory: the player to move can only stand pat (take the static evaluation)
+        if it has no capture, otherwise every capture is searched (longest first).
 
-                if alpha and beta:
-                    beta = min(beta, score)
-                    if alpha >= beta:
-                        break
+        :param Game game: current game state
+        :param float alpha: lower bound of the search window
+        :param float beta: upper bound of the search window
+        :return float: evaluation score, from the point of view of the player to move
+        """
+        self.nodes += 1
+        if (
+            self._deadline is not None
+            or self._node_limit is not None
+            or self._token is not None
+        ):
+            self._check_budget()
+
+        if self.tablebase is not None:
+            score = self._probe(game)
+            if score is not None:
+                return score
+
+        # Stand pat: the position is quiet
+        if not game.board.has_captures(game.player) or self._is_game_over(game):
+            return self.evaluate(game, game.player)
+
+        best_score = -inf
+        for move in self.ordering.moves(game):
+            record = game.make_move(move)
+            try:
+                score = -self.quiescence(game, -beta, -alpha)
+            finally:
+                game.unmake_move(record)
+
+            best_score = max(best_score, score)
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        return best_score
+
+    def search(
+        self, game, depth: int, max_player: Player, previous: float | None = None
+    ) -> tuple[Move | None, float]:
+        """
+        Search the game at a fixed depth from the root.
+
+        :param Game game: current game state (player to move is the maximizing player)
+        :param int depth: depth of the search tree
+        :param Player max_player: maximizing player
+        :param float | None previous: score of the previous iteration (unused), defaults to None
+        :return tuple[Move | None, float]: best move found by the search and its evaluation score
+        """
+        return self.minimax(
+            game=game, depth=depth, maximizer=True, max_player=max_player
+        )
+
+    def iterative_deepening(
+        self,
+        game,
+        max_player: Player,
+        time_budget: float | None = None,
+        node_budget: int | None = None,
+        max_depth: int = MAX_DEPTH,
+        callback: Callback | None = None,
+    ) -> tuple[Move | None, float, int]:
+        """
+        Search at depth 1, 2, 3... until a budget runs out or <max_depth> is reached (see 'run').
+
+        :param Game game: current game state (player to move is the maximizing player)
+        :param Player max_player: maximizing player
+        :param float | None time_budget: time budget in milliseconds, defaults to None (no limit)
+        :param int | None node_budget: maximum number of nodes visited, defaults to None (no limit)
+        :param int max_depth: maximum depth, defaults to MAX_DEPTH
+        :param Callback | None callback: called after every completed depth, defaults to None
+        :return tuple[Move | None, float, int]: best move, its evaluation score, and depth completed
+        """
+        deadline = None
+        if time_budget is not None:
+            deadline = perf_counter() + time_budget / 1000
+
+        result = self.run(
+            game,
+            max_player,
+            node_limit=node_budget,
+            deadline=deadline,
+            max_depth=max_depth,
+            callback=callback,
+        )
+        return result.move, result.score, result.depth
+
+    def run(
+        self,
+        game,
+        max_player: Player,
+        token: CancellationToken | None = None,
+        node_limit: int | None = None,
+        deadline: float | None = None,
+        max_depth: int = MAX_DEPTH,
+        callback: Callback | None = None,
+    ) -> SearchResult:
+        """
+        Anytime search: search at depth 1, 2, 3... until <max_depth> is reached, <token> is
+        cancelled, <node_limit> nodes are visited or the <deadline> passes.
+        The result of the last completed depth is returned: an interrupted iteration is discarded.
+        Depth 1 is always completed so that a move is returned.
+        The statistics of the search are kept in <stats>, and streamed to <callback>.
+
+        :param Game game: current game state (player to move is the maximizing player)
+        :param Player max_player: maximizing player
+        :param CancellationToken | None token: cancellation token, defaults to None
+        :param int | None node_limit: maximum number of nodes visited, defaults to None (no limit)
+        :param float | None deadline: time at which the search stops (see 'perf_counter'),
+            defaults to None (no limit)
+        :param int max_depth: maximum depth, defaults to MAX_DEPTH
+        :param Callback | None callback: called after every completed depth, defaults to None
+        :return SearchResult: best move found, its evaluation score, depth completed, and
+            whether the search completed
+        """
+        start = perf_counter()
+        self.nodes = 0
+        self.stats = stats = SearchStats()
+        best_move, best_score, completed = None, -inf, 0
+        finished = False
+
+        self.ordering.clear()
+        hits = misses = 0
+        if self.table is not None:
+            self.table.new_search()
+            hits, misses = self.table.hits, self.table.misses
+
+        for depth in range(1, max_depth + 1):
+            if completed:
+                self._deadline = deadline
+                self._node_limit = node_limit
+                self._token = token
+
+            try:
+                move, score = self.search(
+                    game, depth, max_player, best_score if completed else None
+                )
+            except SearchAborted:
+                break
+            finally:
+                self._deadline = self._node_limit = self._token = None
+
+            best_move, best_score, completed = move, score, depth
+            self._update_stats(start, hits, misses)
+            stats.depth = depth
+            stats.iterations.append(
+                IterationStats(depth, move, score, stats.nodes, stats.elapsed)
+            )
+            if callback is not None:
+                callback(stats)
+
+            # Nothing left to search
+            if (
+                depth == max_depth
+                or move is None
+                or len(game.board.legal_moves(game.player)) == 1
+            ):
+                finished = True
+                break
+
+            # Stopped, or limit reached at the end of the iteration
+            if token is not None and token.cancelled:
+                break
+            if node_limit is not None and self.nodes >= node_limit:
+                break
+            if deadline is not None and perf_counter() >= deadline:
+                break
+
+        self._update_stats(start, hits, misses)
+        return SearchResult(best_move, best_score, completed, finished, stats)
+
+    def _update_stats(self, start: float, hits: int, misses: int) -> None:
+        """
+        Update the counters of <stats> kept elsewhere (nodes, time, transposition table).
+
+        :param float start: start time of the search (see 'perf_counter')
+        :param int hits: transposition table hits when the search started
+        :param int misses: transposition table misses when the search started
+        """
+        stats = self.stats
+        stats.nodes = self.nodes
+        stats.elapsed = (perf_counter() - start) * 1000
+        if self.table is not None:
+            stats.hits = self.table.hits - hits
+            stats.probes = stats.hits + self.table.misses - misses
+
+    def _cancelled(self) -> bool:
+        """
+        Return True if the token of the running search was cancelled.
+
+        :return bool: True if cancelled
+        """
+        return self._token is not None and self._token.cancelled
+
+    def _check_budget(self) -> None:
+        """
+        Abort the search if it was cancelled, or if the node or time budget is exhausted.
+        The clock and the token are only read every CLOCK_INTERVAL nodes.
+        """
+        if self._node_limit is not None and self.nodes > self._node_limit:
+            raise SearchAborted(f"node budget of {self._node_limit} exhausted")
 
-            return best_move, best_score
+        if not self.nodes % CLOCK_INTERVAL:
+            if self._token is not None and self._token.cancelled:
+                raise SearchAborted("search cancelled")
+            if self._deadline is not None and perf_counter() >= self._deadline:
+                raise SearchAborted("time budget exhausted")
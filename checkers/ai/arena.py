@@ -1,4 +1,5 @@
 from checkers.ai.ab_pruning import AlphaBetaPruning
+from checkers.ai.transposition import TranspositionTable
 from checkers.logic.game import Game
 from checkers.logic.piece import Player
 from checkers.utils.logging import logging
@@ -11,6 +12,15 @@ class Arena:
     Represents the arena where we can run games.
     """
 
+    def __init__(self, table: TranspositionTable | None = None) -> None:
+        """
+        Initialize the arena.
+
+        :param TranspositionTable | None table: transposition table of the AI player, kept
+            across moves and games, defaults to None (disabled)
+        """
+        self.table = table
+
     def play(self, games: int, depth: int) -> tuple[int, int]:
         """
         Playout <games>.
@@ -21,6 +31,7 @@ class Arena:
         """
 
         wins = {Player.BLACK: 0, Player.WHITE: 0}
+        ai = AlphaBetaPruning(table=self.table)
 
         for _ in range(games):
             game = Game()
@@ -34,14 +45,17 @@ class Arena:
 
                 # AI player turn
                 else:
-                    ai = AlphaBetaPruning()
                     if depth > 0:
-                        best_move, _ = ai.minimax(
+                        if self.table is not None:
+                            self.table.new_search()
+
+                        move, _ = ai.minimax(
                             game=game,
                             depth=depth,
                             maximizer=True,
                             max_player=game.player,
                         )
+                        best_move = move.path  # type: ignore
                     elif depth == 0:
                         best_move = game.get_random_move(game.player)
 
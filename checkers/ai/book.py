@@ -0,0 +1,281 @@
+"""
+Opening book: position hash -> moves played from it, with game statistics.
+
+The book is a sorted binary file, read through 'mmap' (shared by all processes, never loaded):
+    - header: <MAGIC>, number of records (uint64)
+    - columns of <n> records each, sorted by position hash:
+      keys (uint64), moves (uint64, see 'Move.pack'), games, wins, losses (uint32)
+Usage: python -m checkers.ai.book --games 100 --depth 4 --plies 10 [--output assets/book.bin]
+"""
+
+import argparse
+import math
+import mmap
+import random
+import time
+from pathlib import Path
+
+import numpy as np
+
+from checkers.ai.evaluation import Positional
+from checkers.ai.negamax import Negamax
+from checkers.ai.transposition import TranspositionTable
+from checkers.logic.moves import Move
+from checkers.logic.piece import Player
+
+MAGIC = b"CHKBOOK1"
+HEADER = np.dtype([("magic", "S8"), ("count", "<u8")])
+COLUMNS = (
+    ("keys", "<u8"),
+    ("moves", "<u8"),
+    ("games", "<u4"),
+    ("wins", "<u4"),
+    ("losses", "<u4"),
+)
+
+# Default book location (see 'Environment')
+BOOK = Path("assets/book.bin")
+
+# Self-play games longer than this are draws
+MAX_PLIES = 200
+
+# Confidence of the score lower bound used to rank book moves (z-score: 95%)
+CONFIDENCE = 1.96
+
+
+def lower_bound(score: float, games: int, z: float = CONFIDENCE) -> float:
+    """
+    Return the lower bound of the Wilson score interval of a move: moves played in few games
+    get a low bound, so that small samples don't outrank well-tested moves.
+
+    :param float score: score of the move (wins + half draws, per game)
+    :param int games: number of games played with the move
+    :param float z: z-score of the confidence, defaults to CONFIDENCE
+    :return float: lower bound of the score
+    """
+    z2 = z * z
+    center = score + z2 / (2 * games)
+    margin = z * math.sqrt(score * (1 - score) / games + z2 / (4 * games * games))
+    return (center - margin) / (1 + z2 / games)
+
+
+class BookBuilder:
+    """
+    BookBuilder class.
+
+    Collects (<position>, <move>) statistics from games, and writes them as an opening book.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty book.
+
+        :ivar stats: {(<position hash>, <packed move>): [<games>, <wins>, <losses>]}
+        """
+        self.stats: dict[tuple[int, int], list[int]] = {}
+
+    def __len__(self) -> int:
+        """
+        Return the number of (<position>, <move>) records.
+
+        :return int: number of records
+        """
+        return len(self.stats)
+
+    def add(self, key: int, move: Move, result: int) -> None:
+        """
+        Add the result of a game to the statistics of a move.
+
+        :param int key: position hash (see 'Game.hash')
+        :param Move move: move played
+        :param int result: result for the player who moved (1: win, 0: draw, -1: loss)
+        """
+        stats = self.stats.setdefault((key, move.pack()), [0, 0, 0])
+        stats[0] += 1
+        if result > 0:
+            stats[1] += 1
+        elif result < 0:
+            stats[2] += 1
+
+    def play(
+        self,
+        games: int,
+        depth: int,
+        plies: int,
+        noise: float = 0.25,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Play self-play games and add their first <plies> moves to the book.
+        Moves are searched at <depth>, or random (with probability <noise>) within the book plies.
+
+        :param int games: number of games
+        :param int depth: search depth
+        :param int plies: number of plies per game added to the book
+        :param float noise: probability of a random move within the book plies, defaults to 0.25
+        :param int | None seed: random seed, defaults to None
+        """
+        from checkers.logic.game import Game
+
+        rng = random.Random(seed)
+        ai = Negamax(table=TranspositionTable(), evaluation=Positional())
+
+        for _ in range(games):
+            game = Game()
+            history: list[tuple[int, Move, Player]] = []
+            winner = None
+
+            for ply in range(MAX_PLIES):
+                if game.is_game_over():
+                    winner = game.winner
+                    break
+
+                if ply < plies and rng.random() < noise:
+                    move = rng.choice(list(game.board.legal_moves(game.player)))
+                else:
+                    ai.table.new_search()  # type: ignore
+                    move, _ = ai.search(game, depth, game.player)
+
+                if ply < plies:
+                    history.append((game.hash, move, game.player))  # type: ignore
+                game.make_move(move)  # type: ignore
+
+            for key, move, player in history:
+                result = 0 if winner is None else (1 if player is winner else -1)
+                self.add(key, move, result)
+
+    def write(self, path: Path | str) -> None:
+        """
+        Write the book as a sorted binary file.
+
+        :param Path | str path: output file
+        """
+        records = sorted((*key, *stats) for key, stats in self.stats.items())
+        header = np.array([(MAGIC, len(records))], dtype=HEADER)
+
+        with open(path, "wb") as file:
+            file.write(header.tobytes())
+            for i, (_, dtype) in enumerate(COLUMNS):
+                column = np.array([record[i] for record in records], dtype=dtype)
+                file.write(column.tobytes())
+
+
+class OpeningBook:
+    """
+    OpeningBook class.
+
+    Read-only opening book, memory-mapped: probes binary search the sorted position hashes.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """
+        Open a book written by 'BookBuilder.write'.
+
+        :param Path | str path: book file
+        :raises ValueError: if the file is not an opening book
+        """
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header = np.frombuffer(self._mmap[: HEADER.itemsize], dtype=HEADER)[0]
+        if header["magic"] != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not an opening book")
+
+        count = int(header["count"])
+        offset = HEADER.itemsize
+        columns = {}
+        for name, dtype in COLUMNS:
+            columns[name] = np.frombuffer(
+                self._mmap, dtype=dtype, count=count, offset=offset
+            )
+            offset += count * np.dtype(dtype).itemsize
+        self._columns = columns
+
+    def __len__(self) -> int:
+        """
+        Return the number of (<position>, <move>) records.
+
+        :return int: number of records
+        """
+        return len(self._columns["keys"])
+
+    def __enter__(self) -> "OpeningBook":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the memory map (arrays returned by the book must not be in use).
+        """
+        self._columns = {name: np.empty(0, dtype) for name, dtype in COLUMNS}
+        self._mmap.close()
+
+    def probe(self, game) -> list[tuple[Move, int, int, int]]:
+        """
+        Return the legal book moves of the player to move, with their statistics.
+
+        :param Game game: current game state
+        :return list[tuple[Move, int, int, int]]: list of (<move>, <games>, <wins>, <losses>)
+        """
+        columns = self._columns
+        keys = columns["keys"]
+        key = np.uint64(game.hash)
+        lo = int(np.searchsorted(keys, key, side="left"))
+        hi = int(np.searchsorted(keys, key, side="right"))
+
+        entries = []
+        legal = game.board.legal_moves(game.player)
+        for i in range(lo, hi):
+            move = Move.unpack(int(columns["moves"][i]))
+            if move.source in legal and move in legal[move.source]:
+                stats = (int(columns[name][i]) for name in ("games", "wins", "losses"))
+                entries.append((move, *stats))
+
+        return entries
+
+    def choose(self, game, min_games: int = 1) -> Move | None:
+        """
+        Return the book move with the best score (wins + half draws, per game), if any.
+        Moves are ranked by the lower bound of their score (see 'lower_bound').
+
+        :param Game game: current game state
+        :param int min_games: minimum number of games played with the move, defaults to 1
+        :return Move | None: book move or None
+        """
+        best_move, best = None, None
+        for move, games, wins, losses in self.probe(game):
+            if games < min_games:
+                continue
+            score = (2 * wins + games - wins - losses) / (2 * games)
+            score = (lower_bound(score, games), games)
+            if best is None or score > best:
+                best_move, best = move, score
+
+        return best_move
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build an opening book by self-play.")
+    parser.add_argument("--games", type=int, default=100, help="games (default: 100)")
+    parser.add_argument("--depth", type=int, default=4, help="depth (default: 4)")
+    parser.add_argument(
+        "--plies", type=int, default=10, help="book plies (default: 10)"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    parser.add_argument("--output", type=Path, default=BOOK, help=f"(default: {BOOK})")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    builder = BookBuilder()
+    builder.play(args.games, args.depth, args.plies, seed=args.seed)
+    builder.write(args.output)
+    elapsed = time.perf_counter() - start
+
+    print(f"records={len(builder)} games={args.games} time={elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+from threading import Event
+
+# Seconds between two cancellation checks while waiting for worker processes
+POLL_INTERVAL = 0.01
+
+
+class CancellationToken:
+    """
+    CancellationToken class.
+
+    Cooperative cancellation of searches (see 'AlphaBetaPruning.run'): once the token is
+    cancelled, the searches it was passed to stop at their next check, and return the best
+    move found so far. Searches only read the token: one token can bound several searches.
+    The token is backed by a threading event by default. A multiprocessing event (e.g. passed
+    to the initializer of a pool) cancels searches running in other processes.
+    """
+
+    def __init__(self, event=None) -> None:
+        """
+        Initialize a token (not cancelled).
+
+        :param Event | None event: event set on cancellation, defaults to None (threading.Event)
+        """
+        self._event = Event() if event is None else event
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Return True if the token was cancelled.
+
+        :return bool: True if cancelled
+        """
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """
+        Cancel the searches using the token (e.g. from another thread or process).
+        """
+        self._event.set()
+
+    def reset(self) -> None:
+        """
+        Make the token usable for new searches.
+        """
+        self._event.clear()
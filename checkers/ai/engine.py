@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from enum import Enum, unique
+
+from checkers.ai.ab_pruning import AlphaBetaPruning
+from checkers.ai.evaluation import Evaluation
+from checkers.ai.mcts import MonteCarloTreeSearch
+from checkers.ai.negamax import Negamax
+from checkers.ai.parallel import ParallelSearch
+from checkers.ai.tablebase import Tablebase
+from checkers.ai.transposition import TranspositionTable
+
+
+@unique
+class Engine(Enum):
+    MINIMAX = "minimax"
+    NEGAMAX = "negamax"
+    PARALLEL = "parallel"
+    MCTS = "mcts"
+
+
+# Search class of each engine
+ENGINES = {
+    Engine.MINIMAX: AlphaBetaPruning,
+    Engine.NEGAMAX: Negamax,
+    Engine.PARALLEL: ParallelSearch,
+    Engine.MCTS: MonteCarloTreeSearch,
+}
+
+
+@dataclass
+class SearchOptions:
+    """
+    SearchOptions dataclass.
+
+    Settings of the AI search (see 'Game.get_ai_move'):
+        - <depth>: maximum depth (ignored by Engine.MCTS)
+        - <time_budget>: time budget in milliseconds
+        - <node_budget>: maximum number of nodes visited (playouts for Engine.MCTS)
+        - <engine>: search engine
+        - <workers>: number of processes (Engine.PARALLEL and Engine.MCTS only), None for the
+          number of CPUs (Engine.PARALLEL) or 1 (Engine.MCTS)
+        - <evaluation>: evaluation function, None for 'Material'
+        - <tablebase>: endgame tablebases, None to disable them
+        - <table>: transposition table kept across moves (not Engine.MCTS), None for a new table
+          per search
+    """
+
+    depth: int | None = None
+    time_budget: float | None = None
+    node_budget: int | None = None
+    engine: Engine = Engine.MINIMAX
+    workers: int | None = None
+    evaluation: Evaluation | None = None
+    tablebase: Tablebase | None = None
+    table: TranspositionTable | None = None
+
+    def build(self) -> AlphaBetaPruning | MonteCarloTreeSearch:
+        """
+        Return a new engine searching with these settings.
+        Engines with worker processes ('ParallelSearch', 'MonteCarloTreeSearch') are closed by
+        the caller.
+
+        :return AlphaBetaPruning | MonteCarloTreeSearch: search engine
+        """
+        if self.engine is Engine.MCTS:
+            return MonteCarloTreeSearch(workers=self.workers or 1)
+
+        table = TranspositionTable() if self.table is None else self.table
+        if self.engine is Engine.PARALLEL:
+            return ParallelSearch(
+                table=table,
+                evaluation=self.evaluation,
+                workers=self.workers,
+                tablebase=self.tablebase,
+            )
+        return ENGINES[self.engine](
+            table=table, evaluation=self.evaluation, tablebase=self.tablebase
+        )
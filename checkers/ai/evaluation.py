@@ -0,0 +1,164 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from checkers.logic.bitboard import OPPONENT
+from checkers.logic.piece import Piece, Player, Rank
+from checkers.logic.tables import CELLS
+
+# Weights (in hundredths of a pawn)
+PAWN = 100
+KING = 200
+BACK_RANK = 10  # per pawn left on its own back rank (guards against crowning)
+MOBILITY = 3  # per piece that can make a regular move
+
+# Piece-square tables, from WHITE's point of view (WHITE starts on rows 0-2)
+_ADVANCEMENT = np.array([0, 0, 3, 6, 9, 12, 16, 0])[:, None]
+_CENTRE = np.array([0, 2, 4, 6, 6, 4, 2, 0])
+_DARK = np.add.outer(np.arange(8), np.arange(8)) % 2 == 1
+
+PAWN_TABLE = {Player.WHITE: np.where(_DARK, PAWN + _ADVANCEMENT + _CENTRE // 2, 0)}
+PAWN_TABLE[Player.WHITE][0, _DARK[0]] += BACK_RANK
+KING_TABLE = {Player.WHITE: np.where(_DARK, KING + np.add.outer(_CENTRE, _CENTRE), 0)}
+
+# BLACK tables: board rotated by 180 degrees (dark squares stay dark)
+PAWN_TABLE[Player.BLACK] = np.rot90(PAWN_TABLE[Player.WHITE], 2)
+KING_TABLE[Player.BLACK] = np.rot90(KING_TABLE[Player.WHITE], 2)
+
+# Piece hash (see 'Piece.__hash__', hash() maps -1 to -2) -> (player, piece-square table, directions)
+_PIECES = {
+    piece.__hash__(): (
+        piece.player,
+        (PAWN_TABLE if piece.rank is Rank.PAWN else KING_TABLE)[piece.player],
+        piece.directions,
+    )
+    for piece in (Piece(player, rank) for player in Player for rank in Rank)
+}
+
+# Piece-square tables indexed by bitboard byte, for single boards:
+# (player, rank) -> byte (0-3) -> total value of the squares set in the byte (0-255)
+_BYTE_TABLES = {
+    (player, rank): tuple(
+        tuple(
+            sum(
+                int(table[player][CELLS[8 * byte + bit]])
+                for bit in range(8)
+                if bits >> bit & 1
+            )
+            for bits in range(256)
+        )
+        for byte in range(4)
+    )
+    for player in Player
+    for rank, table in ((Rank.PAWN, PAWN_TABLE), (Rank.KING, KING_TABLE))
+}
+
+
+class Evaluation(ABC):
+    """
+    Evaluation class.
+
+    Scores a board from the point of view of a player (positive if the player is ahead).
+    Contains a <pawn> attribute: the score of a pawn, used to scale search windows.
+    """
+
+    pawn = 1
+
+    @abstractmethod
+    def __call__(self, board, player: Player) -> int:
+        """
+        Evaluate a board for a given player.
+
+        :param Board board: board
+        :param Player player: player
+        :return int: evaluation score
+        """
+
+
+class Material(Evaluation):
+    """
+    Material class.
+
+    Material balance: pawns are worth 1, kings 2 (see <Rank>).
+    """
+
+    pawn = Rank.PAWN.value
+
+    def __call__(self, board, player: Player) -> int:
+        """
+        Evaluate a board for a given player.
+
+        :param Board board: board
+        :param Player player: player
+        :return int: evaluation score
+        """
+        return board.material(player) - board.material(OPPONENT[player])
+
+
+class Positional(Evaluation):
+    """
+    Positional class.
+
+    Material and position:
+        - piece-square tables: pawns are worth more as they advance and near the centre,
+          kings near the centre, and pawns on their back rank get a bonus
+        - mobility: bonus per piece able to make a regular move
+    Boards can be scored one at a time (from the bitboard) or in batches (as 8x8 arrays).
+    """
+
+    pawn = PAWN
+
+    def __call__(self, board, player: Player) -> int:
+        """
+        Evaluate a board for a given player.
+
+        :param Board board: board
+        :param Player player: player
+        :return int: evaluation score
+        """
+        bitboard = board.bitboard
+        score = 0
+        for key, mask in bitboard.masks.items():
+            if mask:
+                a, b, c, d = _BYTE_TABLES[key]
+                value = (
+                    a[mask & 255]
+                    + b[mask >> 8 & 255]
+                    + c[mask >> 16 & 255]
+                    + d[mask >> 24]
+                )
+                score += value if key[0] is player else -value
+
+        mobility = (
+            bitboard.movers(player).bit_count()
+            - bitboard.movers(OPPONENT[player]).bit_count()
+        )
+        return score + MOBILITY * mobility
+
+    def batch(self, boards: np.ndarray, player: Player) -> np.ndarray:
+        """
+        Evaluate a stack of boards for a given player.
+
+        :param np.ndarray boards: boards of shape (N, 8, 8) (see 'Board.array')
+        :param Player player: player
+        :return np.ndarray: evaluation scores of shape (N,)
+        """
+        boards = np.asarray(boards, dtype=np.int8).reshape(-1, 8, 8)
+        n = len(boards)
+
+        # Off-board squares are not empty
+        empty = np.pad(boards == 0, ((0, 0), (1, 1), (1, 1)))
+
+        scores = np.zeros(n, dtype=np.int64)
+        for code, (owner, table, directions) in _PIECES.items():
+            pieces = boards == code
+            value = pieces.reshape(n, 64).astype(np.int64) @ table.reshape(64)
+
+            movable = np.zeros_like(pieces)
+            for a, b in directions:
+                movable |= empty[:, 1 + a : 9 + a, 1 + b : 9 + b]
+            value += MOBILITY * (pieces & movable).sum(axis=(1, 2))
+
+            scores += value if owner is player else -value
+
+        return scores
@@ -0,0 +1,508 @@
+import copy
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import Event
+from time import perf_counter
+
+from checkers.ai.cancel import POLL_INTERVAL, CancellationToken
+from checkers.ai.stats import Callback, IterationStats, SearchResult, SearchStats
+from checkers.logic.bitboard import BACK_RANK, KEYS, OPPONENT, Bitboard, squares
+from checkers.logic.moves import Move
+from checkers.logic.piece import Player
+from checkers.logic.tables import KING_STEPS, PAWN_STEPS
+
+# Playouts of a fixed-size search (see 'MonteCarloTreeSearch.search')
+PLAYOUTS = 1000
+
+# UCT exploration constant
+EXPLORATION = math.sqrt(2)
+
+# Playouts longer than this are decided by material
+MAX_PLAYOUT_PLIES = 150
+
+# Worker process state (see '_init_worker')
+_engine: "MonteCarloTreeSearch | None" = None
+
+
+def playout(
+    bitboard: Bitboard, player: Player, rng: random.Random, max_plies: int
+) -> Player | None:
+    """
+    Play random moves on a bitboard (modified in place) until the game is over.
+    As in 'Game.is_game_over', the game ends when either player has no moves, lost by the player to
+    move. Regular moves pick a random piece, then a random target (no move list is built).
+
+    :param Bitboard bitboard: bitboard
+    :param Player player: player to move
+    :param random.Random rng: random number generator
+    :param int max_plies: maximum number of plies, then the player with more material wins
+    :return Player | None: winner, or None for a draw
+    """
+    masks = bitboard.masks
+    for _ in range(max_plies):
+        opponent = OPPONENT[player]
+        jumpers = bitboard.jumpers(player)
+        movers = 0 if jumpers else bitboard.movers(player)
+        if not (jumpers or movers):
+            return opponent
+        if not (bitboard.movers(opponent) or bitboard.jumpers(opponent)):
+            return opponent
+
+        if jumpers:
+            move = rng.choice(list(bitboard.generate(player)))
+            bitboard.make_move(move, player)
+        else:
+            pawn, king = KEYS[player]
+            source = rng.choice(list(squares(movers)))
+            bit = 1 << source
+            empty = bitboard.empty
+            if masks[king] & bit:
+                target = rng.choice([t for t in KING_STEPS[source] if empty >> t & 1])
+                masks[king] ^= bit | 1 << target
+            else:
+                steps = PAWN_STEPS[player][source]
+                target = rng.choice([t for t in steps if empty >> t & 1])
+                masks[pawn] &= ~bit
+                masks[king if BACK_RANK[player] >> target & 1 else pawn] |= 1 << target
+
+        player = opponent
+
+    material = {
+        p: masks[pawn].bit_count() + 2 * masks[king].bit_count()
+        for p, (pawn, king) in KEYS.items()
+    }
+    if material[Player.BLACK] == material[Player.WHITE]:
+        return None
+    return max(material, key=material.get)  # type: ignore
+
+
+def _is_game_over(game) -> bool:
+    """
+    Return True if either player ran out of moves (see 'Game.is_game_over').
+
+    :param Game game: current game state
+    :return bool: True if game is over, False otherwise
+    """
+    return not all(game.board.has_moves(player) for player in Player)
+
+
+class Node:
+    """
+    Node class.
+
+    Node of the search tree: position reached by <move>, with the results of its playouts
+    (for the player who made <move>).
+    """
+
+    __slots__ = (
+        "move",
+        "parent",
+        "player",
+        "key",
+        "children",
+        "untried",
+        "visits",
+        "wins",
+    )
+
+    def __init__(
+        self, move: Move | None, parent: "Node | None", player: Player, game
+    ) -> None:
+        """
+        Initialize a node.
+
+        :param Move | None move: move leading to the node (None for the root)
+        :param Node | None parent: parent node
+        :param Player player: player who made <move>
+        :param Game game: game state of the node
+        """
+        self.move = move
+        self.parent = parent
+        self.player = player
+        self.key = game.hash
+        self.children: list[Node] = []
+        self.untried: list[Move] = (
+            [] if _is_game_over(game) else list(game.board.generate_moves(game.player))
+        )
+        self.visits = 0
+        self.wins = 0.0
+
+    def select(self, exploration: float) -> "Node":
+        """
+        Return the child with the best upper confidence bound (UCT).
+
+        :param float exploration: exploration constant
+        :return Node: child
+        """
+        log = math.log(self.visits)
+        return max(
+            self.children,
+            key=lambda child: child.wins / child.visits
+            + exploration * math.sqrt(log / child.visits),
+        )
+
+
+def _init_worker(exploration: float, max_plies: int, cancel) -> None:
+    """
+    Initialize a worker process.
+
+    :param float exploration: exploration constant
+    :param int max_plies: maximum number of plies of a playout
+    :param Event cancel: event set to cancel the searches of the workers
+    """
+    global _engine
+    _engine = MonteCarloTreeSearch(exploration=exploration, max_plies=max_plies)
+    _engine._token = CancellationToken(cancel)
+
+
+def _search_tree(
+    game, playouts: int | None, time_budget: float | None, seed: int
+) -> tuple[dict[int, tuple[int, float]], bool]:
+    """
+    Grow the tree of the worker process, and return the statistics of the root moves.
+
+    :param Game game: root game state
+    :param int | None playouts: number of playouts
+    :param float | None time_budget: time budget in seconds
+    :param int seed: random seed
+    :return tuple[dict[int, tuple[int, float]], bool]: {<packed move>: (<visits>, <wins>)},
+        and whether all the playouts were played
+    """
+    engine = _engine
+    engine.rng.seed(seed)  # type: ignore
+    root, completed = engine._grow(game, playouts, time_budget)  # type: ignore
+    results = {child.move.pack(): (child.visits, child.wins) for child in root.children}
+    return results, completed
+
+
+class MonteCarloTreeSearch:
+    """
+    MonteCarloTreeSearch class.
+
+    Anytime search growing a tree of random playouts, guided by upper confidence bounds (UCT):
+        - select: descend the tree, balancing win rate and exploration of the moves
+        - expand: add a node for one untried move
+        - simulate: play random moves until the game is over (see 'playout')
+        - backpropagate: update the results of the nodes on the path
+    The move played most often is chosen. The tree is reused by the next search if the game went
+    on from it (e.g. after the opponent's reply).
+    With several workers, each process grows its own tree and the root results are summed (root
+    parallelisation): close the pool when done.
+    """
+
+    def __init__(
+        self,
+        playouts: int = PLAYOUTS,
+        exploration: float = EXPLORATION,
+        workers: int | None = 1,
+        max_plies: int = MAX_PLAYOUT_PLIES,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Initialize the search.
+
+        :param int playouts: playouts of a fixed-size search, defaults to PLAYOUTS
+        :param float exploration: UCT exploration constant, defaults to EXPLORATION
+        :param int | None workers: number of processes (including this one), defaults to 1
+            (None for the number of CPUs)
+        :param int max_plies: maximum number of plies of a playout, defaults to MAX_PLAYOUT_PLIES
+        :param int | None seed: random seed, defaults to None
+        :ivar nodes: number of playouts of the current search (all processes)
+        :ivar stats: statistics of the last search (see 'SearchStats')
+        """
+        self.playouts = playouts
+        self.exploration = exploration
+        self.workers = workers or os.cpu_count() or 1
+        self.max_plies = max_plies
+        self.rng = random.Random(seed)
+        self.root: Node | None = None
+        self.nodes = 0
+        self.stats = SearchStats()
+        self._token: CancellationToken | None = None
+        self._cancel = Event()
+        self._pool: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> "MonteCarloTreeSearch":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shut down the worker processes.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        """
+        Return the pool of worker processes (started on first use).
+
+        :return ProcessPoolExecutor: pool
+        """
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers - 1,
+                initializer=_init_worker,
+                initargs=(self.exploration, self.max_plies, self._cancel),
+            )
+        return self._pool
+
+    def search(
+        self, game, depth: int, max_player: Player, previous: float | None = None
+    ) -> tuple[Move | None, float]:
+        """
+        Search the game with <playouts> playouts.
+        <depth> and <previous> are only there for compatibility with the other engines.
+
+        :param Game game: current game state (player to move is the maximizing player)
+        :param int depth: unused
+        :param Player max_player: maximizing player
+        :param float | None previous: unused, defaults to None
+        :return tuple[Move | None, float]: most played move and its win rate for <max_player>
+        """
+        move, score, _ = self.iterative_deepening(
+            game, max_player, node_budget=self.playouts
+        )
+        return move, score
+
+    def iterative_deepening(
+        self,
+        game,
+        max_player: Player,
+        time_budget: float | None = None,
+        node_budget: int | None = None,
+        max_depth: int | None = None,
+        callback: Callback | None = None,
+    ) -> tuple[Move | None, float, int]:
+        """
+        Search the game until a budget runs out (see 'run').
+
+        :param Game game: current game state (player to move is the maximizing player)
+        :param Player max_player: maximizing player
+        :param float | None time_budget: time budget in milliseconds, defaults to None
+        :param int | None node_budget: maximum number of playouts, defaults to None
+        :param int | None max_depth: unused, defaults to None
+        :param Callback | None callback: called once the search is done, defaults to None
+        :return tuple[Move | None, float, int]: most played move, its win rate for <max_player>,
+            and depth of the most played line
+        """
+        deadline = None
+        if time_budget is not None:
+            deadline = perf_counter() + time_budget / 1000
+
+        result = self.run(
+            game,
+            max_player,
+            node_limit=node_budget,
+            deadline=deadline,
+            callback=callback,
+        )
+        return result.move, result.score, result.depth
+
+    def run(
+        self,
+        game,
+        max_player: Player,
+        token: CancellationToken | None = None,
+        node_limit: int | None = None,
+        deadline: float | None = None,
+        max_depth: int | None = None,
+        callback: Callback | None = None,
+    ) -> SearchResult:
+        """
+        Anytime search: grow the tree until <node_limit> playouts are played, <token> is
+        cancelled or the <deadline> passes (same interface as the alpha-beta engines).
+        Without limit, <playouts> playouts are played. The search completes once all its
+        playouts are played: a search bounded by a deadline only never completes.
+        The statistics of the search (one iteration) are kept in <stats>, and sent to <callback>.
+
+        :param Game game: current game state (player to move is the maximizing player)
+        :param Player max_player: maximizing player
+        :param CancellationToken | None token: cancellation token, defaults to None
+        :param int | None node_limit: maximum number of playouts, defaults to None
+        :param float | None deadline: time at which the search stops (see 'perf_counter'),
+            defaults to None
+        :param int | None max_depth: unused, defaults to None
+        :param Callback | None callback: called once the search is done, defaults to None
+        :return SearchResult: most played move, its win rate for <max_player>, depth of the
+            most played line, and whether the search completed
+        """
+        start = perf_counter()
+        self.stats = stats = SearchStats()
+        if node_limit is None and deadline is None:
+            node_limit = self.playouts
+        seconds = None if deadline is None else max(0.0, deadline - start)
+
+        # Root parallelisation: the workers grow their own trees meanwhile
+        # (on a copy: the game is sent to them while this process searches it in place)
+        futures = []
+        if self.workers > 1:
+            share = None if node_limit is None else node_limit // self.workers
+            root_game = copy.deepcopy(game)
+            self._cancel.clear()
+            futures = [
+                self.pool.submit(
+                    _search_tree, root_game, share, seconds, self.rng.getrandbits(32)
+                )
+                for _ in range(self.workers - 1)
+            ]
+            if node_limit is not None:
+                node_limit -= share * len(futures)  # type: ignore
+
+        self._token = token
+        try:
+            root, completed = self._grow(game, node_limit, seconds)
+
+            # Forward a cancellation of this search to the workers
+            pending = set(futures)
+            while pending:
+                _, pending = wait(pending, timeout=POLL_INTERVAL)
+                if pending and self._cancelled():
+                    self._cancel.set()
+        finally:
+            self._token = None
+
+        results = {
+            child.move.pack(): [child.visits, child.wins]  # type: ignore
+            for child in root.children
+        }
+        for future in futures:
+            counts, done = future.result()
+            completed = completed and done
+            for packed, (visits, wins) in counts.items():
+                entry = results.setdefault(packed, [0, 0.0])
+                entry[0] += visits
+                entry[1] += wins
+
+        self.nodes = sum(visits for visits, _ in results.values())
+        move, score, depth = None, 0.0, 0
+        if results:
+            packed, (visits, wins) = max(results.items(), key=lambda item: item[1][0])
+            move = Move.unpack(packed)
+            score = wins / visits if game.player is max_player else 1 - wins / visits
+
+            # Depth of the most played line (in this process)
+            node = root
+            while node.children:
+                node = max(node.children, key=lambda child: child.visits)
+                depth += 1
+
+        stats.nodes = stats.evaluations = self.nodes
+        stats.depth = depth
+        stats.elapsed = (perf_counter() - start) * 1000
+        stats.iterations.append(
+            IterationStats(depth, move, score, stats.nodes, stats.elapsed)
+        )
+        if callback is not None:
+            callback(stats)
+
+        return SearchResult(move, score, depth, completed, stats)
+
+    def _cancelled(self) -> bool:
+        """
+        Return True if the token of the running search was cancelled.
+
+        :return bool: True if cancelled
+        """
+        return self._token is not None and self._token.cancelled
+
+    def _find(self, key: int) -> Node | None:
+        """
+        Return the node of a position in the previous tree (up to 2 plies from its root).
+
+        :param int key: position hash
+        :return Node | None: node, if found
+        """
+        nodes = [self.root] if self.root is not None else []
+        for _ in range(3):
+            for node in nodes:
+                if node.key == key:
+                    return node
+            nodes = [child for node in nodes for child in node.children]
+        return None
+
+    def _grow(
+        self, game, playouts: int | None, time_budget: float | None = None
+    ) -> tuple[Node, bool]:
+        """
+        Grow the tree of the game state until a budget runs out (at least one playout).
+
+        :param Game game: current game state
+        :param int | None playouts: number of playouts
+        :param float | None time_budget: time budget in seconds
+        :return tuple[Node, bool]: root node, and whether all the playouts were played
+        """
+        deadline = None if time_budget is None else perf_counter() + time_budget
+
+        root = self._find(game.hash)
+        if root is None:
+            root = Node(None, None, OPPONENT[game.player], game)
+        root.parent = None
+        self.root = root
+
+        count = 0
+        while True:
+            self._iterate(game, root)
+            count += 1
+
+            if playouts is not None and count >= playouts:
+                return root, True
+            if self._cancelled():
+                return root, False
+            if deadline is not None and perf_counter() >= deadline:
+                return root, False
+
+    def _iterate(self, game, root: Node) -> None:
+        """
+        Run one iteration (select, expand, simulate, backpropagate) from the root.
+        The game is searched in place, and restored.
+
+        :param Game game: current game state
+        :param Node root: root node
+        """
+        node = root
+        records = []
+        try:
+            # Select
+            while not node.untried and node.children:
+                node = node.select(self.exploration)
+                records.append(game.make_move(node.move))
+
+            # Expand
+            if node.untried:
+                move = node.untried.pop(self.rng.randrange(len(node.untried)))
+                player = game.player
+                records.append(game.make_move(move))
+                child = Node(move, node, player, game)
+                node.children.append(child)
+                node = child
+
+            if len(records) > self.stats.max_ply:
+                self.stats.max_ply = len(records)
+
+            # Simulate
+            if not node.untried and not node.children:
+                winner = OPPONENT[game.player]
+            else:
+                bitboard = Bitboard()
+                bitboard.masks = dict(game.board.bitboard.masks)
+                winner = playout(bitboard, game.player, self.rng, self.max_plies)
+
+        finally:
+            for record in reversed(records):
+                game.unmake_move(record)
+
+        # Backpropagate
+        while node is not None:
+            node.visits += 1
+            if winner is node.player:
+                node.wins += 1
+            elif winner is None:
+                node.wins += 0.5
+            node = node.parent  # type: ignore
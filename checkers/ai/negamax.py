@@ -0,0 +1,171 @@
+from math import inf
+
+from checkers.ai.ab_pruning import AlphaBetaPruning
+from checkers.ai.evaluation import Evaluation
+from checkers.ai.tablebase import Tablebase
+from checkers.ai.transposition import Bound, TranspositionTable
+from checkers.logic.moves import Move
+from checkers.logic.piece import Player
+
+# Half-width of the aspiration window, in pawns
+ASPIRATION = 1
+
+
+class Negamax(AlphaBetaPruning):
+    """
+    Negamax class.
+
+    Alpha-beta search written as negamax (scores from the point of view of the player to move),
+    with principal variation search:
+        - the first (best ordered) move is searched with the full window
+        - the other moves are searched with a null window, and only re-searched if they beat it
+    With iterative deepening, each iteration starts with an aspiration window around the score of
+    the previous one, falling back to a full window when the score lands outside of it.
+    """
+
+    def __init__(
+        self,
+        table: TranspositionTable | None = None,
+        quiesce: bool = True,
+        evaluation: Evaluation | None = None,
+        aspiration: bool = True,
+        tablebase: Tablebase | None = None,
+    ) -> None:
+        """
+        Initialize the search.
+
+        :param TranspositionTable | None table: transposition table, defaults to None (disabled)
+        :param bool quiesce: resolve pending captures at the horizon, defaults to True
+        :param Evaluation | None evaluation: evaluation function, defaults to None ('Material')
+        :param bool aspiration: use aspiration windows, defaults to True
+        :param Tablebase | None tablebase: endgame tablebases, defaults to None (disabled)
+        """
+        super().__init__(
+            table=table, quiesce=quiesce, evaluation=evaluation, tablebase=tablebase
+        )
+        self.aspiration = aspiration
+
+    def negamax(
+        self,
+        game,
+        depth: int,
+        alpha: float = -inf,
+        beta: float = inf,
+        ply: int = 0,
+    ) -> tuple[Move | None, float]:
+        """
+        Perform the principal variation search to find the best move for the player to move.
+
+        :param Game game: current game state
+        :param int depth: depth of the search tree
+        :param float alpha: lower bound of the search window
+        :param float beta: upper bound of the search window
+        :param int ply: distance from the root of the search, defaults to 0
+        :return tuple[Move | None, float]: best move found by the search and its evaluation score
+        """
+        if ply > self.stats.max_ply:
+            self.stats.max_ply = ply
+
+        if self.tablebase is not None and ply:
+            score = self._probe(game)
+            if score is not None:
+                self.nodes += 1
+                return None, score
+
+        if depth == 0 and self.quiesce:
+            return None, self.quiescence(game, alpha, beta)
+
+        self.nodes += 1
+        if (
+            self._deadline is not None
+            or self._node_limit is not None
+            or self._token is not None
+        ):
+            self._check_budget()
+
+        if depth == 0 or self._is_game_over(game):
+            return None, self.evaluate(game, game.player)
+
+        key = game.hash
+        hash_move = None
+        window = alpha
+        if self.table is not None:
+            entry = self.table.probe(key)
+            if entry is not None:
+                stored_depth, score, bound, hash_move = entry
+                if stored_depth >= depth:
+                    if bound is Bound.EXACT:
+                        return hash_move, score
+                    elif bound is Bound.LOWER:
+                        alpha = max(alpha, score)
+                    else:
+                        beta = min(beta, score)
+
+                    if alpha >= beta:
+                        return hash_move, score
+
+        best_move = None
+        best_score = -inf
+
+        for i, move in enumerate(self.ordering.moves(game, hash_move, ply)):
+            record = game.make_move(move)
+            try:
+                if i == 0:
+                    score = -self.negamax(game, depth - 1, -beta, -alpha, ply + 1)[1]
+                else:
+                    # Null window: only prove the move is no better than the best so far
+                    score = -self.negamax(game, depth - 1, -alpha - 1, -alpha, ply + 1)[
+                        1
+                    ]
+                    if alpha < score < beta:
+                        score = -self.negamax(game, depth - 1, -beta, -alpha, ply + 1)[
+                            1
+                        ]
+            finally:
+                game.unmake_move(record)
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                self.ordering.update(move, depth, ply)
+                self.stats.cutoff(i)
+                break
+
+        if self.table is not None:
+            if best_score <= window:
+                bound = Bound.UPPER
+            elif best_score >= beta:
+                bound = Bound.LOWER
+            else:
+                bound = Bound.EXACT
+            self.table.store(key, depth, best_score, bound, best_move)
+
+        return best_move, best_score
+
+    def search(
+        self, game, depth: int, max_player: Player, previous: float | None = None
+    ) -> tuple[Move | None, float]:
+        """
+        Search the game at a fixed depth from the root.
+        The score is returned from the point of view of <max_player>.
+
+        :param Game game: current game state (player to move is the maximizing player)
+        :param int depth: depth of the search tree
+        :param Player max_player: maximizing player
+        :param float | None previous: score of the previous iteration (aspiration window center)
+        :return tuple[Move | None, float]: best move found by the search and its evaluation score
+        """
+        sign = 1 if game.player is max_player else -1
+
+        if self.aspiration and previous is not None:
+            width = ASPIRATION * self.evaluation.pawn
+            alpha, beta = sign * previous - width, sign * previous + width
+            move, score = self.negamax(game, depth, alpha, beta)
+            if alpha < score < beta:
+                return move, sign * score
+
+        move, score = self.negamax(game, depth)
+        return move, sign * score
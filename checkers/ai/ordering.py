@@ -0,0 +1,101 @@
+from collections.abc import Iterator
+
+from checkers.logic.moves import Move
+
+# Killer moves kept per ply
+KILLERS = 2
+
+
+class MoveOrdering:
+    """
+    MoveOrdering class.
+
+    Orders the moves searched by alpha-beta pruning, best candidates first:
+        - hash move: best move stored in the transposition table (tried before generating moves)
+        - captures: longest capture paths first
+        - killer moves: regular moves that caused a cutoff at the same ply
+        - history: remaining regular moves, by how often (and how deep) they caused a cutoff
+    Killers and history persist across the iterations of a search (see <clear>).
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize empty killer and history tables.
+
+        :ivar killers: killer moves per ply (most recent first)
+        :ivar history: history score per (<source>, <target>) square pair (flattened)
+        """
+        self.killers: list[list[Move]] = []
+        self.history = [0] * 32 * 32
+
+    def clear(self) -> None:
+        """
+        Reset the killer and history tables.
+        """
+        self.killers.clear()
+        self.history = [0] * 32 * 32
+
+    def moves(
+        self, game, hash_move: Move | None = None, ply: int = 0
+    ) -> Iterator[Move]:
+        """
+        Yield the legal moves of the player to move, best candidates first.
+
+        :param Game game: current game state
+        :param Move | None hash_move: best move stored in the transposition table, defaults to None
+        :param int ply: distance from the root of the search, defaults to 0
+        :yield Move: move
+        """
+        board = game.board
+        if hash_move is not None and board.is_legal(hash_move, game.player):
+            yield hash_move
+        else:
+            hash_move = None
+
+        moves = [
+            move for move in board.generate_moves(game.player) if move != hash_move
+        ]
+        if not moves:
+            return
+
+        # Captures are compulsory: either all moves are captures, or none
+        if moves[0].captures:
+            moves.sort(key=lambda move: move.captures.bit_count(), reverse=True)
+            yield from moves
+            return
+
+        killers = self.killers[ply] if ply < len(self.killers) else []
+        for killer in killers:
+            if killer in moves:
+                moves.remove(killer)
+                yield killer
+
+        history = self.history
+        moves.sort(
+            key=lambda move: history[move.squares[0] << 5 | move.squares[-1]],
+            reverse=True,
+        )
+        yield from moves
+
+    def update(self, move: Move, depth: int, ply: int) -> None:
+        """
+        Record a move that caused a cutoff.
+        Captures are ignored: they are already ordered first.
+
+        :param Move move: move
+        :param int depth: remaining depth at which the cutoff occurred
+        :param int ply: distance from the root of the search
+        """
+        if move.captures:
+            return
+
+        while len(self.killers) <= ply:
+            self.killers.append([])
+
+        killers = self.killers[ply]
+        if move in killers:
+            killers.remove(move)
+        killers.insert(0, move)
+        del killers[KILLERS:]
+
+        self.history[move.squares[0] << 5 | move.squares[-1]] += depth * depth
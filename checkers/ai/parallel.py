@@ -0,0 +1,310 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+from math import inf
+from multiprocessing import Event, Value
+from time import perf_counter
+
+from checkers.ai.ab_pruning import CLOCK_INTERVAL
+from checkers.ai.cancel import POLL_INTERVAL, CancellationToken
+from checkers.ai.evaluation import Evaluation
+from checkers.ai.negamax import Negamax
+from checkers.ai.tablebase import Tablebase
+from checkers.ai.transposition import Bound, TranspositionTable
+from checkers.exceptions.search import SearchAborted
+from checkers.logic.moves import Move
+from checkers.logic.piece import Player
+
+# Below this depth, the search runs in the calling process
+MIN_PARALLEL_DEPTH = 4
+
+# Worker process state (see '_init_worker')
+_alpha = None
+_engine: "_WorkerSearch | None" = None
+
+
+class _WorkerSearch(Negamax):
+    """
+    _WorkerSearch class.
+
+    Negamax search of a worker process, whose node budget is shared by the whole parallel search:
+    the nodes visited are added to a counter shared by all processes every CLOCK_INTERVAL nodes.
+    """
+
+    def __init__(self, counter, **kwargs) -> None:
+        """
+        Initialize the search.
+
+        :param Synchronized counter: nodes visited by the whole search, shared by all processes
+        """
+        super().__init__(**kwargs)
+        self.counter = counter
+        self._flushed = 0
+
+    def flush(self) -> int:
+        """
+        Add the nodes visited since the last flush to the shared counter.
+
+        :return int: nodes visited by the whole search
+        """
+        with self.counter.get_lock():
+            self.counter.value += self.nodes - self._flushed
+            total = self.counter.value
+        self._flushed = self.nodes
+        return total
+
+    def _check_budget(self) -> None:
+        """
+        Abort the search if it was cancelled, or if the time budget or the node budget of the
+        whole search is exhausted.
+        """
+        if self._node_limit is not None and not self.nodes % CLOCK_INTERVAL:
+            if self.flush() > self._node_limit:
+                raise SearchAborted(f"node budget of {self._node_limit} exhausted")
+
+        if not self.nodes % CLOCK_INTERVAL:
+            if self._token is not None and self._token.cancelled:
+                raise SearchAborted("search cancelled")
+            if self._deadline is not None and perf_counter() >= self._deadline:
+                raise SearchAborted("time budget exhausted")
+
+
+def _init_worker(
+    alpha,
+    counter,
+    cancel,
+    table: TranspositionTable | None,
+    megabytes: float,
+    quiesce: bool,
+    evaluation: Evaluation,
+    tablebase: Tablebase | None,
+) -> None:
+    """
+    Initialize a worker process.
+
+    :param Synchronized alpha: best root score found so far, shared by all processes
+    :param Synchronized counter: nodes visited by the whole search, shared by all processes
+    :param Event cancel: event set to cancel the searches of the workers
+    :param TranspositionTable | None table: shared transposition table (mapped again by the
+        worker), or None for a table of its own
+    :param float megabytes: size of the worker transposition table (if not shared)
+    :param bool quiesce: resolve pending captures at the horizon
+    :param Evaluation evaluation: evaluation function
+    :param Tablebase | None tablebase: endgame tablebases (mapped again by the worker)
+    """
+    global _alpha, _engine
+    _alpha = alpha
+    _engine = _WorkerSearch(
+        counter,
+        table=TranspositionTable(megabytes) if table is None else table,
+        quiesce=quiesce,
+        evaluation=evaluation,
+        aspiration=False,
+        tablebase=tablebase,
+    )
+    _engine._token = CancellationToken(cancel)
+
+
+def _search_move(
+    game, move: Move, depth: int, time_budget: float | None, node_limit: int | None
+) -> tuple[float | None, int]:
+    """
+    Search a root move in a worker process.
+    The move only has to beat the best root score found so far (by any process).
+
+    :param Game game: root game state
+    :param Move move: root move
+    :param int depth: depth left after the root move
+    :param float | None time_budget: time budget in seconds
+    :param int | None node_limit: maximum number of nodes visited by the whole search
+    :return tuple[float | None, int]: score of the move (None if aborted) and nodes visited
+    """
+    engine = _engine
+    engine.nodes = engine._flushed = 0
+    if node_limit is not None and engine.counter.value > node_limit:
+        return None, 0
+    if time_budget is not None:
+        engine._deadline = perf_counter() + time_budget
+    engine._node_limit = node_limit
+
+    alpha = _alpha.value
+    game.make_move(move)
+    try:
+        score = -engine.negamax(game, depth, -inf, -alpha, ply=1)[1]
+    except SearchAborted:
+        return None, engine.nodes
+    finally:
+        if engine._node_limit is not None:
+            engine.flush()
+        engine._deadline = engine._node_limit = None
+
+    with _alpha.get_lock():
+        if score > _alpha.value:
+            _alpha.value = score
+
+    return score, engine.nodes
+
+
+class ParallelSearch(Negamax):
+    """
+    ParallelSearch class.
+
+    Negamax search splitting the root moves across a pool of worker processes:
+        - the first (best ordered) move is searched in the calling process, to get a bound
+        - the other moves are searched by the workers, which share the best root score for pruning
+          and the node budget
+    Shallow searches run serially (see MIN_PARALLEL_DEPTH).
+    Workers keep their own transposition table across searches, or map the table of the search
+    if it is shared (see 'TranspositionTable'): keep the engine across moves (e.g. pass it as
+    <ai> to 'Game.get_ai_move'), and close the pool when done.
+    """
+
+    def __init__(
+        self,
+        table: TranspositionTable | None = None,
+        quiesce: bool = True,
+        evaluation: Evaluation | None = None,
+        aspiration: bool = True,
+        workers: int | None = None,
+        min_depth: int = MIN_PARALLEL_DEPTH,
+        megabytes: float = 16,
+        tablebase: Tablebase | None = None,
+    ) -> None:
+        """
+        Initialize the search.
+
+        :param TranspositionTable | None table: transposition table, defaults to None (disabled)
+        :param bool quiesce: resolve pending captures at the horizon, defaults to True
+        :param Evaluation | None evaluation: evaluation function, defaults to None ('Material')
+        :param bool aspiration: use aspiration windows (serial searches only), defaults to True
+        :param int | None workers: number of worker processes, defaults to the number of CPUs
+        :param int min_depth: minimum depth searched in parallel, defaults to MIN_PARALLEL_DEPTH
+        :param float megabytes: size of the transposition table of each worker (unless <table>
+            is shared), defaults to 16 MB
+        :param Tablebase | None tablebase: endgame tablebases, defaults to None (disabled)
+        """
+        super().__init__(
+            table=table,
+            quiesce=quiesce,
+            evaluation=evaluation,
+            aspiration=aspiration,
+            tablebase=tablebase,
+        )
+        self.workers = workers or os.cpu_count() or 1
+        self.min_depth = min_depth
+        self.megabytes = megabytes
+        self._alpha = Value("d", -inf)
+        self._counter = Value("q", 0)
+        self._cancel = Event()
+        self._pool: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> "ParallelSearch":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Shut down the worker processes.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        """
+        Return the pool of worker processes (started on first use).
+
+        :return ProcessPoolExecutor: pool
+        """
+        if self._pool is None:
+            shared = (
+                self.table if self.table is not None and self.table.shared else None
+            )
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(
+                    self._alpha,
+                    self._counter,
+                    self._cancel,
+                    shared,
+                    self.megabytes,
+                    self.quiesce,
+                    self.evaluation,
+                    self.tablebase,
+                ),
+            )
+        return self._pool
+
+    def search(
+        self, game, depth: int, max_player: Player, previous: float | None = None
+    ) -> tuple[Move | None, float]:
+        """
+        Search the game at a fixed depth from the root, in parallel.
+        The score is returned from the point of view of <max_player>.
+
+        :param Game game: current game state (player to move is the maximizing player)
+        :param int depth: depth of the search tree
+        :param Player max_player: maximizing player
+        :param float | None previous: score of the previous iteration (serial searches only)
+        :return tuple[Move | None, float]: best move found by the search and its evaluation score
+        """
+        hash_move = None
+        if self.table is not None and (entry := self.table.probe(game.hash)):
+            hash_move = entry[3]
+
+        moves = list(self.ordering.moves(game, hash_move))
+        if depth < self.min_depth or self.workers < 2 or len(moves) < 2:
+            return super().search(game, depth, max_player, previous)
+
+        sign = 1 if game.player is max_player else -1
+        self.nodes += 1
+
+        # Principal variation: searched here, to give the workers a bound
+        record = game.make_move(moves[0])
+        try:
+            best_score = -self.negamax(game, depth - 1, ply=1)[1]
+        finally:
+            game.unmake_move(record)
+        best_move = moves[0]
+        self._alpha.value = best_score
+
+        # Remaining time of the workers (the node budget is counted across all processes)
+        time_budget = None
+        if self._deadline is not None:
+            time_budget = self._deadline - perf_counter()
+        self._counter.value = self.nodes
+
+        self._cancel.clear()
+        futures = {
+            self.pool.submit(
+                _search_move, game, move, depth - 1, time_budget, self._node_limit
+            ): move
+            for move in moves[1:]
+        }
+
+        # Forward a cancellation of this search to the workers
+        pending = set(futures)
+        while pending:
+            _, pending = wait(pending, timeout=POLL_INTERVAL)
+            if pending and self._cancelled():
+                self._cancel.set()
+
+        aborted = False
+        for future, move in futures.items():
+            score, nodes = future.result()
+            self.nodes += nodes
+            if score is None:
+                aborted = True
+            elif score > best_score:
+                best_score, best_move = score, move
+
+        if aborted:
+            raise SearchAborted("budget exhausted in a worker")
+
+        if self.table is not None:
+            self.table.store(game.hash, depth, best_score, Bound.EXACT, best_move)
+
+        return best_move, sign * best_score
@@ -0,0 +1,118 @@
+"""
+Pondering: search during the opponent's turn.
+
+While the opponent thinks, the engine predicts its reply, and searches the position after it in a
+background thread. If the opponent plays the predicted move (ponder hit), the result of the search
+is used right away, otherwise the transposition table is still warm from the prediction search.
+"""
+
+import copy
+from threading import Lock, Thread
+from time import perf_counter
+
+from checkers.ai.ab_pruning import AlphaBetaPruning
+from checkers.ai.cancel import CancellationToken
+from checkers.logic.moves import Move
+from checkers.logic.piece import Player
+
+# Nodes searched to predict the opponent's reply
+PREDICTION_NODES = 5000
+
+# Pondering gives up after this time (in milliseconds)
+MAX_PONDER_TIME = 600_000
+
+
+class Ponderer:
+    """
+    Ponderer class.
+
+    Owns an engine (and its transposition table) used for every move of a game.
+    The engine is searched in a background thread between 'start' and 'stop' only.
+    'stop' may be called from several threads at once (e.g. the AI search and 'Environment.quit').
+    """
+
+    def __init__(self, engine: AlphaBetaPruning) -> None:
+        """
+        Initialize the ponderer.
+
+        :param AlphaBetaPruning engine: search engine (serial, see 'ParallelSearch' workers)
+        :ivar guess: predicted reply of the opponent, if any
+        """
+        self.engine = engine
+        self.guess: Move | None = None
+        self._thread: Thread | None = None
+        self._lock = Lock()
+        self._token = CancellationToken()
+        self._key: int | None = None
+        self._result: tuple[Move | None, float, int] | None = None
+        self._elapsed = 0.0
+
+    @property
+    def pondering(self) -> bool:
+        """
+        Return True if the background search is running.
+
+        :return bool: True if running
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, game, player: Player) -> None:
+        """
+        Start pondering on the opponent's turn.
+
+        :param Game game: current game state (the opponent of <player> is to move)
+        :param Player player: player pondering
+        """
+        self.stop()
+        with self._lock:
+            self.guess, self._key, self._result = None, None, None
+            self._token.reset()
+
+            # The game is copied: the opponent's move is played on the original
+            self._thread = Thread(
+                target=self._ponder, args=(copy.deepcopy(game), player), daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, game=None) -> tuple[Move | None, float, int, float] | None:
+        """
+        Stop pondering, and return its result if <game> is the position pondered (ponder hit).
+
+        :param Game | None game: current game state, defaults to None
+        :return tuple[Move | None, float, int, float] | None: best move, its evaluation score,
+            depth completed and pondering time (ms), or None if the position wasn't pondered
+        """
+        # Concurrent calls wait until the search has stopped
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is not None:
+                self._token.cancel()
+                thread.join()
+
+        if game is None or self._result is None or game.hash != self._key:
+            return None
+        return *self._result, self._elapsed
+
+    def _ponder(self, game, player: Player) -> None:
+        """
+        Predict the opponent's reply, then search the position after it (background thread).
+
+        :param Game game: copy of the game state (the opponent of <player> is to move)
+        :param Player player: player pondering
+        """
+        engine, token = self.engine, self._token
+        guess = engine.run(
+            game, game.player, token=token, node_limit=PREDICTION_NODES
+        ).move
+        if guess is None or token.cancelled:
+            return
+
+        game.make_move(guess)
+        self.guess, self._key = guess, game.hash
+
+        start = perf_counter()
+        result = engine.run(
+            game, player, token=token, deadline=start + MAX_PONDER_TIME / 1000
+        )
+        self._elapsed = (perf_counter() - start) * 1000
+        self._result = result.move, result.score, result.depth
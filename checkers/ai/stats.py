@@ -0,0 +1,118 @@
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from checkers.logic.moves import Move
+
+
+@dataclass
+class IterationStats:
+    """
+    IterationStats dataclass.
+
+    Result of one completed iteration (depth) of a search:
+        - <depth>: depth searched
+        - <move>, <score>: best move and its evaluation score
+        - <nodes>, <elapsed>: nodes visited and time spent (ms) since the search started
+    """
+
+    depth: int
+    move: Move | None
+    score: float
+    nodes: int
+    elapsed: float
+
+
+@dataclass
+class SearchStats:
+    """
+    SearchStats dataclass.
+
+    Statistics of a search (see 'AlphaBetaPruning.stats'):
+        - <nodes>: nodes visited (playouts for 'MonteCarloTreeSearch')
+        - <evaluations>: static evaluations of leaves
+        - <cutoffs>: beta cutoffs by index of the move causing them (0: first move searched)
+        - <probes>, <hits>: transposition table probes, and probes that found the position
+        - <depth>: depth completed
+        - <max_ply>: deepest ply reached (quiescence excluded)
+        - <elapsed>: time spent, in milliseconds
+        - <iterations>: breakdown per completed iteration (depth)
+    """
+
+    nodes: int = 0
+    evaluations: int = 0
+    cutoffs: list[int] = field(default_factory=list)
+    probes: int = 0
+    hits: int = 0
+    depth: int = 0
+    max_ply: int = 0
+    elapsed: float = 0.0
+    iterations: list[IterationStats] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        hit_rate = "-" if self.hit_rate is None else f"{self.hit_rate:.0%}"
+        return (
+            f"depth={self.depth} max_ply={self.max_ply} nodes={self.nodes} "
+            f"nps={self.nps:.0f} hit_rate={hit_rate} time={self.elapsed:.0f}ms"
+        )
+
+    @property
+    def nps(self) -> float:
+        """
+        Return the number of nodes visited per second.
+
+        :return float: nodes per second
+        """
+        return self.nodes / self.elapsed * 1000 if self.elapsed else 0.0
+
+    @property
+    def hit_rate(self) -> float | None:
+        """
+        Return the transposition table hit rate.
+
+        :return float | None: hit rate, or None without table
+        """
+        return self.hits / self.probes if self.probes else None
+
+    @property
+    def first_cutoff_rate(self) -> float | None:
+        """
+        Return the share of cutoffs caused by the first move searched (move ordering quality).
+
+        :return float | None: first move cutoff rate, or None without cutoff
+        """
+        total = sum(self.cutoffs)
+        return self.cutoffs[0] / total if total else None
+
+    def cutoff(self, index: int) -> None:
+        """
+        Count a beta cutoff caused by the <index>-th move searched.
+
+        :param int index: index of the move
+        """
+        cutoffs = self.cutoffs
+        if index >= len(cutoffs):
+            cutoffs.extend([0] * (index + 1 - len(cutoffs)))
+        cutoffs[index] += 1
+
+
+# Called with the statistics after every completed iteration
+Callback = Callable[[SearchStats], None]
+
+
+@dataclass
+class SearchResult:
+    """
+    SearchResult dataclass.
+
+    Result of an anytime search (see 'AlphaBetaPruning.run'):
+        - <move>, <score>: best move found so far and its evaluation score
+        - <depth>: depth completed (depth of the most played line for 'MonteCarloTreeSearch')
+        - <completed>: False if the search was cut short (cancelled, node limit or deadline)
+        - <stats>: statistics of the search
+    """
+
+    move: Move | None
+    score: float
+    depth: int
+    completed: bool
+    stats: SearchStats
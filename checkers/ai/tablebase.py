@@ -0,0 +1,305 @@
+"""
+Endgame tablebases: exact results of every position with up to a few pieces.
+
+Positions are grouped by material signature (black pawns, black kings, white pawns, white kings).
+Each signature is solved by retrograde analysis, once the signatures it can move into
+(captures, crowning) are solved. As in 'Game.is_game_over', the game ends when either player has
+no moves, and the player to move loses. Values are scores from the point of view of the player to move:
+    - TB_WIN - <n>: win in <n> plies
+    - <n> - TB_WIN: loss in <n> plies
+    - 0: draw
+Each signature is stored as a '.npy' file (int16), indexed by piece squares and player to move,
+and memory-mapped when probed.
+Usage: python -m checkers.ai.tablebase --pieces 4 [--kings] [--output assets/tablebases]
+"""
+
+import argparse
+import time
+from array import array
+from itertools import combinations, product
+from math import comb, prod
+from pathlib import Path
+
+import numpy as np
+
+from checkers.logic.bitboard import BACK_RANK, OPPONENT, Bitboard, squares
+from checkers.logic.piece import Player, Rank
+
+TB_WIN = 10000
+
+# Default tablebases location (see 'Environment')
+TABLEBASES = Path("assets/tablebases")
+
+# Material signature: number of pieces per group
+Signature = tuple[int, int, int, int]
+GROUPS = (
+    (Player.BLACK, Rank.PAWN),
+    (Player.BLACK, Rank.KING),
+    (Player.WHITE, Rank.PAWN),
+    (Player.WHITE, Rank.KING),
+)
+
+# Colex rank of each square as the <i>-th square of a group: _RANKS[i][square] = C(square, i + 1)
+_RANKS = tuple(tuple(comb(square, i + 1) for square in range(32)) for i in range(32))
+
+
+def signatures(pieces: int, kings: bool = False) -> list[Signature]:
+    """
+    Return the signatures with up to <pieces> pieces (at least one per player), in solving order.
+    Signatures are solved after those they can move into: fewer pieces, or fewer pawns.
+
+    :param int pieces: maximum number of pieces
+    :param bool kings: kings only, defaults to False
+    :return list[Signature]: signatures
+    """
+    found = [
+        signature
+        for signature in product(range(pieces + 1), repeat=4)
+        if sum(signature) <= pieces
+        and signature[0] + signature[1] > 0
+        and signature[2] + signature[3] > 0
+        and not (kings and (signature[0] or signature[2]))
+    ]
+    return sorted(found, key=lambda s: (sum(s), s[0] + s[2], s))
+
+
+def get_signature(masks: dict) -> Signature:
+    """
+    Return the material signature of a position.
+
+    :param dict masks: bitboard masks (see 'Bitboard.masks')
+    :return Signature: signature
+    """
+    return tuple(masks[group].bit_count() for group in GROUPS)  # type: ignore
+
+
+def get_index(masks: dict, player: Player) -> int:
+    """
+    Return the index of a position in the table of its signature.
+
+    :param dict masks: bitboard masks (see 'Bitboard.masks')
+    :param Player player: player to move
+    :return int: index
+    """
+    index = 0
+    for group in GROUPS:
+        mask = masks[group]
+        rank = 0
+        for i, square in enumerate(squares(mask)):
+            rank += _RANKS[i][square]
+        index = index * comb(32, mask.bit_count()) + rank
+    return index * 2 + (player is Player.WHITE)
+
+
+def _get_size(signature: Signature) -> int:
+    """
+    Return the number of entries of the table of a signature (including impossible positions).
+
+    :param Signature signature: signature
+    :return int: table size
+    """
+    return prod(comb(32, n) for n in signature) * 2
+
+
+def _get_child(masks: dict, player: Player, move) -> dict:
+    """
+    Return the masks after a move.
+
+    :param dict masks: bitboard masks
+    :param Player player: player to move
+    :param Move move: move
+    :return dict: masks after the move
+    """
+    bitboard = Bitboard()
+    bitboard.masks = dict(masks)
+    bitboard.make_move(move, player)
+    return bitboard.masks
+
+
+def _shorten(values: np.ndarray) -> np.ndarray:
+    """
+    Convert child scores (for the opponent) to scores for the player, one ply further.
+
+    :param np.ndarray values: scores
+    :return np.ndarray: scores
+    """
+    values = values.astype(np.int32)
+    return np.where(values > 0, 1 - values, np.where(values < 0, -1 - values, 0))
+
+
+def solve(signature: Signature, solved: dict[Signature, np.ndarray]) -> np.ndarray:
+    """
+    Solve every position of a signature.
+
+    The move graph of the signature is built once (moves leaving the signature are looked up in
+    <solved>), then scores are propagated backwards from terminal positions until they are stable.
+
+    :param Signature signature: signature
+    :param dict[Signature, np.ndarray] solved: tables of the signatures it can move into
+    :return np.ndarray: table of the signature
+    """
+    size = _get_size(signature)
+    terminal = np.zeros(size, dtype=bool)
+    external = np.full(size, -TB_WIN - 1, dtype=np.int32)
+    sources, targets = array("i"), array("i")
+
+    bitboard = Bitboard()
+    groups = [combinations(range(32), n) for n in signature]
+    for placement in product(*map(list, groups)):
+        occupied = [square for group in placement for square in group]
+        if len(set(occupied)) < len(occupied):
+            continue
+
+        masks = {group: sum(1 << s for s in sq) for group, sq in zip(GROUPS, placement)}
+        # Pawns can't stand on the back rank (they would have been crowned)
+        if any(masks[(player, Rank.PAWN)] & BACK_RANK[player] for player in Player):
+            continue
+
+        bitboard.masks = masks
+        moves = {player: list(bitboard.generate(player)) for player in Player}
+        for player in Player:
+            index = get_index(masks, player)
+            if not all(moves.values()):
+                terminal[index] = True
+                continue
+
+            opponent = OPPONENT[player]
+            for move in moves[player]:
+                child = _get_child(masks, player, move)
+
+                # Last piece captured: the opponent has no moves
+                if not child[(opponent, Rank.PAWN)] | child[(opponent, Rank.KING)]:
+                    external[index] = TB_WIN - 1
+                    continue
+
+                child_signature = get_signature(child)
+                child_index = get_index(child, opponent)
+                if child_signature == signature:
+                    sources.append(index)
+                    targets.append(child_index)
+                else:
+                    value = solved[child_signature][child_index]
+                    external[index] = max(external[index], _shorten(value))
+
+    # Edges grouped by source position
+    sources_ = np.frombuffer(sources, dtype=np.int32)
+    targets_ = np.frombuffer(targets, dtype=np.int32)
+    order = np.argsort(sources_, kind="stable")
+    sources_, targets_ = sources_[order], targets_[order]
+    starts = np.flatnonzero(np.r_[True, sources_[1:] != sources_[:-1]])
+    nodes = sources_[starts] if len(sources_) else sources_
+
+    values = np.where(terminal, -TB_WIN, 0).astype(np.int32)
+    fixed = np.where(external > -TB_WIN - 1, external, 0)
+    values = np.where(~terminal, np.maximum(values, fixed), values)
+    while True:
+        best = external.copy()
+        if len(sources_):
+            children = np.maximum.reduceat(_shorten(values[targets_]), starts)
+            best[nodes] = np.maximum(best[nodes], children)
+
+        # Positions without any move inside the signature keep their external score
+        update = np.where(terminal, -TB_WIN, np.where(best > -TB_WIN - 1, best, 0))
+        if np.array_equal(update, values):
+            break
+        values = update
+
+    return values.astype(np.int16)
+
+
+def generate(pieces: int, path: Path | str, kings: bool = False) -> None:
+    """
+    Generate the tablebases with up to <pieces> pieces.
+
+    :param int pieces: maximum number of pieces
+    :param Path | str path: output directory
+    :param bool kings: kings only, defaults to False
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    solved: dict[Signature, np.ndarray] = {}
+    for signature in signatures(pieces, kings):
+        start = time.perf_counter()
+        solved[signature] = table = solve(signature, solved)
+        np.save(path / f"{'-'.join(map(str, signature))}.npy", table)
+
+        elapsed = time.perf_counter() - start
+        wins, losses = np.count_nonzero(table > 0), np.count_nonzero(table < 0)
+        print(f"signature={signature} wins={wins} losses={losses} time={elapsed:.1f}s")
+
+
+class Tablebase:
+    """
+    Tablebase class.
+
+    Read-only tablebases: tables are memory-mapped on first use.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        """
+        Open the tablebases written by 'generate'.
+
+        :param Path | str path: tablebases directory
+        :ivar pieces: maximum number of pieces of the tablebases
+        """
+        self.path = Path(path)
+        self._files = {
+            tuple(map(int, file.stem.split("-"))): file
+            for file in self.path.glob("*.npy")
+        }
+        self._tables: dict[Signature, np.ndarray] = {}
+        self.pieces = max((sum(signature) for signature in self._files), default=0)
+
+    def __reduce__(self) -> tuple:
+        # Pickled by path (e.g. for worker processes), the tables are mapped again
+        return Tablebase, (self.path,)
+
+    def __contains__(self, signature: Signature) -> bool:
+        """
+        Return True if the tablebases contain a signature.
+
+        :param Signature signature: signature
+        :return bool: True if found
+        """
+        return signature in self._files
+
+    def probe(self, board, player: Player) -> int | None:
+        """
+        Return the score of a position, if in the tablebases.
+        A player without pieces has no moves: the game is over, lost by <player>.
+
+        :param Board board: board
+        :param Player player: player to move
+        :return int | None: score from the point of view of <player>, or None
+        """
+        masks = board.bitboard.masks
+        signature = get_signature(masks)
+        if not (signature[0] + signature[1] and signature[2] + signature[3]):
+            return -TB_WIN
+
+        table = self._tables.get(signature)
+        if table is None:
+            if signature not in self._files:
+                return None
+            table = self._tables[signature] = np.load(
+                self._files[signature], mmap_mode="r"
+            )
+
+        return int(table[get_index(masks, player)])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate endgame tablebases.")
+    parser.add_argument("--pieces", type=int, default=3, help="pieces (default: 3)")
+    parser.add_argument("--kings", action="store_true", help="kings only")
+    parser.add_argument(
+        "--output", type=Path, default=TABLEBASES, help=f"(default: {TABLEBASES})"
+    )
+    args = parser.parse_args()
+
+    generate(args.pieces, args.output, args.kings)
+
+
+if __name__ == "__main__":
+    main()
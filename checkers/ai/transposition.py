@@ -0,0 +1,288 @@
+from enum import IntEnum, unique
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+
+import numpy as np
+
+from checkers.logic.moves import Move
+
+
+@unique
+class Bound(IntEnum):
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
+
+
+# Entry layout (22 bytes): the key is stored xor-ed with the data (see 'TranspositionTable')
+ENTRY = np.dtype(
+    [
+        ("key", np.uint64),
+        ("move", np.uint64),
+        ("score", np.int32),
+        ("depth", np.uint8),
+        ("bound", np.uint8),
+    ]
+)
+
+
+def _digest(move: int, score: int, depth: int, bound: int) -> int:
+    """
+    Return the data of an entry packed in 64 bits, xor-ed with its key when stored.
+
+    :param int move: packed move (see 'Move.pack')
+    :param int score: score
+    :param int depth: depth
+    :param int bound: bound
+    :return int: data
+    """
+    return move ^ ((score & 0xFFFFFFFF) | depth << 32 | bound << 40)
+
+
+class TranspositionTable:
+    """
+    TranspositionTable class.
+
+    Fixed-capacity table of search results keyed by position hash (see 'Game.hash').
+    Each bucket holds two entries:
+        - depth-preferred: only replaced by searches at least as deep, or from a previous search
+        - always-replace: replaced by any other result
+    Scores are stored from the point of view of the player to move.
+
+    A table can be kept across searches (moves and games), saved to and loaded from disk, and
+    backed by shared memory: pickled into other processes, it then maps the same entries.
+    Shared tables are lockless: entries store <key> ^ <data> (see '_digest'), so an entry torn
+    by concurrent writes doesn't match its key, and is ignored (lockless hashing).
+    """
+
+    def __init__(self, megabytes: float = 16, shared: bool = False) -> None:
+        """
+        Initialize an empty table.
+
+        :param float megabytes: memory ceiling of the table, defaults to 16 MB
+        :param bool shared: back the table by shared memory, defaults to False
+        :ivar hits: number of probes that found the position
+        :ivar misses: number of probes that didn't find the position
+        """
+        buckets = max(1, int(megabytes * 2**20) // (2 * ENTRY.itemsize))
+        self._memory: SharedMemory | None = None
+        self._owner = shared
+        if shared:
+            self._memory = SharedMemory(
+                create=True, size=buckets * (2 * ENTRY.itemsize + 1) + 1
+            )
+            self._map(buckets)
+            self.clear()
+        else:
+            self._table = np.zeros((buckets, 2), dtype=ENTRY)
+            ages = np.zeros(buckets + 1, dtype=np.uint8)
+            self._ages, self._clock = ages[:buckets], ages[buckets:]
+        self._clock[0] = 1
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self) -> "TranspositionTable":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __getstate__(self) -> dict:
+        state = dict(self.__dict__)
+        if self._memory is not None:
+            # Shared tables are pickled by name, and mapped again
+            state["_memory"] = self._memory.name
+            state["_buckets"] = len(self._table)
+            del state["_table"], state["_ages"], state["_clock"]
+        state["_owner"] = False
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        buckets = state.pop("_buckets", None)
+        self.__dict__.update(state)
+        if buckets is not None:
+            self._memory = SharedMemory(name=state["_memory"])
+            self._map(buckets)
+
+    def _map(self, buckets: int) -> None:
+        """
+        Map the entries, the ages and the current age of the table onto its shared memory
+        (the current age is shared too: every process replaces entries by the same ages).
+
+        :param int buckets: number of buckets
+        """
+        buffer = self._memory.buf  # type: ignore
+        self._table = np.ndarray((buckets, 2), dtype=ENTRY, buffer=buffer)
+        ages = np.ndarray(
+            buckets + 1, dtype=np.uint8, buffer=buffer, offset=self._table.nbytes
+        )
+        self._ages, self._clock = ages[:buckets], ages[buckets:]
+
+    def __len__(self) -> int:
+        """
+        Return the number of entries in use.
+
+        :return int: number of entries
+        """
+        return int(np.count_nonzero(self._table["key"]))
+
+    @property
+    def capacity(self) -> int:
+        """
+        Return the maximum number of entries.
+
+        :return int: number of entries
+        """
+        return self._table.size
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Return the ratio of probes that found the position.
+
+        :return float: hit rate (0 if never probed)
+        """
+        probes = self.hits + self.misses
+        return self.hits / probes if probes else 0.0
+
+    @property
+    def shared(self) -> bool:
+        """
+        Return whether the table is backed by shared memory.
+
+        :return bool: shared table
+        """
+        return self._memory is not None
+
+    def new_search(self) -> None:
+        """
+        Start a new search: entries from previous searches become replaceable.
+        """
+        self._clock[0] = self._clock[0] % 255 + 1
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset counters.
+        """
+        self._table[:] = 0
+        self._ages[:] = 0
+        self.hits = self.misses = 0
+
+    def close(self) -> None:
+        """
+        Release the shared memory of the table (freed by the process that created it).
+        The table can't be used afterwards.
+        """
+        if self._memory is None:
+            return
+
+        # Views must be released before the memory is closed
+        del self._table, self._ages, self._clock
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
+        self._memory = None
+
+    def save(self, path: Path) -> None:
+        """
+        Save the entries of the table to a .npy file.
+
+        :param Path path: path of the file
+        """
+        np.save(path, self._table)
+
+    @classmethod
+    def load(
+        cls, path: Path, megabytes: float | None = None, shared: bool = False
+    ) -> "TranspositionTable":
+        """
+        Load a table saved with 'save'.
+        Into a table of another size, entries are stored again (shallowest first): the
+        replacement scheme evicts the shallowest ones if the table is smaller.
+
+        :param Path path: path of the file
+        :param float | None megabytes: memory ceiling of the table, defaults to None (saved size)
+        :param bool shared: back the table by shared memory, defaults to False
+        :return TranspositionTable: table
+        """
+        entries = np.load(path)
+        if entries.dtype != ENTRY or entries.ndim != 2 or entries.shape[1] != 2:
+            raise ValueError(f"{path} is not a transposition table")
+
+        if megabytes is None:
+            megabytes = entries.nbytes / 2**20
+        table = cls(megabytes, shared=shared)
+        if entries.shape == table._table.shape:
+            table._table[:] = entries
+            return table
+
+        entries = entries.ravel()
+        entries = entries[entries["key"] != 0]
+        for entry in entries[np.argsort(entries["depth"], kind="stable")]:
+            check, move, score, depth, bound = entry.item()
+            table.store(
+                check ^ _digest(move, score, depth, bound),
+                depth,
+                score,
+                Bound(bound),
+                Move.unpack(move) if move else None,
+            )
+        return table
+
+    def probe(self, key: int) -> tuple[int, int, Bound, Move | None] | None:
+        """
+        Return the entry stored for a position, if any.
+
+        :param int key: position hash
+        :return tuple | None: (<depth>, <score>, <bound>, <best move> | None) or None
+        """
+        bucket = self._table[key % len(self._table)]
+        for entry in bucket:
+            check, move, score, depth, bound = entry.item()
+            if check ^ _digest(move, score, depth, bound) == key:
+                self.hits += 1
+                return (
+                    depth,
+                    score,
+                    Bound(bound),
+                    Move.unpack(move) if move else None,
+                )
+
+        self.misses += 1
+        return None
+
+    def store(
+        self, key: int, depth: int, score: float, bound: Bound, move: Move | None
+    ) -> None:
+        """
+        Store a search result.
+
+        :param int key: position hash
+        :param int depth: depth searched
+        :param float score: score, from the point of view of the player to move
+        :param Bound bound: whether the score is exact, a lower bound or an upper bound
+        :param Move | None move: best move found, if any
+        """
+        index = key % len(self._table)
+        bucket = self._table[index]
+        packed, score, depth = move.pack() if move else 0, int(score), min(depth, 255)
+        entry = (
+            key ^ _digest(packed, score, depth, bound),
+            packed,
+            score,
+            depth,
+            bound,
+        )
+
+        preferred = bucket[0].item()
+        check, *data = preferred
+        stored = check ^ _digest(*data) if check else 0
+        age = self._clock[0]
+        if stored == key or depth >= data[2] or self._ages[index] != age:
+            # Demote the previous depth-preferred entry to the always-replace slot
+            if stored != key and check:
+                bucket[1] = preferred
+            bucket[0] = entry
+            self._ages[index] = age
+        else:
+            bucket[1] = entry
@@ -1,12 +1,28 @@
+import copy
 import sys
+from concurrent.futures import Future
+from threading import Thread
 
 import pygame
 
+from checkers.ai.book import BOOK, OpeningBook
+from checkers.ai.cancel import CancellationToken
+from checkers.ai.engine import Engine, SearchOptions
+from checkers.ai.evaluation import Positional
+from checkers.ai.ponder import Ponderer
+from checkers.ai.tablebase import TABLEBASES, Tablebase
+from checkers.ai.transposition import TranspositionTable
 from checkers.graphics.sprites.piece import PieceSprite
 from checkers.graphics.window import Window
 from checkers.logic.piece import Player
 from checkers.utils.logging import logging
 
+# Engines that can ponder (serial alpha-beta searches, see 'Ponderer')
+PONDER_ENGINES = (Engine.MINIMAX, Engine.NEGAMAX)
+
+# Seconds given to the cancelled AI search to finish when the window is closed
+QUIT_TIMEOUT = 1.0
+
 
 class Environment(Window):
     """
@@ -23,6 +39,15 @@ class Environment(Window):
         :ivar HUMAN_PLAYER: human player (BLACK piece)
         :ivar MULTIPLE_CAPTURE: (x, y) pixel coordinates of piece position if in multiple capture path
         :ivar SELECTED: currently selected game piece
+        :ivar AI_OPTIONS: AI search settings: engine, evaluation function, endgame tablebases
+            (None if there is no tablebases directory), thinking time per move (in milliseconds)
+            and transposition table, kept for the whole game
+        :ivar AI_BOOK: AI opening book (None if there is no book file)
+        :ivar AI_PONDER: AI pondering on the human player's turn (None to disable, and for
+            engines that can't ponder, see PONDER_ENGINES)
+        :ivar AI_MOVE: pending AI move, searched in the background (None if not thinking)
+        :ivar AI_TOKEN: cancels the pending AI search (see 'quit')
+        :ivar AI_THREAD: thread of the pending AI search (None if not thinking)
         """
         self.clock = pygame.time.Clock()
         super().__init__()
@@ -32,6 +57,20 @@ class Environment(Window):
         self.HUMAN_PLAYER: Player = Player.BLACK
         self.MULTIPLE_CAPTURE: tuple | None = None
         self.SELECTED: PieceSprite | None = None
+        self.AI_OPTIONS: SearchOptions = SearchOptions(
+            time_budget=1000,
+            engine=Engine.NEGAMAX,
+            evaluation=Positional(),
+            tablebase=Tablebase(TABLEBASES) if TABLEBASES.exists() else None,
+            table=TranspositionTable(),
+        )
+        self.AI_BOOK: OpeningBook | None = OpeningBook(BOOK) if BOOK.exists() else None
+        self.AI_PONDER: Ponderer | None = None
+        if self.AI_OPTIONS.engine in PONDER_ENGINES:
+            self.AI_PONDER = Ponderer(self.AI_OPTIONS.build())
+        self.AI_MOVE: Future | None = None
+        self.AI_TOKEN: CancellationToken = CancellationToken()
+        self.AI_THREAD: Thread | None = None
 
         # Set human player as starting player
         self.game.player = self.HUMAN_PLAYER
@@ -172,15 +211,92 @@ class Environment(Window):
             # Update the board
             self._update_board()
 
+    def _ponder(self) -> None:
+        """
+        Start pondering on the human player's turn.
+        """
+        if self.AI_PONDER is not None:
+            self.AI_PONDER.start(self.game, Player(-self.HUMAN_PLAYER.value))
+
+    def _think(self) -> Future:
+        """
+        Search the AI move in a background thread, so that the window keeps rendering
+        and handling events meanwhile.
+
+        The search runs on a copy of the game: the board is made and unmade in place
+        while searching, and must not change under the sprites being drawn.
+
+        :return Future: future AI move
+        """
+        future: Future = Future()
+        future.set_running_or_notify_cancel()
+        game = copy.deepcopy(self.game)
+        self.AI_TOKEN.reset()
+
+        def search() -> None:
+            try:
+                ai_move = game.get_ai_move(
+                    player=game.player,
+                    options=self.AI_OPTIONS,
+                    book=self.AI_BOOK,
+                    ponder=self.AI_PONDER,
+                    token=self.AI_TOKEN,
+                )
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(ai_move)
+
+        # Daemon: a search that outlives 'quit' must not keep the process alive
+        self.AI_THREAD = Thread(target=search, daemon=True)
+        self.AI_THREAD.start()
+        return future
+
+    def _play_ai_move(self) -> None:
+        """
+        Start the AI search, or play the AI move once it has been found.
+        """
+        if self.AI_MOVE is None:
+            self.AI_MOVE = self._think()
+            return
+
+        if not self.AI_MOVE.done():
+            return
+
+        ai_move = self.AI_MOVE.result()
+        self.AI_MOVE = self.AI_THREAD = None
+        self._make_move_ui(ai_move)
+
+        self.game.next_turn()
+        logging.info(f"Next turn: {self.game.turn} player: {self.game.player}")
+
+        self._reset_board()
+        self._update_board()
+        self._ponder()
+
+    def quit(self) -> None:
+        """
+        Stop pondering, cancel the pending AI search and close the window.
+        The search is given QUIT_TIMEOUT seconds to finish (and shut its worker processes down).
+        """
+        if self.AI_PONDER is not None:
+            self.AI_PONDER.stop()
+        if self.AI_THREAD is not None:
+            self.AI_TOKEN.cancel()
+            self.AI_THREAD.join(QUIT_TIMEOUT)
+        pygame.quit()
+        sys.exit()
+
     def play(self) -> None:
         """
         Start the game environment.
         """
+        self._ponder()
+
         while not self.game.is_game_over():
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+                    self.quit()
 
                 # Human player turn
                 if self.game.player is self.HUMAN_PLAYER:
@@ -198,37 +314,30 @@ class Environment(Window):
                             x, y = self.MULTIPLE_CAPTURE
                             self.hover(x, y)
 
-                # AI player turn
-                else:
-                    # Random move
-                    # self._make_move(self.get_random_move(self.game.player))
-
-                    # Alpha-beta pruning move
-                    ai_move = self.game.get_ai_move(player=self.game.player, depth=4)
-                    self._make_move_ui(ai_move)
-
-                    self.game.next_turn()
-                    logging.info(
-                        f"Next turn: {self.game.turn} player: {self.game.player}"
-                    )
-
-                    self._reset_board()
-                    self._update_board()
+            # AI player turn
+            if self.game.player is not self.HUMAN_PLAYER:
+                self._play_ai_move()
 
             self.blink()
 
             self.squares_sprites.draw(self.screen)
             self.pieces_sprites.draw(self.screen)
+            if self.AI_MOVE is not None:
+                self.display_thinking()
             pygame.display.flip()
 
+            # Leave the CPU to the search in the background
+            self.clock.tick(60)
+
+        if self.AI_PONDER is not None:
+            self.AI_PONDER.stop()
+
         while True:
             self.display_winner()
             pygame.display.flip()
 
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+                    self.quit()
                 elif event.type == pygame.KEYDOWN:
-                    pygame.quit()
-                    sys.exit()
+                    self.quit()
@@ -39,5 +39,4 @@ class MockGame(Game):
         # Convert a few pawns to kings
         pieces_to_crown = [(2, 5), (3, 2), (5, 6)]
         for piece in pieces_to_crown:
-            piece = self.board.pieces[piece]
-            piece.rank = Rank.KING
+            self.board._set_rank(piece, Rank.KING)
@@ -0,0 +1,3 @@
+class SearchAborted(Exception):
+    def __init__(self, reason: str) -> None:
+        super().__init__(f"Search aborted: {reason}")
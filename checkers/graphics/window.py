@@ -168,9 +168,9 @@ class Window:
         """
 
         # Get moves (paths) that selected piece can make
-        self.PIECE_MOVES = self.game.board._get_player_tree(piece_sprite.data.player)[
+        self.PIECE_MOVES = self.game.board.legal_moves(piece_sprite.data.player).paths(
             (piece_sprite.x, piece_sprite.y)
-        ]
+        )
 
         # Get imminent next moves
         self.next_moves = {}
@@ -304,3 +304,21 @@ class Window:
         text = font.render(f"Press any keystroke to exit", True, WHITE)
         text_x = rect.centerx - text.get_width() // 2
         self.screen.blit(text, (text_x, text_y + 40))
+
+    def display_thinking(self) -> None:
+        """
+        Display a thinking indicator while the AI searches its move.
+        """
+        # Text (dots cycle every blink interval)
+        dots = (pygame.time.get_ticks() // self.BLINK_INTERVAL) % 4
+        font = pygame.font.Font("assets/fonts/OpenSans-Medium.ttf", 14)
+        text = font.render(f"Thinking{'.' * dots}", True, WHITE)
+
+        # Rect (sized for the longest text so that it does not jitter)
+        width = font.size("Thinking...")[0] + 16
+        height = text.get_height() + 8
+        rect = pygame.Rect(BORDER_WIDTH, BORDER_WIDTH, width, height)
+
+        # Draw textbox
+        pygame.draw.rect(self.screen, GRAY, rect)
+        self.screen.blit(text, (rect.left + 8, rect.top + 4))
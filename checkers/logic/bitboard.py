@@ -0,0 +1,323 @@
+from collections.abc import Iterator
+
+from checkers.logic.moves import Move
+from checkers.logic.piece import Player, Rank
+from checkers.logic.tables import (
+    KING_CONTINUATIONS,
+    KING_JUMPS,
+    KING_STEPS,
+    PAWN_JUMPS,
+    PAWN_STEPS,
+)
+
+# Masks
+FULL = (1 << 32) - 1
+EVEN_ROWS = 0x0F0F0F0F
+ODD_ROWS = 0xF0F0F0F0
+LEFT_EDGE = 0x11111111
+RIGHT_EDGE = 0x88888888
+BACK_RANK = {Player.BLACK: 0x0000000F, Player.WHITE: 0xF0000000}
+
+# Keys of <Bitboard.masks> per player, and opponent (enum attribute lookups are slow)
+KEYS = {player: ((player, Rank.PAWN), (player, Rank.KING)) for player in Player}
+OPPONENT = {Player.BLACK: Player.WHITE, Player.WHITE: Player.BLACK}
+
+# Masks of squares that can step left (toward column 0) / right (toward column 7) by row parity
+EVEN_RIGHT = EVEN_ROWS & ~RIGHT_EDGE
+ODD_LEFT = ODD_ROWS & ~LEFT_EDGE
+
+
+def squares(bits: int):
+    """
+    Yield the squares set in a bitmask, in ascending order.
+
+    :param int bits: bitmask
+    :yield int: square index
+    """
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class Bitboard:
+    """
+    Bitboard class.
+
+    Packs the 32 playable squares into one integer bitmask per player and rank.
+    Moves, captures and kinging are done with shift-and-mask operations.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty bitboard.
+        """
+        self.masks = {
+            (player, rank): 0
+            for player in (Player.BLACK, Player.WHITE)
+            for rank in (Rank.PAWN, Rank.KING)
+        }
+
+    def place(self, square: int, player: Player, rank: Rank) -> None:
+        """
+        Place a piece on a square.
+
+        :param int square: square index
+        :param Player player: player
+        :param Rank rank: rank
+        """
+        self.masks[(player, rank)] |= 1 << square
+
+    def clear(self, square: int) -> tuple[Player, Rank] | None:
+        """
+        Remove any piece from a square.
+
+        :param int square: square index
+        :return tuple[Player, Rank] | None: (<player>, <rank>) of the removed piece, if any
+        """
+        bit = 1 << square
+        for key, mask in self.masks.items():
+            if mask & bit:
+                self.masks[key] = mask & ~bit
+                return key
+        return None
+
+    def make_move(self, move: Move, player: Player) -> None:
+        """
+        Make a move on the bitboard only (e.g. for playouts, without a 'Board').
+        A pawn visiting the back rank is crowned, even in the middle of a capture.
+
+        :param Move move: move
+        :param Player player: player
+        """
+        masks = self.masks
+        pawn, king = KEYS[player]
+        source = 1 << move.squares[0]
+        key = king if masks[king] & source else pawn
+        masks[key] &= ~source
+
+        if key is pawn and any(BACK_RANK[player] >> s & 1 for s in move.squares):
+            key = king
+        masks[key] |= 1 << move.squares[-1]
+
+        if move.captures:
+            for key in KEYS[OPPONENT[player]]:
+                masks[key] &= ~move.captures
+
+    def pieces(self, player: Player) -> int:
+        """
+        Return the bitmask of all the pieces of a given player.
+
+        :param Player player: player
+        :return int: bitmask
+        """
+        pawn, king = KEYS[player]
+        return self.masks[pawn] | self.masks[king]
+
+    @property
+    def occupied(self) -> int:
+        """
+        Return the bitmask of occupied squares.
+
+        :return int: bitmask
+        """
+        a, b, c, d = self.masks.values()
+        return a | b | c | d
+
+    @property
+    def empty(self) -> int:
+        """
+        Return the bitmask of empty squares.
+
+        :return int: bitmask
+        """
+        return ~self.occupied & FULL
+
+    def movers(self, player: Player) -> int:
+        """
+        Return the bitmask of pieces that can make a regular (non-capture) move.
+
+        :param Player player: player
+        :return int: bitmask
+        """
+        empty = self.empty
+        pawn, king = KEYS[player]
+        pawns, kings = self.masks[pawn], self.masks[king]
+
+        # Squares with an empty square one row down (+1) / up (-1): empty squares stepped back
+        down = (empty & EVEN_RIGHT) >> 3 | empty >> 4 | (empty & ODD_LEFT) >> 5
+        up = ((empty & EVEN_RIGHT) << 5 | empty << 4 | (empty & ODD_LEFT) << 3) & FULL
+
+        if player.value == 1:
+            return (pawns | kings) & down | kings & up
+        return (pawns | kings) & up | kings & down
+
+    def jumpers(self, player: Player) -> int:
+        """
+        Return the bitmask of pieces that can capture an opponent piece.
+
+        :param Player player: player
+        :return int: bitmask
+        """
+        empty = self.empty
+        opponent = self.pieces(OPPONENT[player])
+        pawn, king = KEYS[player]
+        pawns, kings = self.masks[pawn], self.masks[king]
+        if player.value == 1:
+            down, up = pawns | kings, kings
+        else:
+            down, up = kings, pawns | kings
+
+        bits = 0
+        if down:
+            # (1, 1): back is (-1, -1)
+            over = ((empty & EVEN_ROWS) >> 4 | (empty & ODD_LEFT) >> 5) & opponent
+            bits |= ((over & EVEN_ROWS) >> 4 | (over & ODD_LEFT) >> 5) & down
+            # (1, -1): back is (-1, 1)
+            over = ((empty & EVEN_RIGHT) >> 3 | (empty & ODD_ROWS) >> 4) & opponent
+            bits |= ((over & EVEN_RIGHT) >> 3 | (over & ODD_ROWS) >> 4) & down
+
+        if up:
+            # (-1, 1): back is (1, -1)
+            over = ((empty & EVEN_ROWS) << 4 | (empty & ODD_LEFT) << 3) & opponent
+            bits |= ((over & EVEN_ROWS) << 4 | (over & ODD_LEFT) << 3) & up
+            # (-1, -1): back is (1, 1)
+            over = ((empty & EVEN_RIGHT) << 5 | (empty & ODD_ROWS) << 4) & opponent
+            bits |= ((over & EVEN_RIGHT) << 5 | (over & ODD_ROWS) << 4) & up
+
+        return bits & FULL
+
+    def generate(self, player: Player) -> Iterator[Move]:
+        """
+        Yield the legal moves of a given player one at a time, captures first.
+        Regular moves are only generated if no capture is available (captures are compulsory).
+        The masks are read once: the board may change between moves as long as it is restored.
+
+        :param Player player: player
+        :yield Move: move
+        """
+        kings = self.masks[KEYS[player][1]]
+        empty = self.empty
+        jumpers = self.jumpers(player)
+
+        if jumpers:
+            opponent = self.pieces(OPPONENT[player])
+            for square in squares(jumpers):
+                bit = 1 << square
+                king = kings & bit
+                jumps = KING_JUMPS[square] if king else PAWN_JUMPS[player][square]
+                moves: list = []
+                self._captures(
+                    moves,
+                    (square,),
+                    0,
+                    player,
+                    bool(king),
+                    opponent,
+                    empty | bit,
+                    jumps,
+                )
+                yield from moves
+            return
+
+        for square in squares(self.movers(player)):
+            if kings >> square & 1:
+                targets = KING_STEPS[square]
+            else:
+                targets = PAWN_STEPS[player][square]
+            for target in targets:
+                if empty >> target & 1:
+                    yield Move((square, target))
+
+    def moves(self, player: Player) -> list:
+        """
+        Return the moves of every piece of a given player that can move, ordered by source square.
+        Captures are compulsory for a piece: its regular moves are only returned if it can't capture.
+        Pieces that can't capture are returned even if others can (see <generate> for legal moves).
+
+        :param Player player: player
+        :return list: list of moves
+        """
+        kings = self.masks[KEYS[player][1]]
+        opponent = self.pieces(OPPONENT[player])
+        empty = self.empty
+        jumpers = self.jumpers(player)
+        movers = self.movers(player) & ~jumpers
+
+        moves: list = []
+        for square in squares(jumpers | movers):
+            bit = 1 << square
+            king = kings & bit
+            if bit & jumpers:
+                jumps = KING_JUMPS[square] if king else PAWN_JUMPS[player][square]
+                self._captures(
+                    moves,
+                    (square,),
+                    0,
+                    player,
+                    bool(king),
+                    opponent,
+                    empty | bit,
+                    jumps,
+                )
+            else:
+                targets = KING_STEPS[square] if king else PAWN_STEPS[player][square]
+                moves.extend(
+                    Move((square, target)) for target in targets if empty >> target & 1
+                )
+
+        return moves
+
+    def _captures(
+        self,
+        moves: list,
+        visited: tuple,
+        captured: int,
+        player: Player,
+        king: bool,
+        opponent: int,
+        empty: int,
+        jumps: tuple,
+    ) -> None:
+        """
+        Add the capture moves continuing a given capture path (depth-first) to <moves>.
+
+        A pawn reaching the back rank is crowned and continues as a king.
+        Kings can't jump back in the direction they came from.
+
+        :param list moves: list of moves to extend
+        :param tuple visited: squares visited so far (the last one holds the moving piece)
+        :param int captured: bitmask of the squares captured so far
+        :param Player player: player
+        :param bool king: True if the piece is a king
+        :param int opponent: bitmask of remaining opponent pieces
+        :param int empty: bitmask of empty squares
+        :param tuple jumps: jumps to explore (see 'checkers.logic.tables')
+        """
+        square = visited[-1]
+        for direction, over, land in jumps:
+            if not (opponent >> over & 1 and empty >> land & 1):
+                continue
+
+            crowned = king or bool(BACK_RANK[player] >> land & 1)
+            if crowned:
+                next_jumps = KING_CONTINUATIONS[land][direction]
+            else:
+                next_jumps = PAWN_JUMPS[player][land]
+
+            count = len(moves)
+            path = visited + (land,)
+            self._captures(
+                moves,
+                path,
+                captured | 1 << over,
+                player,
+                crowned,
+                opponent & ~(1 << over),
+                (empty | 1 << square | 1 << over) & ~(1 << land),
+                next_jumps,
+            )
+
+            # No further capture: the path ends here
+            if len(moves) == count:
+                moves.append(Move(path, captured | 1 << over))
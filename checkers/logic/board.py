@@ -1,7 +1,14 @@
+from collections.abc import Iterator
+
 import numpy as np
 
+from checkers.logic.bitboard import Bitboard
+from checkers.logic.moves import LegalMoves, Move
 from checkers.logic.node import Node
 from checkers.logic.piece import Piece, Player, Rank
+from checkers.logic.tables import CELLS, JUMPED, KING_STEPS, PAWN_STEPS, SQUARES
+from checkers.logic.undo import UndoRecord
+from checkers.logic.zobrist import KEYS
 
 
 class Board:
@@ -11,6 +18,11 @@ class Board:
     Represents the board.
     Contains methods required to interact with the board.
     Contains useful properties of the board.
+
+    The cell dictionary (<state>) is mirrored in a <Bitboard>, used for move generation.
+    A Zobrist hash of the position is updated incrementally on every change.
+    So is an index of the pieces (positions per player, counts per player and rank, material).
+    Legal moves are generated once per position and cached until the next change.
     """
 
     Cell = tuple[int, int]
@@ -19,7 +31,21 @@ class Board:
         """
         Initialize the state of the board.
         """
+        self._bitboard = Bitboard()
+        self._hash = 0
+        self._pieces: dict = {}
+        self._positions: dict = {Player.BLACK: {}, Player.WHITE: {}}
+        self._counts = {
+            (player, rank): 0
+            for player in (Player.BLACK, Player.WHITE)
+            for rank in (Rank.PAWN, Rank.KING)
+        }
+        self._material = {Player.BLACK: 0, Player.WHITE: 0}
+        self._legal: dict = {}
         self._state = self._get_state()
+        for pos, piece in self._state.items():
+            if piece:
+                self._put(pos, piece)
 
     def _get_state(self) -> dict:
         """
@@ -43,11 +69,20 @@ class Board:
 
         :return str: board
         """
+        return str(self.array)
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        Return the board as an 8x8 array of piece hashes (0 for empty squares).
+
+        :return np.ndarray: board
+        """
         board = np.zeros(shape=(8, 8), dtype=np.int8)
         for pos, piece in self.pieces.items():
             board[pos] = piece.__hash__()
 
-        return str(board)
+        return board
 
     @property
     def state(self) -> dict:
@@ -66,16 +101,117 @@ class Board:
         :param tuple data: (<x, y>, <Piece>)
         """
         pos, piece = data
-        self._state[pos] = piece
+        self._take(pos)
+        if type(piece) is Piece:
+            self._put(pos, piece)
+        else:
+            self._state[pos] = piece
+
+    @property
+    def hash(self) -> int:
+        """
+        Return the Zobrist hash of the pieces on the board (see 'Game.hash' for side to move).
+
+        :return int: 64-bit hash
+        """
+        return self._hash
+
+    @property
+    def bitboard(self) -> Bitboard:
+        """
+        Return the bitboard mirroring the board.
+        The bitboard is kept up to date by the board: don't modify it.
+
+        :return Bitboard: bitboard
+        """
+        return self._bitboard
 
     @property
     def pieces(self) -> dict:
         """
         Return all the pieces currently in game.
+        The index is kept up to date by the board: don't modify it.
 
         :return dict: pieces in game {<position>: <Piece>}
         """
-        return {k: v for k, v in self._state.items() if type(v) is Piece}
+        return self._pieces
+
+    def count(self, player: Player, rank: Rank | None = None) -> int:
+        """
+        Return the number of pieces of a given player (and rank, if given).
+
+        :param Player player: player
+        :param Rank | None rank: rank, defaults to any rank
+        :return int: number of pieces
+        """
+        if rank is None:
+            return len(self._positions[player])
+        return self._counts[(player, rank)]
+
+    def material(self, player: Player) -> int:
+        """
+        Return the material of a given player (sum of the <Rank> values of its pieces).
+
+        :param Player player: player
+        :return int: material
+        """
+        return self._material[player]
+
+    def _put(self, pos: Cell, piece: Piece) -> None:
+        """
+        Put a piece at a given (<x>, <y>) position, keeping the bitboard, hash and index in sync.
+
+        :param Cell pos: position
+        :param Piece piece: piece
+        """
+        self._legal.clear()
+        self._state[pos] = piece
+        self._pieces[pos] = piece
+        self._positions[piece.player][pos] = piece
+        self._counts[(piece.player, piece.rank)] += 1
+        self._material[piece.player] += piece.rank.value
+        square = SQUARES.get(pos)
+        if square is not None:
+            self._bitboard.place(square, piece.player, piece.rank)
+            self._hash ^= KEYS[(piece.player, piece.rank)][square]
+
+    def _take(self, pos: Cell) -> Piece | None:
+        """
+        Take the piece (if any) at a given (<x>, <y>) position, keeping the bitboard, hash and index in sync.
+        The piece is indexed with the rank it was put with, even if changed since.
+
+        :param Cell pos: position
+        :return Piece | None: piece or None
+        """
+        piece = self._state[pos]
+        self._state[pos] = None
+        if type(piece) is not Piece:
+            return None
+
+        self._legal.clear()
+        square = SQUARES.get(pos)
+        if square is not None:
+            player, rank = self._bitboard.clear(square)  # type: ignore
+            self._hash ^= KEYS[(player, rank)][square]
+        else:
+            player, rank = piece.player, piece.rank
+
+        del self._pieces[pos]
+        del self._positions[player][pos]
+        self._counts[(player, rank)] -= 1
+        self._material[player] -= rank.value
+        return piece
+
+    def _set_rank(self, pos: Cell, rank: Rank) -> None:
+        """
+        Set the rank of the piece at a given (<x>, <y>) position.
+
+        :param Cell pos: position
+        :param Rank rank: rank
+        """
+        piece = self._take(pos)
+        piece.rank = rank  # type: ignore
+        self._put(pos, piece)  # type: ignore
 
     def _is_king(self, piece: Piece, pos: Cell) -> None:
         """
@@ -98,9 +234,9 @@ class Board:
 
         :param Cell pos: position
         """
-        captured = self.pieces[pos]
-        self._state[pos] = None
-        return captured
+        if type(self._state[pos]) is not Piece:
+            raise KeyError(pos)
+        return self._take(pos)  # type: ignore
 
     def restore(self, pos: Cell, piece: Piece) -> None:
         """
@@ -109,7 +245,8 @@ class Board:
         :param Cell pos: position
         :param Piece piece: captured piece
         """
-        self._state[pos] = piece
+        self._take(pos)
+        self._put(pos, piece)
 
     def _get_pieces(self, player: Player) -> list:
         """
@@ -118,7 +255,7 @@ class Board:
         :param Player player: player
         :return list: list of pieces positions for a given player
         """
-        return [pos for pos, piece in self.pieces.items() if piece.player is player]
+        return list(self._positions[player])
 
     def get_player_moves(self, player: Player) -> list:
         """
@@ -128,33 +265,103 @@ class Board:
         :param Player player: player
         :return list: pieces positions that a given player can move
         """
-        captures = self._get_player_captures(player)
-        if not captures:
-            return list(self._get_player_tree(player).keys())
-        return captures
+        return self.legal_moves(player).sources
 
-    def _get_player_captures(self, player: Player) -> list:
+    def legal_moves(self, player: Player) -> LegalMoves:
         """
-        Return the positions of the pieces that can capture other pieces for a given player.
+        Return all the legal moves of a given player, with compulsory captures applied.
+        Moves are generated in a single pass and cached until the board changes.
 
         :param Player player: player
-        :return list: pieces positions for a given player than can capture opponent pieces
+        :return LegalMoves: legal moves
+        """
+        legal = self._legal.get(player)
+        if legal is None:
+            moves = list(self._bitboard.generate(player))
+
+            # With compulsory captures, either all or none of the moves are captures
+            legal = LegalMoves(
+                player=player,
+                moves=self._group(moves),
+                captures=bool(moves) and bool(moves[0].captures),
+            )
+            self._legal[player] = legal
+        return legal
+
+    def generate_moves(self, player: Player) -> Iterator[Move]:
         """
+        Yield the legal moves of a given player one at a time, captures first.
+        Unlike <legal_moves>, moves are only generated as they are consumed, so a search
+        that stops early (e.g. on a cutoff) doesn't pay for the remaining moves.
+        The board may change between moves as long as it is restored before the next one.
 
-        def _get_captures(moves: list) -> list:
-            """
-            Return the captured positions if any.
+        :param Player player: player
+        :yield Move: move
+        """
+        legal = self._legal.get(player)
+        if legal is not None:
+            return iter(legal)
+        return self._bitboard.generate(player)
 
-            :param list moves: list of moves
-            :return list: list of capture positions
-            """
-            return [
-                move[1][1] if isinstance(move[1], tuple) else None for move in moves
-            ]
+    def is_legal(self, move: Move, player: Player) -> bool:
+        """
+        Return True if a move is legal for a given player.
+        Regular moves are checked on the bitboard, without generating the legal moves.
+
+        :param Move move: move
+        :param Player player: player
+        :return bool: True if move is legal
+        """
+        legal = self._legal.get(player)
+        if legal is None and not move.captures:
+            bitboard = self._bitboard
+            source, target = move.squares[0], move.squares[-1]
+            if len(move.squares) != 2 or not bitboard.pieces(player) >> source & 1:
+                return False
+
+            # Captures are compulsory
+            if bitboard.jumpers(player):
+                return False
+
+            if bitboard.masks[(player, Rank.KING)] >> source & 1:
+                targets = KING_STEPS[source]
+            else:
+                targets = PAWN_STEPS[player][source]
+            return target in targets and bool(bitboard.empty >> target & 1)
+
+        legal = self.legal_moves(player)
+        return move.source in legal and move in legal[move.source]
+
+    def has_moves(self, player: Player) -> bool:
+        """
+        Return True if a given player can move.
 
-        moves = self._get_player_tree(player)
-        captures = {pos: set(_get_captures(moves)) for pos, moves in moves.items()}
-        return list(filter(lambda pos: any(captures[pos]), captures))
+        :param Player player: player
+        :return bool: True if player can move
+        """
+        legal = self._legal.get(player)
+        if legal is not None:
+            return bool(legal)
+        return bool(self._bitboard.movers(player) or self._bitboard.jumpers(player))
+
+    def has_captures(self, player: Player) -> bool:
+        """
+        Return True if a given player can (hence must) capture.
+
+        :param Player player: player
+        :return bool: True if player can capture
+        """
+        return bool(self._bitboard.jumpers(player))
+
+    def _get_player_captures(self, player: Player) -> list:
+        """
+        Return the positions of the pieces that can capture other pieces for a given player.
+
+        :param Player player: player
+        :return list: pieces positions for a given player than can capture opponent pieces
+        """
+        legal = self.legal_moves(player)
+        return legal.sources if legal.captures else []
 
     def _get_player_tree(self, player: Player) -> dict:
         """
@@ -165,17 +372,27 @@ class Board:
         :param Player player: player
         :return dict: dict {<type>: {<position>: <node>}}
         """
-        moves = {}
-        for pos in self._get_pieces(player):
-            root = Node(pos)
-            node = self._get_piece_tree(root)
+        return {
+            pos: [move.path for move in moves]
+            for pos, moves in self._group(self._bitboard.moves(player)).items()
+        }
 
-            # Only get pieces that can move
-            if node.children:
-                paths = node._get_paths()
-                moves[node.position] = paths
+    @staticmethod
+    def _group(moves: list) -> dict:
+        """
+        Group moves by source position.
 
-        return moves
+        :param list moves: list of moves
+        :return dict: {<position>: [<Move>, ...]}
+        """
+        grouped: dict = {}
+        for move in moves:
+            source = CELLS[move.squares[0]]
+            if source in grouped:
+                grouped[source].append(move)
+            else:
+                grouped[source] = [move]
+        return grouped
 
     def _get_piece_tree(
         self,
@@ -185,6 +402,7 @@ class Board:
     ) -> Node:
         """
         Return the moves (tree) a piece can make.
+        Reference implementation walking the cell dictionary (see <_get_player_tree>).
 
         :param Node node: node (tree)
         :param list directions: directions a piece can take
@@ -275,13 +493,13 @@ class Board:
                                 node=child, directions=dirs, from_capture=True
                             )
 
-                            # Undo move
-                            self.move(piece, next_pos, pos)
-
                             # Restore rank if changed
                             if piece.rank != previous_rank:
                                 piece.rank = Rank.PAWN
 
+                            # Undo move
+                            self.move(piece, next_pos, pos)
+
                             # Restore captured piece
                             self.restore(pos=move, piece=captured)
 
@@ -305,7 +523,49 @@ class Board:
         :param Cell old: old position
         :param Cell new: new position
         """
-        self.state = (old, 0)
-        self.state = (new, piece)
-
+        self._take(old)
+        self._state[old] = 0
         self._is_king(piece, new)
+        self._take(new)
+        self._put(new, piece)
+
+    def make_move(self, move: Move | list) -> UndoRecord:
+        """
+        Make a move in place, capturing pieces along the way.
+        A path is also accepted (and left untouched).
+
+        :param Move | list move: move or path [(<position>, <captured position> | None), ...]
+        :return UndoRecord: record required to take back the move (see <unmake_move>)
+        """
+        if type(move) is not Move:
+            move = Move.from_path(move)
+
+        squares = move.squares
+        source = CELLS[squares[0]]
+        piece = self._state[source]
+        rank = piece.rank
+        record = UndoRecord(piece=piece, source=source, target=CELLS[squares[-1]])
+
+        for old, new in zip(squares, squares[1:]):
+            self.move(piece, CELLS[old], CELLS[new])
+            if move.captures:
+                capture = CELLS[JUMPED[(old, new)]]
+                record.captured.append((capture, self.remove(capture)))
+
+        record.promoted = piece.rank is not rank
+        return record
+
+    def unmake_move(self, record: UndoRecord) -> None:
+        """
+        Take back a move made with <make_move>.
+
+        :param UndoRecord record: record returned by <make_move>
+        """
+        piece = record.piece
+        self._take(record.target)
+        if record.promoted:
+            piece.rank = Rank.PAWN
+        self._put(record.source, piece)
+
+        for pos, captured in reversed(record.captured):
+            self._put(pos, captured)
@@ -1,10 +1,21 @@
 import logging
 from random import choice
-
-from checkers.ai.ab_pruning import AlphaBetaPruning
+from time import perf_counter
+
+from checkers.ai.ab_pruning import MAX_DEPTH, AlphaBetaPruning
+from checkers.ai.book import OpeningBook
+from checkers.ai.cancel import CancellationToken
+from checkers.ai.engine import SearchOptions
+from checkers.ai.mcts import MonteCarloTreeSearch
+from checkers.ai.parallel import ParallelSearch
+from checkers.ai.ponder import Ponderer
+from checkers.ai.stats import Callback
 from checkers.exceptions.moves import NoMoves
 from checkers.logic.board import Board
+from checkers.logic.moves import Move
 from checkers.logic.piece import Player
+from checkers.logic.undo import UndoRecord
+from checkers.logic.zobrist import SIDE
 
 
 class Game:
@@ -53,6 +64,18 @@ class Game:
         """
         self._player = player
 
+    @property
+    def hash(self) -> int:
+        """
+        Return the Zobrist hash of the position, including the player to move.
+        Usable as a dictionary key (e.g. transposition tables, repetition detection).
+
+        :return int: 64-bit hash
+        """
+        if self.player is Player.WHITE:
+            return self.board.hash ^ SIDE
+        return self.board.hash
+
     @property
     def players(self) -> set:
         """
@@ -60,7 +83,7 @@ class Game:
 
         :return set: players in game
         """
-        return set(x.player for x in self.board.pieces.values())
+        return {player for player in Player if self.board.count(player)}
 
     @property
     def winner(self) -> Player | None:
@@ -115,25 +138,104 @@ class Game:
         :param Player player: player
         :return Cell: position of random move
         """
-        random_piece = choice(self.board.get_player_moves(player))
-        random_move = choice(self.board._get_player_tree(player)[random_piece])
-        return random_move
-
-    def get_ai_move(self, player: Player, depth: int) -> list:
+        legal = self.board.legal_moves(player)
+        random_piece = choice(legal.sources)
+        random_move = choice(legal[random_piece])
+        return random_move.path
+
+    def get_ai_move(
+        self,
+        player: Player,
+        options: SearchOptions | None = None,
+        book: OpeningBook | None = None,
+        ponder: Ponderer | None = None,
+        ai: AlphaBetaPruning | MonteCarloTreeSearch | None = None,
+        callback: Callback | None = None,
+        token: CancellationToken | None = None,
+    ) -> list:
         """
         Return the best move by a given player using alpha-beta pruning AI.
+        Book moves are played without searching.
+        The search deepens iteratively up to <options.depth>, or until a time and/or node budget
+        runs out (see 'SearchOptions'); Engine.MCTS runs playouts until the budget runs out.
+        An engine instance <ai> kept across moves is searched instead of a new one (the engine
+        settings of <options> are ignored): 'MonteCarloTreeSearch' reuses its tree, and engines
+        with worker processes keep their pool (the caller closes it).
+        With <ponder>, its engine is used in the same way, and a ponder hit is played right away
+        if it searched for the whole budget.
 
         :param Player player: player
-        :param int depth: depth of alpha-beta pruning search
+        :param SearchOptions | None options: search settings, defaults to None (a depth or a
+            budget is required unless a book move is played)
+        :param OpeningBook | None book: opening book, defaults to None
+        :param Ponderer | None ponder: pondering started on the opponent's turn, defaults to None
+        :param AlphaBetaPruning | MonteCarloTreeSearch | None ai: engine kept across moves,
+            defaults to None (a new engine, see 'SearchOptions.build')
+        :param Callback | None callback: called with the search statistics (see 'SearchStats')
+            after every completed depth, defaults to None
+        :param CancellationToken | None token: cancels the search (e.g. from another thread): the
+            best move found so far is returned, defaults to None
+        :raises ValueError: when neither a depth nor a budget is given
+        :raises NoMoves: when <player> has no move to play
+        :return list: path of the move
         """
-        ai = AlphaBetaPruning()
-        best_move, _ = ai.minimax(
-            game=self,
-            depth=depth,
-            maximizer=True,
-            max_player=player,
-        )
-        return best_move
+        options = SearchOptions() if options is None else options
+        depth, time_budget = options.depth, options.time_budget
+        pondered = ponder.stop(self) if ponder is not None else None
+
+        if book is not None:
+            move = book.choose(self)
+            if move is not None:
+                logging.info(f"Book move: {move}")
+                return move.path
+
+        if time_budget is None and options.node_budget is None and depth is None:
+            raise ValueError("A depth or a budget is required")
+
+        if pondered is not None:
+            move, _, completed, elapsed = pondered
+            logging.info(f"Ponder hit: completed depth {completed} in {elapsed:.0f} ms")
+            if move is not None:
+                if time_budget is not None and elapsed >= time_budget:
+                    return move.path
+                if time_budget is None and options.node_budget is None:
+                    if completed >= depth:
+                        return move.path
+
+            # Search the rest of the budget (the transposition table is warm)
+            if time_budget is not None:
+                time_budget -= elapsed
+
+        # Engine created for this move only (closed once searched)
+        owned = ponder is None and ai is None
+        if ponder is not None:
+            ai = ponder.engine
+        elif owned:
+            ai = options.build()
+
+        deadline = None
+        if time_budget is not None:
+            deadline = perf_counter() + time_budget / 1000
+
+        try:
+            result = ai.run(
+                game=self,
+                max_player=player,
+                token=token,
+                node_limit=options.node_budget,
+                deadline=deadline,
+                max_depth=depth or MAX_DEPTH,
+                callback=callback,
+            )
+            logging.info(f"Search: {ai.stats} completed={result.completed}")
+
+        finally:
+            if owned and isinstance(ai, (ParallelSearch, MonteCarloTreeSearch)):
+                ai.close()
+
+        if result.move is None:
+            raise NoMoves(player)
+        return result.move.path
 
     def _make_move(self, path: list) -> None:
         """
@@ -156,6 +258,29 @@ class Game:
                 self.board.remove(pos=capture)
                 logging.info(f"{captured_piece} CAPTURED at {capture}")
 
+    def make_move(self, move: Move | list) -> UndoRecord:
+        """
+        Make a move in place and give the turn to the next player.
+
+        :param Move | list move: move or path
+        :return UndoRecord: record required to take back the move (see <unmake_move>)
+        """
+        record = self.board.make_move(move)
+        record.player = self.player
+        record.turn = self.turn
+        self.next_turn()
+        return record
+
+    def unmake_move(self, record: UndoRecord) -> None:
+        """
+        Take back a move made with <make_move>, restoring player and turn.
+
+        :param UndoRecord record: record returned by <make_move>
+        """
+        self.board.unmake_move(record)
+        self.player = record.player  # type: ignore
+        self._turn = record.turn  # type: ignore
+
     def is_game_over(self) -> bool:
         """
         Returns True if the game is over.
@@ -165,7 +290,7 @@ class Game:
         """
         try:
             for player in [Player.BLACK, Player.WHITE]:
-                if not self.board.get_player_moves(player):
+                if not self.board.has_moves(player):
                     self.winner = Player(-self.player.value)
                     raise NoMoves(player)
         except NoMoves:
@@ -0,0 +1,186 @@
+from collections.abc import Iterator
+
+from checkers.logic.piece import Player
+from checkers.logic.tables import CELLS, JUMPED, SQUARES
+
+Cell = tuple[int, int]
+
+
+class Move:
+    """
+    Move class.
+
+    Compact representation of a move (path):
+        - <squares>: squares visited, from source to target (see 'checkers.logic.tables')
+        - <captures>: bitmask of the captured squares
+    Converts to and from the path format [(<position>, <captured position> | None), ...].
+    """
+
+    __slots__ = ("squares", "captures")
+
+    def __init__(self, squares: tuple[int, ...], captures: int = 0) -> None:
+        """
+        Initialize a move.
+
+        :param tuple[int, ...] squares: squares visited, from source to target
+        :param int captures: bitmask of the captured squares
+        """
+        self.squares = squares
+        self.captures = captures
+
+    def __repr__(self) -> str:
+        return " 🡒 ".join(str(CELLS[square]) for square in self.squares)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Move):
+            return NotImplemented
+        return self.squares == other.squares and self.captures == other.captures
+
+    def __hash__(self) -> int:
+        return hash((self.squares, self.captures))
+
+    @property
+    def source(self) -> Cell:
+        """
+        Return the position the move starts from.
+
+        :return Cell: position
+        """
+        return CELLS[self.squares[0]]
+
+    @property
+    def target(self) -> Cell:
+        """
+        Return the position the move ends at.
+
+        :return Cell: position
+        """
+        return CELLS[self.squares[-1]]
+
+    @property
+    def path(self) -> list:
+        """
+        Return the move as a (new) path.
+
+        :return list: path [(<position>, <captured position> | None), ...]
+        """
+        path = [(CELLS[self.squares[0]], None)]
+        for old, new in zip(self.squares, self.squares[1:]):
+            over = JUMPED.get((old, new)) if self.captures else None
+            path.append((CELLS[new], None if over is None else CELLS[over]))
+        return path
+
+    def pack(self) -> int:
+        """
+        Pack the move into a 64-bit integer (5 bits per square, 4 bits for the length).
+        Moves visiting more than 12 squares can't be packed and return 0.
+
+        :return int: packed move (never 0 for a packable move)
+        """
+        if len(self.squares) > 12:
+            return 0
+        packed = 0
+        for square in reversed(self.squares):
+            packed = packed << 5 | square
+        return packed << 4 | len(self.squares)
+
+    @classmethod
+    def unpack(cls, packed: int) -> "Move":
+        """
+        Return the move corresponding to a packed integer (see <pack>).
+
+        :param int packed: packed move
+        :return Move: move
+        """
+        length, packed = packed & 0xF, packed >> 4
+        squares = tuple(packed >> 5 * i & 0x1F for i in range(length))
+        captures = 0
+        for old, new in zip(squares, squares[1:]):
+            over = JUMPED.get((old, new))
+            if over is None:
+                break
+            captures |= 1 << over
+        return cls(squares, captures)
+
+    @classmethod
+    def from_path(cls, path: list) -> "Move":
+        """
+        Return the move corresponding to a path.
+
+        :param list path: path [(<position>, <captured position> | None), ...]
+        :return Move: move
+        """
+        captures = 0
+        for _, capture in path:
+            if capture:
+                captures |= 1 << SQUARES[capture]
+        return cls(tuple(SQUARES[pos] for pos, _ in path), captures)
+
+
+class LegalMoves:
+    """
+    LegalMoves class.
+
+    Represents all the legal moves of a player in a given position.
+    Captures are compulsory: if any piece can capture, only capture moves are legal.
+    """
+
+    def __init__(self, player: Player, moves: dict, captures: bool) -> None:
+        """
+        Initialize the legal moves.
+
+        :param Player player: player
+        :param dict moves: moves per source position {<position>: [<Move>, ...]}
+        :param bool captures: True if the moves are captures
+        """
+        self.player = player
+        self.captures = captures
+        self._moves = moves
+
+    def __repr__(self) -> str:
+        return f"LegalMoves({self.player}, {len(self)} moves, {self.captures=})"
+
+    def __getitem__(self, pos: Cell) -> list:
+        """
+        Return the moves of the piece at a given position.
+
+        :param Cell pos: position
+        :return list: list of moves
+        """
+        return self._moves[pos]
+
+    def __contains__(self, pos: object) -> bool:
+        return pos in self._moves
+
+    def __iter__(self) -> Iterator[Move]:
+        """
+        Iterate over all the legal moves.
+
+        :yield Move: move
+        """
+        for moves in self._moves.values():
+            yield from moves
+
+    def __len__(self) -> int:
+        return sum(len(moves) for moves in self._moves.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._moves)
+
+    @property
+    def sources(self) -> list:
+        """
+        Return the positions of the pieces that can move.
+
+        :return list: positions
+        """
+        return list(self._moves)
+
+    def paths(self, pos: Cell) -> list:
+        """
+        Return the moves of the piece at a given position as (new) paths.
+
+        :param Cell pos: position
+        :return list: list of paths
+        """
+        return [move.path for move in self._moves[pos]]
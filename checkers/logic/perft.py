@@ -0,0 +1,144 @@
+"""
+Perft: count the leaf nodes of the move tree from a position, to check the move generator.
+
+Multi-jump sequences count as a single move.
+Usage: python -m checkers.logic.perft --depth 6 [--mock] [--reference] [--divide]
+"""
+
+import argparse
+import time
+
+from checkers.logic.game import Game
+from checkers.logic.node import Node
+from checkers.logic.piece import Player
+
+# Leaf node counts from depth 0, 'BLACK' to move
+REFERENCE_COUNTS = {
+    "start": [1, 7, 49, 302, 1469, 7361, 36768, 179740, 845931],
+    "mock": [1, 4, 33, 253, 1770, 17208, 112274, 1029592],
+}
+
+
+def _get_reference_moves(game: Game) -> list:
+    """
+    Return the legal paths of the player to move using the reference generator
+    (the original walk of the cell dictionary, see 'Board._get_piece_tree').
+
+    :param Game game: game
+    :return list: list of paths
+    """
+    board = game.board
+    tree = {}
+    for pos in board._get_pieces(game.player):
+        node = board._get_piece_tree(Node(pos))
+        if node.children:
+            tree[pos] = node._get_paths()
+
+    # Captures are compulsory
+    captures = [
+        path
+        for paths in tree.values()
+        for path in paths
+        if any(capture for _, capture in path)
+    ]
+    return captures or [path for paths in tree.values() for path in paths]
+
+
+def _get_moves(game: Game, reference: bool) -> list:
+    """
+    Return the legal moves of the player to move.
+
+    :param Game game: game
+    :param bool reference: True to use the reference generator
+    :return list: list of moves (or paths)
+    """
+    if reference:
+        return _get_reference_moves(game)
+    return list(game.board.generate_moves(game.player))
+
+
+def perft(game: Game, depth: int, reference: bool = False) -> int:
+    """
+    Return the number of leaf nodes of the move tree at a given depth.
+
+    :param Game game: game (searched in place, left untouched)
+    :param int depth: depth
+    :param bool reference: True to use the reference generator
+    :return int: number of leaf nodes
+    """
+    if depth == 0:
+        return 1
+
+    moves = _get_moves(game, reference)
+    if depth == 1:
+        return len(moves)
+
+    nodes = 0
+    for move in moves:
+        record = game.make_move(move)
+        nodes += perft(game, depth - 1, reference)
+        game.unmake_move(record)
+    return nodes
+
+
+def divide(game: Game, depth: int, reference: bool = False) -> dict:
+    """
+    Return the number of leaf nodes at a given depth below each root move.
+
+    :param Game game: game (searched in place, left untouched)
+    :param int depth: depth (at least 1)
+    :param bool reference: True to use the reference generator
+    :return dict: {<move>: <number of leaf nodes>}
+    """
+    nodes = {}
+    for move in _get_moves(game, reference):
+        record = game.make_move(move)
+        key = " 🡒 ".join(str(pos) for pos, _ in move) if reference else repr(move)
+        nodes[key] = perft(game, depth - 1, reference)
+        game.unmake_move(record)
+    return nodes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Count leaf nodes of the move tree.")
+    parser.add_argument("--depth", type=int, default=6, help="depth (default: 6)")
+    parser.add_argument("--mock", action="store_true", help="start from 'MockGame'")
+    parser.add_argument(
+        "--reference", action="store_true", help="use the reference generator"
+    )
+    parser.add_argument(
+        "--divide", action="store_true", help="show counts per root move"
+    )
+    args = parser.parse_args()
+
+    if args.mock:
+        from checkers.config.mock import MockGame
+
+        game: Game = MockGame()
+    else:
+        game = Game()
+    position = "mock" if args.mock else "start"
+
+    for depth in range(1, args.depth + 1):
+        start = time.perf_counter()
+        if args.divide and depth == args.depth:
+            counts = divide(game, depth, args.reference)
+            for move, count in counts.items():
+                print(f"{move}: {count}")
+            nodes = sum(counts.values())
+        else:
+            nodes = perft(game, depth, args.reference)
+        elapsed = time.perf_counter() - start
+
+        expected = REFERENCE_COUNTS[position]
+        status = ""
+        if depth < len(expected):
+            status = "OK" if nodes == expected[depth] else f"FAIL ({expected[depth]})"
+        print(
+            f"{depth=} {nodes=} time={elapsed:.3f}s "
+            f"nodes/s={nodes / elapsed if elapsed else 0:,.0f} {status}"
+        )
+
+
+if __name__ == "__main__":
+    main()
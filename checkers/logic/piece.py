@@ -7,12 +7,17 @@ class Player(Enum):
     BLACK = -1
     WHITE = 1
 
+    # Members are singletons: hash by identity (in C) rather than by name (in Python)
+    __hash__ = object.__hash__
+
 
 @unique
 class Rank(Enum):
     PAWN = 1
     KING = 2
 
+    __hash__ = object.__hash__
+
 
 @dataclass
 class Piece:
@@ -50,12 +55,18 @@ class Piece:
     def directions(self) -> list[tuple[int, int]]:
         """
         Return moves a piece can make.
+        The list is shared by all pieces of the same player and rank: don't modify it.
 
         :return list[tuple[int, int]]: list of allowed moves
         """
-        dir = {
-            Rank.PAWN: {(self.player.value, -1), (self.player.value, 1)},
-            Rank.KING: {(-1, -1), (-1, 1), (1, -1), (1, 1)},
-        }
+        return _DIRECTIONS[(self.player, self.rank)]
+
 
-        return list(dir[self.rank])
+# Directions per (<player>, <rank>), see <Piece.directions>
+_DIRECTIONS = {
+    (player, rank): [(a, b) for a in (-1, 1) for b in (-1, 1)]
+    if rank is Rank.KING
+    else [(player.value, -1), (player.value, 1)]
+    for player in Player
+    for rank in Rank
+}
@@ -0,0 +1,88 @@
+"""
+Lookup tables for the 32 playable (dark) squares, computed once at import time.
+
+Squares are indexed 0-31 in row-major order (see <CELLS>).
+Directions are indexed 0-3 (see <DIRECTIONS>); the opposite of direction <d> is <3 - d>.
+"""
+
+from checkers.logic.piece import Player
+
+Cell = tuple[int, int]
+
+# Playable (dark) squares, indexed 0-31 in row-major order
+CELLS: tuple[Cell, ...] = tuple(
+    (x, y) for x in range(8) for y in range(8) if (x + 1) % 2 == y % 2
+)
+SQUARES: dict[Cell, int] = {cell: square for square, cell in enumerate(CELLS)}
+
+# Diagonal directions (row, column)
+DIRECTIONS: tuple[Cell, ...] = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+def _get_step(square: int, direction: int) -> int | None:
+    """
+    Return the square one step away in a given direction, if on the board.
+
+    :param int square: square index
+    :param int direction: direction index
+    :return int | None: target square or None
+    """
+    (x, y), (a, b) = CELLS[square], DIRECTIONS[direction]
+    return SQUARES.get((x + a, y + b))
+
+
+def _get_jump(square: int, direction: int) -> tuple[int, int, int] | None:
+    """
+    Return the (<direction>, <captured square>, <landing square>) of a jump, if on the board.
+
+    :param int square: square index
+    :param int direction: direction index
+    :return tuple[int, int, int] | None: jump or None
+    """
+    over = _get_step(square, direction)
+    land = None if over is None else _get_step(over, direction)
+    return None if land is None else (direction, over, land)  # type: ignore
+
+
+# Directions a piece can take
+KING_DIRECTIONS = (0, 1, 2, 3)
+PAWN_DIRECTIONS = {
+    player: tuple(d for d, (a, _) in enumerate(DIRECTIONS) if a == player.value)
+    for player in (Player.BLACK, Player.WHITE)
+}
+
+# Regular moves: square -> target squares
+KING_STEPS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(t for d in KING_DIRECTIONS if (t := _get_step(s, d)) is not None)
+    for s in range(32)
+)
+PAWN_STEPS: dict[Player, tuple[tuple[int, ...], ...]] = {
+    player: tuple(
+        tuple(t for d in directions if (t := _get_step(s, d)) is not None)
+        for s in range(32)
+    )
+    for player, directions in PAWN_DIRECTIONS.items()
+}
+
+# Jumps: square -> (<direction>, <captured square>, <landing square>)
+KING_JUMPS: tuple[tuple[tuple[int, int, int], ...], ...] = tuple(
+    tuple(j for d in KING_DIRECTIONS if (j := _get_jump(s, d))) for s in range(32)
+)
+PAWN_JUMPS: dict[Player, tuple[tuple[tuple[int, int, int], ...], ...]] = {
+    player: tuple(
+        tuple(j for d in directions if (j := _get_jump(s, d))) for s in range(32)
+    )
+    for player, directions in PAWN_DIRECTIONS.items()
+}
+
+# Jumps a king can chain after jumping in a given direction (no way back):
+# square -> direction -> jumps
+KING_CONTINUATIONS: tuple[tuple[tuple[tuple[int, int, int], ...], ...], ...] = tuple(
+    tuple(tuple(j for j in KING_JUMPS[s] if j[0] != 3 - d) for d in KING_DIRECTIONS)
+    for s in range(32)
+)
+
+# Captured square of a jump: (<source square>, <landing square>) -> captured square
+JUMPED: dict[tuple[int, int], int] = {
+    (s, land): over for s in range(32) for _, over, land in KING_JUMPS[s]
+}
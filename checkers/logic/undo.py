@@ -0,0 +1,24 @@
+from dataclasses import dataclass, field
+
+from checkers.logic.piece import Piece, Player
+
+
+@dataclass
+class UndoRecord:
+    """
+    UndoRecord dataclass.
+
+    Contains everything needed to take back a move made in place:
+        - <piece>, <source> and <target>: moved piece and its first and last positions
+        - <captured>: captured pieces and their positions, in capture order
+        - <promoted>: True if the piece was converted to 'KING' during the move
+        - <player>, <turn>: player and turn before the move (set by 'Game')
+    """
+
+    piece: Piece
+    source: tuple[int, int]
+    target: tuple[int, int]
+    captured: list[tuple[tuple[int, int], Piece]] = field(default_factory=list)
+    promoted: bool = False
+    player: Player | None = None
+    turn: int | None = None
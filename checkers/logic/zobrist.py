@@ -0,0 +1,16 @@
+from random import Random
+
+from checkers.logic.piece import Player, Rank
+
+# Fixed seed: keys (and therefore hashes) are identical across runs and processes
+_random = Random(0x5EED)
+
+# Random 64-bit key per (<player>, <rank>) and playable square
+KEYS: dict[tuple[Player, Rank], tuple[int, ...]] = {
+    (player, rank): tuple(_random.getrandbits(64) for _ in range(32))
+    for player in (Player.BLACK, Player.WHITE)
+    for rank in (Rank.PAWN, Rank.KING)
+}
+
+# Key toggled when 'WHITE' is the player to move
+SIDE: int = _random.getrandbits(64)
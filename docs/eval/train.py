@@ -1,36 +1,70 @@
+import argparse
 import time
 from multiprocessing.pool import Pool
+from pathlib import Path
 
 import pandas as pd
 import tqdm
 
 from checkers.ai.arena import Arena
+from checkers.ai.transposition import TranspositionTable
+
+# Worker process state (see 'init_worker')
+_table: TranspositionTable | None = None
+
+
+def init_worker(table: TranspositionTable) -> None:
+    global _table
+    _table = table
 
 
 def task(iterable):
     start_time = time.time()
     depth, iteration = iterable
-    checkers = Arena()
+    checkers = Arena(table=_table)
     black_wins, white_wins = checkers.play(games=100, depth=depth)
     end_time = time.time()
     run_time = (end_time - start_time) / 60
     return [depth, iteration, f"{run_time:.2f}", black_wins, white_wins]
 
 
+def load_table(path: Path | None) -> TranspositionTable:
+    if path is not None and path.exists():
+        return TranspositionTable.load(path, megabytes=64, shared=True)
+    return TranspositionTable(megabytes=64, shared=True)
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Play AI games at increasing depths.")
+    parser.add_argument(
+        "--table",
+        type=Path,
+        help="directory keeping the transposition tables between runs (one per depth)",
+    )
+    args = parser.parse_args()
+
     header = ["depth", "iteration", "runtime", "BLACK", "WHITE"]
     df = pd.DataFrame(columns=header)
     replicates = 100
 
-    with Pool(12) as pool:
-        for depth in range(6):
-            print(f"{depth=}")
+    # The cached results of a depth change the games played at another depth (and their runtime):
+    # each depth gets a table of its own, empty unless kept between runs of the same depth
+    for depth in range(6):
+        print(f"{depth=}")
+        path = None if args.table is None else args.table / f"depth{depth}.npy"
+        table = load_table(path)
+
+        with table, Pool(12, initializer=init_worker, initargs=(table,)) as pool:
             for result in tqdm.tqdm(
                 pool.imap(task, list(zip([depth] * replicates, range(replicates)))),
                 total=replicates,
             ):
                 df.loc[df.shape[0] + 1] = result  # type: ignore
 
+            if path is not None:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                table.save(path)
+
     df.to_csv(path_or_buf="results.csv", index=False)
 
 
@@ -0,0 +1,78 @@
+import time
+
+import pytest
+
+from checkers.ai.ab_pruning import AlphaBetaPruning
+from checkers.ai.transposition import TranspositionTable
+from checkers.config.mock import MockGame
+from checkers.exceptions.search import SearchAborted
+from checkers.logic.game import Game
+from checkers.logic.piece import Player
+
+
+class TestAlphaBetaPruning:
+    @pytest.mark.parametrize("game", [Game(), MockGame()])
+    def test_iterative_deepening(self, game: Game) -> None:
+        ai = AlphaBetaPruning(table=TranspositionTable(megabytes=1))
+        move, score, depth = ai.iterative_deepening(game, game.player, max_depth=3)
+        assert depth == 3
+        assert (move, score) == AlphaBetaPruning().minimax(game, 3, True, game.player)
+
+    @pytest.mark.parametrize("budget", [1, 100, 1000])
+    def test_node_budget(self, budget: int) -> None:
+        game, before = MockGame(), MockGame().hash
+        ai = AlphaBetaPruning()
+        move, _, depth = ai.iterative_deepening(game, game.player, node_budget=budget)
+        assert move is not None and depth >= 1
+        # Depth 1 is always completed
+        assert ai.nodes <= budget + 1 or depth == 1
+
+        # Interrupted iteration leaves the game untouched
+        assert game.hash == before
+
+    def test_time_budget(self) -> None:
+        game = Game()
+        start = time.perf_counter()
+        move, _, depth = AlphaBetaPruning().iterative_deepening(
+            game, game.player, time_budget=50
+        )
+        assert move is not None and depth >= 1
+        assert time.perf_counter() - start < 0.5
+
+    def test_search_aborted(self) -> None:
+        ai = AlphaBetaPruning()
+        ai._node_limit = 10
+        with pytest.raises(SearchAborted) as exc_info:
+            ai.minimax(Game(), 4, True, Game().player)
+
+        assert str(exc_info.value) == "Search aborted: node budget of 10 exhausted"
+
+    def test_quiescence(self) -> None:
+        # Quiet position: stand pat
+        game = Game()
+        ai = AlphaBetaPruning()
+        assert ai.quiescence(game) == ai.evaluate(game, game.player) and ai.nodes == 1
+
+        # Pending captures are resolved
+        game = MockGame()
+        before = game.hash
+        score = ai.quiescence(game)
+        assert score != ai.evaluate(game, game.player) and ai.nodes > 2
+        assert game.hash == before
+
+    @pytest.mark.parametrize("quiesce", [True, False])
+    def test_horizon(self, quiesce: bool) -> None:
+        game = MockGame()
+        ai = AlphaBetaPruning(quiesce=quiesce)
+        _, score = ai.search(game, 0, game.player)
+        assert (score == ai.quiescence(game)) is quiesce
+
+    @pytest.mark.parametrize("game", [Game(), MockGame()])
+    def test_evaluate(self, game: Game) -> None:
+        ai = AlphaBetaPruning()
+        expected = sum(
+            piece.rank.value * (1 if piece.player is game.player else -1)
+            for piece in game.board.pieces.values()
+        )
+        assert ai.evaluate(game, game.player) == expected
+        assert ai.evaluate(game, Player(-game.player.value)) == -expected
@@ -0,0 +1,56 @@
+import pytest
+
+from checkers.logic.bitboard import Bitboard
+from checkers.logic.moves import Move
+from checkers.logic.piece import Player, Rank
+from checkers.logic.tables import CELLS, SQUARES
+
+
+@pytest.fixture
+def bitboard() -> Bitboard:
+    bitboard = Bitboard()
+    bitboard.place(SQUARES[(4, 3)], Player.BLACK, Rank.PAWN)
+    bitboard.place(SQUARES[(3, 2)], Player.WHITE, Rank.PAWN)
+    bitboard.place(SQUARES[(6, 7)], Player.WHITE, Rank.KING)
+    return bitboard
+
+
+class TestBitboard:
+    def test_cells(self) -> None:
+        assert len(CELLS) == 32
+        assert all((x + y) % 2 for x, y in CELLS)
+
+    def test_clear(self, bitboard: Bitboard) -> None:
+        bitboard.clear(SQUARES[(4, 3)])
+        assert bitboard.pieces(Player.BLACK) == 0
+
+    def test_jumpers(self, bitboard: Bitboard) -> None:
+        assert bitboard.jumpers(Player.BLACK) == 1 << SQUARES[(4, 3)]
+        assert bitboard.jumpers(Player.WHITE) == 1 << SQUARES[(3, 2)]
+
+    def test_moves(self, bitboard: Bitboard) -> None:
+        capture, *king = bitboard.moves(Player.WHITE)
+        assert capture.path == [((3, 2), None), ((5, 4), (4, 3))]
+        assert len(king) == 2
+
+        assert list(bitboard.generate(Player.WHITE)) == [capture]
+
+    def test_generate_lazily(self, bitboard: Bitboard) -> None:
+        moves = bitboard.generate(Player.BLACK)
+        assert next(moves).captures
+        assert next(moves, None) is None
+
+    def test_make_move(self, bitboard: Bitboard) -> None:
+        (capture,) = bitboard.generate(Player.WHITE)
+        bitboard.make_move(capture, Player.WHITE)
+        assert bitboard.pieces(Player.BLACK) == 0
+        assert bitboard.masks[(Player.WHITE, Rank.PAWN)] == 1 << SQUARES[(5, 4)]
+
+        # Crowned on the back rank
+        pawn = Move((SQUARES[(5, 4)], SQUARES[(6, 5)]))
+        bitboard.make_move(pawn, Player.WHITE)
+        bitboard.make_move(Move((SQUARES[(6, 5)], SQUARES[(7, 6)])), Player.WHITE)
+        assert bitboard.masks[(Player.WHITE, Rank.PAWN)] == 0
+        assert bitboard.masks[(Player.WHITE, Rank.KING)] == (
+            1 << SQUARES[(6, 7)] | 1 << SQUARES[(7, 6)]
+        )
@@ -1,8 +1,12 @@
 from collections.abc import Generator
 
+import numpy as np
 import pytest
 
+from checkers.config.mock import MockGame
 from checkers.logic.board import Board
+from checkers.logic.moves import Move
+from checkers.logic.node import Node
 from checkers.logic.piece import Piece, Player, Rank
 
 
@@ -120,3 +124,130 @@ class TestBoard:
         assert not board._state[new]
         board.move(piece, old, new)
         assert board._state[new] is piece
+
+    @pytest.mark.parametrize("board", [Board(), MockGame().board])
+    @pytest.mark.parametrize("player", [Player.BLACK, Player.WHITE])
+    def test_player_tree_matches_reference(self, board: Board, player: Player) -> None:
+        reference = {}
+        for pos in board._get_pieces(player):
+            node = board._get_piece_tree(Node(pos))
+            if node.children:
+                reference[pos] = sorted(map(tuple, node._get_paths()))
+
+        tree = board._get_player_tree(player)
+        assert {
+            pos: sorted(map(tuple, paths)) for pos, paths in tree.items()
+        } == reference
+
+    def test_make_unmake_move(self) -> None:
+        board = MockGame().board
+        before = {
+            pos: (piece.player, piece.rank) for pos, piece in board.pieces.items()
+        }
+
+        for paths in board._get_player_tree(Player.WHITE).values():
+            for path in paths:
+                record = board.make_move(Move.from_path(path))
+                assert board._state[path[-1][0]] is record.piece
+                assert [pos for pos, _ in record.captured] == [
+                    capture for _, capture in path if capture
+                ]
+
+                board.unmake_move(record)
+                after = {
+                    pos: (piece.player, piece.rank)
+                    for pos, piece in board.pieces.items()
+                }
+                assert after == before
+
+    def test_hash(self, board: Board) -> None:
+        start = board.hash
+
+        # Same position reached through different move orders
+        board.move(board.pieces[(5, 0)], (5, 0), (4, 1))
+        board.move(board.pieces[(5, 2)], (5, 2), (4, 3))
+        transposition = board.hash
+        board.move(board.pieces[(4, 1)], (4, 1), (5, 0))
+        board.move(board.pieces[(4, 3)], (4, 3), (5, 2))
+        assert board.hash == start
+        board.move(board.pieces[(5, 2)], (5, 2), (4, 3))
+        board.move(board.pieces[(5, 0)], (5, 0), (4, 1))
+        assert board.hash == transposition != start
+
+        # Kinging changes the hash
+        board._set_rank((4, 1), Rank.KING)
+        assert board.hash != transposition
+        board._set_rank((4, 1), Rank.PAWN)
+        assert board.hash == transposition
+
+    def test_count(self, board: Board) -> None:
+        assert board.count(Player.BLACK) == board.count(Player.WHITE) == 12
+        assert board.count(Player.BLACK, Rank.KING) == 0
+
+        board.remove((7, 0))
+        board.move(board.pieces[(2, 1)], (2, 1), (7, 0))
+        assert (2, 1) not in board.pieces and (7, 0) in board.pieces
+        assert board.count(Player.BLACK) == 11
+        assert board.count(Player.WHITE, Rank.PAWN) == 11
+        assert board.count(Player.WHITE, Rank.KING) == 1
+
+    def test_material(self, board: Board) -> None:
+        assert board.material(Player.BLACK) == board.material(Player.WHITE) == 12
+
+        # Crowning
+        board.remove((7, 0))
+        board.move(board.pieces[(2, 1)], (2, 1), (7, 0))
+        assert board.material(Player.BLACK) == 11
+        assert board.material(Player.WHITE) == 13
+
+        # Capture and undo
+        piece = board.remove((7, 0))
+        assert board.material(Player.WHITE) == 11
+        board.restore((7, 0), piece)
+        assert board.material(Player.WHITE) == 13
+
+    def test_legal_moves(self, board: Board) -> None:
+        legal = board.legal_moves(Player.BLACK)
+        assert legal is board.legal_moves(Player.BLACK)
+        assert legal.sources == board.get_player_moves(Player.BLACK)
+        assert not legal.captures and len(legal) == 7
+
+        # Paths are copies: modifying them doesn't alter the cache
+        legal.paths((5, 0))[0].pop()
+        assert legal.paths((5, 0)) == [[((5, 0), None), ((4, 1), None)]]
+
+        # Cache is invalidated when the board changes
+        board.move(board.pieces[(5, 0)], (5, 0), (4, 1))
+        assert board.legal_moves(Player.BLACK) is not legal
+
+    def test_legal_moves_captures(self) -> None:
+        board = MockGame().board
+        legal = board.legal_moves(Player.BLACK)
+        assert legal.captures
+        assert legal.sources == board._get_player_captures(Player.BLACK)
+        assert all(move.captures for move in legal)
+
+    @pytest.mark.parametrize("board", [Board(), MockGame().board])
+    def test_generate_moves(self, board: Board) -> None:
+        moves = list(board.generate_moves(Player.BLACK))
+        assert moves == list(board.legal_moves(Player.BLACK))
+        assert list(board.generate_moves(Player.BLACK)) == moves
+
+    @pytest.mark.parametrize("board", [Board(), MockGame().board])
+    @pytest.mark.parametrize("player", [Player.BLACK, Player.WHITE])
+    def test_is_legal(self, board: Board, player: Player) -> None:
+        legal = list(board.generate_moves(player))
+        other = list(board.generate_moves(Player(-player.value)))
+        assert all(board.is_legal(move, player) for move in legal)
+        assert not any(board.is_legal(move, player) for move in other)
+        assert not board.is_legal(Move((0, 31)), player)
+
+    def test_has_captures(self, board: Board) -> None:
+        assert not board.has_captures(Player.BLACK)
+        assert MockGame().board.has_captures(Player.BLACK)
+
+    def test_array(self, board: Board) -> None:
+        array = board.array
+        assert array.dtype == np.int8 and array.shape == (8, 8)
+        assert (array == 1).sum() == (array == -1).sum() == 12
+        assert str(board) == str(array)
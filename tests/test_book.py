@@ -0,0 +1,119 @@
+from pathlib import Path
+
+import pytest
+
+from checkers.ai.book import BookBuilder, OpeningBook, lower_bound
+from checkers.ai.engine import SearchOptions
+from checkers.config.mock import MockGame
+from checkers.logic.game import Game
+from checkers.logic.moves import Move
+
+
+@pytest.fixture
+def builder() -> BookBuilder:
+    game = Game()
+    first, second, *_ = game.board.generate_moves(game.player)
+    builder = BookBuilder()
+    builder.add(game.hash, first, 1)
+    builder.add(game.hash, first, -1)
+    builder.add(game.hash, second, 1)
+    builder.add(game.hash, second, 0)
+
+    # Other positions
+    for game in (MockGame(),):
+        for move in game.board.generate_moves(game.player):
+            builder.add(game.hash, move, 0)
+
+    return builder
+
+
+@pytest.fixture
+def path(builder: BookBuilder, tmp_path: Path) -> Path:
+    path = tmp_path / "book.bin"
+    builder.write(path)
+    return path
+
+
+class TestOpeningBook:
+    def test_write(self, builder: BookBuilder, path: Path) -> None:
+        with OpeningBook(path) as book:
+            assert len(book) == len(builder)
+            keys = book._columns["keys"]
+            assert (keys[:-1] <= keys[1:]).all()
+            del keys
+
+    def test_probe(self, path: Path) -> None:
+        game = Game()
+        first, second, *_ = game.board.generate_moves(game.player)
+        with OpeningBook(path) as book:
+            assert sorted(book.probe(game), key=lambda entry: entry[1:]) == [
+                (second, 2, 1, 0),
+                (first, 2, 1, 1),
+            ]
+            assert book.choose(game) == second
+            assert book.choose(game, min_games=3) is None
+
+            # Unknown position
+            game.make_move(first)
+            assert book.probe(game) == [] and book.choose(game) is None
+
+    def test_choose(self, tmp_path: Path) -> None:
+        game = Game()
+        first, second, *_ = game.board.generate_moves(game.player)
+        builder = BookBuilder()
+        builder.add(game.hash, first, 1)
+        for result in [1] * 60 + [-1] * 40:
+            builder.add(game.hash, second, result)
+        builder.write(tmp_path / "book.bin")
+
+        # A single won game doesn't outrank a well-tested move
+        with OpeningBook(tmp_path / "book.bin") as book:
+            assert book.choose(game) == second
+
+    def test_play_winner(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def blocked() -> Game:
+            # A BLACK pawn that gets stuck behind two WHITE pawns, whichever move it plays
+            game = Game()
+            keep = {(2, 1): (5, 0), (0, 1): (0, 1), (0, 3): (0, 3)}
+            for position in list(game.board.pieces):
+                if position not in keep.values():
+                    game.board.remove(position)
+            game.board.move(game.board.pieces[(5, 0)], (5, 0), (2, 1))
+            return game
+
+        monkeypatch.setattr("checkers.logic.game.Game", blocked)
+        builder = BookBuilder()
+        builder.play(games=1, depth=1, plies=1, noise=0)
+
+        # WHITE is to move (and can), BLACK is stuck: the player to move loses
+        assert [stats for stats in builder.stats.values()] == [[1, 1, 0]]
+
+    def test_lower_bound(self) -> None:
+        assert lower_bound(1.0, 1) < lower_bound(0.6, 100) < 0.6
+        assert lower_bound(0.5, 10) < lower_bound(0.5, 1000) < 0.5
+        assert lower_bound(0.0, 10) == pytest.approx(0.0)
+
+    def test_invalid(self, tmp_path: Path) -> None:
+        path = tmp_path / "book.bin"
+        path.write_bytes(b"\0" * 64)
+        with pytest.raises(ValueError):
+            OpeningBook(path)
+
+    def test_play(self, tmp_path: Path) -> None:
+        builder = BookBuilder()
+        builder.play(games=2, depth=1, plies=4, seed=0)
+        assert 4 <= len(builder) <= 8
+        assert all(games == 2 or games == 1 for games, _, _ in builder.stats.values())
+
+        builder.write(tmp_path / "book.bin")
+        with OpeningBook(tmp_path / "book.bin") as book:
+            assert book.choose(Game()) is not None
+
+    def test_ai_move(self, path: Path) -> None:
+        game = Game()
+        with OpeningBook(path) as book:
+            expected = book.choose(game)
+            move = game.get_ai_move(
+                player=game.player, options=SearchOptions(depth=1), book=book
+            )
+            assert Move.from_path(move) == expected
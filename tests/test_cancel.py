@@ -0,0 +1,123 @@
+import threading
+from time import perf_counter
+
+import pytest
+
+from checkers.ai.ab_pruning import MAX_DEPTH, AlphaBetaPruning
+from checkers.ai.cancel import CancellationToken
+from checkers.ai.engine import SearchOptions
+from checkers.ai.mcts import MonteCarloTreeSearch
+from checkers.ai.negamax import Negamax
+from checkers.ai.parallel import ParallelSearch
+from checkers.ai.transposition import TranspositionTable
+from checkers.logic.game import Game
+from checkers.logic.piece import Player
+
+
+@pytest.fixture
+def game() -> Game:
+    return Game()
+
+
+def cancel_later(token: CancellationToken, seconds: float = 0.1) -> threading.Timer:
+    """
+    Cancel a token from another thread.
+
+    :param CancellationToken token: token
+    :param float seconds: delay before cancelling, defaults to 0.1
+    :return threading.Timer: started timer
+    """
+    timer = threading.Timer(seconds, token.cancel)
+    timer.start()
+    return timer
+
+
+class TestCancellationToken:
+    def test_cancel(self) -> None:
+        token = CancellationToken()
+        assert not token.cancelled
+        token.cancel()
+        assert token.cancelled
+        token.reset()
+        assert not token.cancelled
+
+
+class TestRun:
+    @pytest.fixture(params=[AlphaBetaPruning, Negamax])
+    def ai(self, request) -> AlphaBetaPruning:
+        return request.param(table=TranspositionTable(megabytes=1))
+
+    def test_completed(self, ai: AlphaBetaPruning, game: Game) -> None:
+        result = ai.run(game, game.player, max_depth=3)
+        assert result.completed and result.depth == 3
+        assert result.move in game.board.legal_moves(game.player)[result.move.source]
+        assert result.stats is ai.stats
+
+    def test_cancel(self, ai: AlphaBetaPruning, game: Game) -> None:
+        token = CancellationToken()
+        before = game.hash
+
+        # Cancelled before the start: depth 1 is still searched
+        token.cancel()
+        result = ai.run(game, game.player, token=token, max_depth=MAX_DEPTH)
+        assert not result.completed and result.depth == 1
+        assert result.move is not None
+
+        # Cancelled while searching
+        token.reset()
+        start = perf_counter()
+        timer = cancel_later(token)
+        result = ai.run(game, game.player, token=token, max_depth=MAX_DEPTH)
+        timer.join()
+        assert not result.completed and 1 <= result.depth < MAX_DEPTH
+        assert result.move in game.board.legal_moves(game.player)[result.move.source]
+        assert perf_counter() - start < 5
+        assert game.hash == before
+
+        # The cancellation only applies to the runs of the token
+        assert ai.run(game, game.player, max_depth=3).completed
+
+    def test_limits(self, ai: AlphaBetaPruning, game: Game) -> None:
+        result = ai.run(game, game.player, node_limit=500)
+        assert not result.completed and result.move is not None
+
+        start = perf_counter()
+        result = ai.run(game, game.player, deadline=start + 0.05)
+        assert not result.completed and result.move is not None
+        assert perf_counter() - start < 1
+
+    def test_parallel(self, game: Game) -> None:
+        token = CancellationToken()
+        with ParallelSearch(workers=2, min_depth=2) as ai:
+            start = perf_counter()
+            timer = cancel_later(token, 0.3)
+            result = ai.run(game, game.player, token=token)
+            timer.join()
+            assert not result.completed and result.move is not None
+            assert perf_counter() - start < 5
+
+            # The workers can search again
+            token.reset()
+            assert ai.run(game, game.player, token=token, max_depth=4).completed
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_mcts(self, game: Game, workers: int) -> None:
+        with MonteCarloTreeSearch(playouts=20, workers=workers, seed=0) as ai:
+            result = ai.run(game, game.player)
+            assert result.completed and ai.nodes == 20
+
+            token = CancellationToken()
+            start = perf_counter()
+            timer = cancel_later(token)
+            result = ai.run(game, game.player, token=token, node_limit=10**9)
+            timer.join()
+            assert not result.completed and result.move is not None
+            assert perf_counter() - start < 5
+
+    def test_ai_move(self, game: Game) -> None:
+        token = CancellationToken()
+        token.cancel()
+        path = game.get_ai_move(
+            player=Player.BLACK, options=SearchOptions(depth=MAX_DEPTH), token=token
+        )
+        assert path[0][0] in game.board.legal_moves(Player.BLACK)
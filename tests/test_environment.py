@@ -0,0 +1,51 @@
+import importlib
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from checkers.logic.piece import Player
+
+
+class Sprite:
+    def __init__(self, *args, **kwargs) -> None:
+        pass
+
+
+@pytest.fixture
+def env(monkeypatch: pytest.MonkeyPatch, tmp_path):
+    # Logs (checkers.log) are written to a temporary directory
+    monkeypatch.chdir(tmp_path)
+
+    # Headless: pygame is replaced by a stub, and the modules using it are imported again
+    pygame = MagicMock()
+    pygame.sprite.Sprite = Sprite
+    monkeypatch.setitem(sys.modules, "pygame", pygame)
+    for name in list(sys.modules):
+        if name.startswith(("checkers.graphics", "checkers.config.environment")):
+            monkeypatch.delitem(sys.modules, name)
+
+    environment = importlib.import_module("checkers.config.environment")
+    env = environment.Environment()
+    yield env
+    if env.AI_PONDER is not None:
+        env.AI_PONDER.stop()
+
+
+class TestEnvironment:
+    def test_quit_pondering(self, env) -> None:
+        assert env.AI_PONDER is not None
+        env.AI_OPTIONS.time_budget = 60_000
+        env._ponder()
+
+        # Human move, then the AI search stops the pondering while the window is closed
+        move = next(env.game.board.generate_moves(env.HUMAN_PLAYER))
+        env.game.make_move(move)
+        assert env.game.player is Player.WHITE
+        env.AI_MOVE = env._think()
+
+        with pytest.raises(SystemExit):
+            env.quit()
+        assert not env.AI_PONDER.pondering
+        assert not env.AI_THREAD.is_alive()
+        assert env.AI_MOVE.done()
@@ -0,0 +1,67 @@
+import random
+
+import numpy as np
+import pytest
+
+from checkers.ai.evaluation import (
+    KING_TABLE,
+    PAWN_TABLE,
+    Evaluation,
+    Material,
+    Positional,
+)
+from checkers.config.mock import MockGame
+from checkers.logic.game import Game
+from checkers.logic.piece import Player
+
+
+@pytest.fixture(scope="module")
+def games() -> list[Game]:
+    """
+    Return games after random moves.
+    """
+    random.seed(0)
+    games = []
+    for _ in range(20):
+        game = Game()
+        for _ in range(random.randint(0, 60)):
+            if not game.board.has_moves(game.player):
+                break
+            game.make_move(random.choice(list(game.board.legal_moves(game.player))))
+        games.append(game)
+    return games
+
+
+class TestEvaluation:
+    @pytest.mark.parametrize("table", [PAWN_TABLE, KING_TABLE])
+    def test_tables(self, table: dict) -> None:
+        assert (table[Player.BLACK] == np.rot90(table[Player.WHITE], 2)).all()
+
+        # Light squares are never used
+        light = np.add.outer(np.arange(8), np.arange(8)) % 2 == 0
+        assert not table[Player.WHITE][light].any()
+
+    def test_abstract(self) -> None:
+        with pytest.raises(TypeError):
+            Evaluation()  # type: ignore
+
+    def test_material(self) -> None:
+        game = MockGame()
+        material = Material()
+        assert material(game.board, Player.BLACK) == -material(game.board, Player.WHITE)
+
+    @pytest.mark.parametrize("player", [Player.BLACK, Player.WHITE])
+    def test_positional(self, player: Player) -> None:
+        positional = Positional()
+        assert positional(Game().board, player) == 0
+        assert positional(MockGame().board, player) == -positional(
+            MockGame().board, Player(-player.value)
+        )
+
+    @pytest.mark.parametrize("player", [Player.BLACK, Player.WHITE])
+    def test_batch(self, games: list[Game], player: Player) -> None:
+        positional = Positional()
+        boards = np.stack([game.board.array for game in games])
+        expected = [positional(game.board, player) for game in games]
+        assert positional.batch(boards, player).tolist() == expected
+        assert positional.batch(boards[0], player).shape == (1,)
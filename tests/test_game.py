@@ -1,5 +1,7 @@
 import pytest
 
+from checkers.ai.engine import ENGINES, Engine, SearchOptions
+from checkers.ai.transposition import TranspositionTable
 from checkers.exceptions.moves import NoMoves
 from checkers.logic.board import Board
 from checkers.logic.game import Game
@@ -46,9 +48,67 @@ class TestGame:
         assert type(move) is list and len(move[0]) == 2
 
     def test_ai_move(self, game: Game) -> None:
-        move = game.get_ai_move(player=Player.BLACK, depth=1)
+        move = game.get_ai_move(player=Player.BLACK, options=SearchOptions(depth=1))
         assert type(move) is list and len(move[0]) == 2
 
+    def test_ai_move_budget(self, game: Game) -> None:
+        move = game.get_ai_move(
+            player=Player.BLACK, options=SearchOptions(time_budget=20, node_budget=500)
+        )
+        assert type(move) is list and len(move[0]) == 2
+
+        with pytest.raises(ValueError):
+            game.get_ai_move(player=Player.BLACK)
+
+    @pytest.mark.parametrize("engine", list(Engine))
+    def test_ai_move_engine(self, game: Game, engine: Engine) -> None:
+        move = game.get_ai_move(
+            player=Player.BLACK,
+            options=SearchOptions(depth=4, engine=engine, workers=2),
+        )
+        assert type(move) is list and len(move[0]) == 2
+
+    def test_ai_move_no_moves(self, game: Game) -> None:
+        for position, piece in game.board.state.items():
+            if type(piece) is Piece and piece.player is Player.BLACK:
+                game.board.remove(position)
+
+        with pytest.raises(NoMoves):
+            game.get_ai_move(player=Player.BLACK, options=SearchOptions(depth=2))
+
+    @pytest.mark.parametrize("engine", list(Engine))
+    def test_search_options(self, engine: Engine) -> None:
+        table = TranspositionTable(megabytes=1)
+        ai = SearchOptions(engine=engine, workers=2, table=table).build()
+        assert type(ai) is ENGINES[engine]
+        if engine is not Engine.MCTS:
+            assert ai.table is table  # type: ignore
+
+    def test_ai_move_table(self, game: Game) -> None:
+        table = TranspositionTable(megabytes=1)
+        game.get_ai_move(
+            player=Player.BLACK, options=SearchOptions(depth=3, table=table)
+        )
+        assert len(table) > 0 and table.probe(game.hash) is not None
+
+    def test_hash(self, game: Game) -> None:
+        assert game.hash == game.board.hash
+        game.next_turn()
+        assert game.hash != game.board.hash
+        assert {game.hash: True}[game.hash]
+
+    def test_make_unmake_move(self, game: Game) -> None:
+        before = str(game.board)
+        path = game.get_random_move(player=Player.BLACK)
+        record = game.make_move(path)
+        assert game.player is Player.WHITE and game.turn == 2
+        assert str(game.board) != before
+
+        game.unmake_move(record)
+        assert game.player is Player.BLACK and game.turn == 1
+        assert str(game.board) == before
+        assert game.hash == Game().hash
+
     def test_game_over(self, game: Game) -> None:
         # Game is not over
         assert game.is_game_over() is False
@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from checkers.ai.cancel import CancellationToken
+from checkers.ai.engine import SearchOptions
+from checkers.ai.mcts import MonteCarloTreeSearch, playout
+from checkers.logic.bitboard import Bitboard
+from checkers.logic.game import Game
+from checkers.logic.piece import Player, Rank
+from checkers.logic.tables import SQUARES
+
+
+@pytest.fixture
+def game() -> Game:
+    return Game()
+
+
+class TestMonteCarloTreeSearch:
+    def test_playout(self, game: Game) -> None:
+        winners = []
+        for _ in range(2):
+            bitboard = Bitboard()
+            bitboard.masks = dict(game.board.bitboard.masks)
+            winners.append(playout(bitboard, game.player, random.Random(0), 150))
+            assert bitboard.masks != game.board.bitboard.masks
+        assert winners[0] == winners[1]
+
+    def test_playout_game_over(self) -> None:
+        # White pawn blocked on the edge: white has no moves
+        bitboard = Bitboard()
+        bitboard.place(SQUARES[(6, 7)], Player.WHITE, Rank.PAWN)
+        bitboard.place(SQUARES[(7, 6)], Player.BLACK, Rank.KING)
+        bitboard.place(SQUARES[(2, 1)], Player.BLACK, Rank.PAWN)
+        rng = random.Random(0)
+        assert playout(bitboard, Player.WHITE, rng, 150) is Player.BLACK
+        assert playout(bitboard, Player.BLACK, rng, 150) is Player.WHITE
+
+        # Decided by material
+        bitboard = Bitboard()
+        bitboard.place(SQUARES[(0, 1)], Player.WHITE, Rank.KING)
+        bitboard.place(SQUARES[(7, 6)], Player.BLACK, Rank.PAWN)
+        assert playout(bitboard, Player.WHITE, rng, 0) is Player.WHITE
+
+    def test_search(self, game: Game) -> None:
+        ai = MonteCarloTreeSearch(playouts=50, seed=0)
+        move, score = ai.search(game, 0, game.player)
+        assert move in list(game.board.generate_moves(game.player))
+        assert 0 <= score <= 1 and ai.nodes == 50
+        assert ai.root.visits == 50  # type: ignore
+
+    def test_budget(self, game: Game) -> None:
+        ai = MonteCarloTreeSearch(seed=0)
+        move, _, depth = ai.iterative_deepening(game, game.player, time_budget=50)
+        assert move is not None and depth >= 1
+        assert 0 < ai.nodes < ai.playouts
+
+    def test_reuse(self, game: Game) -> None:
+        ai = MonteCarloTreeSearch(playouts=200, seed=0)
+        move, _ = ai.search(game, 0, game.player)
+        child = next(c for c in ai.root.children if c.move == move)  # type: ignore
+        reply = max(child.children, key=lambda c: c.visits)
+        game.make_move(move)  # type: ignore
+        game.make_move(reply.move)  # type: ignore
+
+        # The node of the reply is the root of the next search
+        assert ai._find(game.hash) is reply
+        visits = reply.visits
+        ai.search(game, 0, game.player)
+        assert ai.root is reply and reply.parent is None
+        assert reply.visits == visits + 200
+
+    def test_cancel(self, game: Game) -> None:
+        ai = MonteCarloTreeSearch(playouts=20, seed=0)
+        token = CancellationToken()
+        token.cancel()
+        result = ai.run(game, game.player, token=token)
+        assert result.move is not None and ai.nodes == 1
+
+        # The cancellation only applies to the run of the token (the tree is reused)
+        assert ai.run(game, game.player).completed and ai.nodes == 21
+
+    def test_workers(self, game: Game) -> None:
+        with MonteCarloTreeSearch(playouts=40, workers=2, seed=0) as ai:
+            move, score = ai.search(game, 0, game.player)
+            assert move in list(game.board.generate_moves(game.player))
+            assert ai.nodes == 40
+
+    def test_ai_move(self, game: Game) -> None:
+        ai = MonteCarloTreeSearch(playouts=100, seed=0)
+        path = game.get_ai_move(game.player, SearchOptions(node_budget=100), ai=ai)
+        root = ai.root
+        game._make_move(path)
+        game.next_turn()
+        reply = game.get_random_move(game.player)
+        game._make_move(reply)
+        game.next_turn()
+
+        # The engine was kept: its tree is reused for the next move
+        node = ai._find(game.hash)
+        game.get_ai_move(game.player, SearchOptions(node_budget=100), ai=ai)
+        assert node is not None and ai.root is node and ai.root is not root
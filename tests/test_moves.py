@@ -0,0 +1,41 @@
+import pytest
+
+from checkers.logic.moves import Move
+from checkers.logic.tables import SQUARES
+
+
+class TestMove:
+    @pytest.mark.parametrize(
+        "path",
+        [
+            [((5, 0), None), ((4, 1), None)],
+            [((2, 1), None), ((4, 3), (3, 2))],
+            [((7, 0), None), ((5, 2), (6, 1)), ((3, 4), (4, 3)), ((5, 6), (4, 5))],
+        ],
+    )
+    def test_path(self, path: list) -> None:
+        move = Move.from_path(path)
+        assert move.path == path
+        assert move.source == path[0][0] and move.target == path[-1][0]
+        assert move.captures.bit_count() == sum(1 for _, capture in path if capture)
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            [((5, 0), None), ((4, 1), None)],
+            [((7, 0), None), ((5, 2), (6, 1)), ((3, 4), (4, 3)), ((5, 6), (4, 5))],
+        ],
+    )
+    def test_pack(self, path: list) -> None:
+        move = Move.from_path(path)
+        assert 0 < move.pack() < 2**64
+        assert Move.unpack(move.pack()) == move
+
+    def test_eq(self) -> None:
+        move = Move((SQUARES[(5, 0)], SQUARES[(4, 1)]))
+        assert move == Move.from_path([((5, 0), None), ((4, 1), None)])
+        assert len({move, Move(move.squares)}) == 1
+
+    def test_slots(self) -> None:
+        with pytest.raises(AttributeError):
+            Move((0, 4)).path_cache = []  # type: ignore
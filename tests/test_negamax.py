@@ -0,0 +1,42 @@
+import pytest
+
+from checkers.ai.ab_pruning import AlphaBetaPruning
+from checkers.ai.evaluation import Positional
+from checkers.ai.negamax import Negamax
+from checkers.ai.transposition import TranspositionTable
+from checkers.config.mock import MockGame
+from checkers.logic.game import Game
+
+
+class TestNegamax:
+    @pytest.mark.parametrize("game", [Game(), MockGame()])
+    @pytest.mark.parametrize("depth", [1, 2, 4])
+    @pytest.mark.parametrize("table", [None, TranspositionTable(megabytes=1)])
+    def test_search(self, game: Game, depth: int, table: TranspositionTable) -> None:
+        _, expected = AlphaBetaPruning().search(game, depth, game.player)
+        move, score = Negamax(table=table).search(game, depth, game.player)
+        assert score == expected
+        assert move in game.board.legal_moves(game.player)[move.source]
+
+    def test_max_player(self) -> None:
+        game = MockGame()
+        _, score = Negamax().search(game, 3, game.player)
+        opponent = next(player for player in game.players if player is not game.player)
+        assert Negamax().search(game, 3, opponent)[1] == -score
+
+    @pytest.mark.parametrize("aspiration", [True, False])
+    def test_iterative_deepening(self, aspiration: bool) -> None:
+        game = MockGame()
+        ai = Negamax(table=TranspositionTable(megabytes=1), aspiration=aspiration)
+        _, score, depth = ai.iterative_deepening(game, game.player, max_depth=5)
+        assert depth == 5
+        assert score == AlphaBetaPruning().search(game, 5, game.player)[1]
+
+    @pytest.mark.parametrize("depth", [1, 3])
+    def test_positional(self, depth: int) -> None:
+        game = MockGame()
+        _, expected = AlphaBetaPruning(evaluation=Positional()).search(
+            game, depth, game.player
+        )
+        _, score = Negamax(evaluation=Positional()).search(game, depth, game.player)
+        assert score == expected
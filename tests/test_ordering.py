@@ -0,0 +1,60 @@
+import pytest
+
+from checkers.ai.ordering import KILLERS, MoveOrdering
+from checkers.config.mock import MockGame
+from checkers.logic.game import Game
+from checkers.logic.moves import Move
+
+
+@pytest.fixture
+def ordering() -> MoveOrdering:
+    return MoveOrdering()
+
+
+class TestMoveOrdering:
+    @pytest.mark.parametrize("game", [Game(), MockGame()])
+    def test_moves(self, ordering: MoveOrdering, game: Game) -> None:
+        moves = list(ordering.moves(game))
+        assert sorted(moves, key=hash) == sorted(
+            game.board.generate_moves(game.player), key=hash
+        )
+
+    def test_captures(self, ordering: MoveOrdering) -> None:
+        game = MockGame()
+        lengths = [move.captures.bit_count() for move in ordering.moves(game)]
+        assert lengths == sorted(lengths, reverse=True) and lengths[0] > 1
+
+    def test_hash_move(self, ordering: MoveOrdering) -> None:
+        game = Game()
+        last = list(game.board.generate_moves(game.player))[-1]
+        moves = list(ordering.moves(game, hash_move=last))
+        assert moves[0] == last and moves.count(last) == 1
+
+        # Illegal hash moves (e.g. hash collisions) are skipped
+        illegal = Move((0, 31))
+        assert illegal not in ordering.moves(game, hash_move=illegal)
+
+    def test_killers(self, ordering: MoveOrdering) -> None:
+        game = Game()
+        moves = list(game.board.generate_moves(game.player))
+        for move in moves[: KILLERS + 1]:
+            ordering.update(move, depth=1, ply=3)
+
+        assert ordering.killers[3] == moves[KILLERS:0:-1]
+        assert list(ordering.moves(game, ply=3))[:KILLERS] == ordering.killers[3]
+        assert list(ordering.moves(game, ply=2))[0] == moves[0]
+
+    def test_history(self, ordering: MoveOrdering) -> None:
+        game = Game()
+        last = list(game.board.generate_moves(game.player))[-1]
+        ordering.update(last, depth=3, ply=0)
+        assert ordering.history[last.squares[0] << 5 | last.squares[-1]] == 9
+        assert list(ordering.moves(game, ply=1))[0] == last
+
+        ordering.clear()
+        assert not any(ordering.history) and not ordering.killers
+
+    def test_update_captures(self, ordering: MoveOrdering) -> None:
+        move = next(MockGame().board.generate_moves(MockGame().player))
+        ordering.update(move, depth=3, ply=0)
+        assert not ordering.killers and not any(ordering.history)
@@ -0,0 +1,73 @@
+import pytest
+
+from checkers.ai.ab_pruning import CLOCK_INTERVAL
+from checkers.ai.engine import SearchOptions
+from checkers.ai.negamax import Negamax
+from checkers.ai.parallel import ParallelSearch
+from checkers.ai.transposition import TranspositionTable
+from checkers.config.mock import MockGame
+from checkers.logic.game import Game
+
+
+@pytest.fixture(scope="module")
+def ai() -> ParallelSearch:
+    with ParallelSearch(table=TranspositionTable(megabytes=1), workers=2) as ai:
+        yield ai
+
+
+class TestParallelSearch:
+    @pytest.mark.parametrize("game", [Game(), MockGame()])
+    @pytest.mark.parametrize("depth", [2, 4, 5])
+    def test_search(self, ai: ParallelSearch, game: Game, depth: int) -> None:
+        before = game.hash
+        _, expected = Negamax().search(game, depth, game.player)
+        move, score = ai.search(game, depth, game.player)
+        assert score == expected
+        assert move in game.board.legal_moves(game.player)[move.source]
+        assert game.hash == before
+
+    def test_serial(self) -> None:
+        game = Game()
+        ai = ParallelSearch(workers=2)
+        ai.search(game, 3, game.player)
+        assert ai._pool is None
+
+    def test_iterative_deepening(self, ai: ParallelSearch) -> None:
+        game = MockGame()
+        move, _, depth = ai.iterative_deepening(game, game.player, node_budget=2000)
+        assert move is not None and depth >= 4
+
+    @pytest.mark.parametrize("node_limit", [500, 2000, 5000])
+    def test_node_limit(self, node_limit: int) -> None:
+        game = Game()
+        with ParallelSearch(workers=4, min_depth=2) as ai:
+            result = ai.run(game, game.player, node_limit=node_limit, max_depth=20)
+
+        # The workers share the budget: each may overshoot it by less than a clock interval
+        assert not result.completed
+        assert node_limit < result.stats.nodes <= node_limit + 5 * CLOCK_INTERVAL
+
+    def test_shared_table(self) -> None:
+        game = Game()
+        with TranspositionTable(megabytes=1, shared=True) as table:
+            with ParallelSearch(table=table, workers=2, min_depth=2) as ai:
+                _, expected = Negamax().search(game, 4, game.player)
+                _, score = ai.search(game, 4, game.player)
+                assert score == expected
+
+            # The workers stored their results in the table
+            for move in game.board.generate_moves(game.player):
+                record = game.make_move(move)
+                assert table.probe(game.hash) is not None
+                game.unmake_move(record)
+
+    def test_ai_move(self) -> None:
+        game = Game()
+        with ParallelSearch(workers=2, min_depth=2) as ai:
+            game.get_ai_move(game.player, SearchOptions(depth=3), ai=ai)
+            pool = ai._pool
+            assert pool is not None
+
+            # The engine is not closed: the next move reuses its pool (and worker tables)
+            game.get_ai_move(game.player, SearchOptions(depth=3), ai=ai)
+            assert ai._pool is pool
@@ -0,0 +1,30 @@
+import pytest
+
+from checkers.config.mock import MockGame
+from checkers.logic.game import Game
+from checkers.logic.perft import REFERENCE_COUNTS, divide, perft
+
+
+@pytest.fixture(params=["start", "mock"])
+def position(request: pytest.FixtureRequest) -> tuple[str, Game]:
+    return request.param, MockGame() if request.param == "mock" else Game()
+
+
+class TestPerft:
+    @pytest.mark.parametrize("depth", range(5))
+    def test_perft(self, position: tuple[str, Game], depth: int) -> None:
+        name, game = position
+        assert perft(game, depth) == REFERENCE_COUNTS[name][depth]
+
+    @pytest.mark.parametrize("depth", range(4))
+    def test_perft_reference(self, position: tuple[str, Game], depth: int) -> None:
+        name, game = position
+        assert perft(game, depth, reference=True) == REFERENCE_COUNTS[name][depth]
+
+    def test_divide(self, position: tuple[str, Game]) -> None:
+        name, game = position
+        before = game.hash
+        counts = divide(game, 3)
+        assert sum(counts.values()) == REFERENCE_COUNTS[name][3]
+        assert counts == divide(game, 3, reference=True)
+        assert game.hash == before
@@ -0,0 +1,124 @@
+import time
+from itertools import count
+from threading import Barrier, Thread
+
+import pytest
+
+from checkers.ai.engine import SearchOptions
+from checkers.ai.negamax import Negamax
+from checkers.ai.ponder import Ponderer
+from checkers.ai.transposition import TranspositionTable
+from checkers.logic.game import Game
+from checkers.logic.piece import Player
+
+
+@pytest.fixture
+def ponder() -> Ponderer:
+    return Ponderer(Negamax(table=TranspositionTable(1)))
+
+
+def wait(ponder: Ponderer, seconds: float = 0.2) -> None:
+    """
+    Let the ponderer search the predicted position for a while.
+
+    :param Ponderer ponder: ponderer
+    :param float seconds: minimum pondering time, defaults to 0.2
+    """
+    deadline = time.perf_counter() + 10
+    while ponder.guess is None and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    time.sleep(seconds)
+
+
+class TestPonderer:
+    def test_hit(self, ponder: Ponderer) -> None:
+        game = Game()
+        ponder.start(game, Player.WHITE)
+        wait(ponder)
+        assert ponder.pondering
+
+        game.make_move(ponder.guess)  # type: ignore
+        move, _, depth, elapsed = ponder.stop(game)  # type: ignore
+        assert not ponder.pondering
+        assert move.source in game.board.legal_moves(Player.WHITE)  # type: ignore
+        assert depth >= 1 and elapsed > 0
+
+    def test_miss(self, ponder: Ponderer) -> None:
+        game = Game()
+        ponder.start(game, Player.WHITE)
+        wait(ponder, 0)
+
+        move = next(
+            move
+            for move in game.board.generate_moves(game.player)
+            if move != ponder.guess
+        )
+        game.make_move(move)
+        assert ponder.stop(game) is None
+
+    def test_stop(self, ponder: Ponderer) -> None:
+        game = Game()
+        before = game.hash
+        ponder.start(game, Player.WHITE)
+        assert ponder.stop() is None
+        assert not ponder.pondering and game.hash == before
+
+        # Stopping only cancels the pondering: the engine can still search
+        result = ponder.engine.run(game, game.player, max_depth=3)
+        assert result.completed and result.depth == 3
+
+    def test_concurrent_stop(
+        self, ponder: Ponderer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        game = Game()
+        ponder.start(game, Player.WHITE)
+        wait(ponder, 0)
+
+        # Widen the race: later callers are slower to cancel the search
+        calls = count()
+        cancel = ponder._token.cancel
+        monkeypatch.setattr(
+            ponder._token, "cancel", lambda: (time.sleep(0.05 * next(calls)), cancel())
+        )
+
+        # Stopped at once by several threads (e.g. the AI search and 'Environment.quit')
+        barrier = Barrier(8)
+        errors: list[BaseException] = []
+
+        def stop() -> None:
+            barrier.wait()
+            try:
+                ponder.stop(game)
+            except BaseException as exc:
+                errors.append(exc)
+
+        threads = [Thread(target=stop) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == [] and not ponder.pondering
+
+    def test_ai_move(self, ponder: Ponderer) -> None:
+        game = Game()
+        ponder.start(game, Player.WHITE)
+        wait(ponder)
+        game.make_move(ponder.guess)  # type: ignore
+
+        # Ponder hit: the budget was already spent while pondering, nothing is searched
+        streamed: list[int] = []
+        path = game.get_ai_move(
+            player=Player.WHITE,
+            options=SearchOptions(time_budget=100),
+            ponder=ponder,
+            callback=lambda stats: streamed.append(stats.depth),
+        )
+        assert streamed == []
+        assert path[0][0] in game.board.legal_moves(Player.WHITE)
+
+        # No pondering: regular search with the ponderer's engine
+        game.make_move(path)
+        path = game.get_ai_move(
+            player=Player.BLACK, options=SearchOptions(depth=2), ponder=ponder
+        )
+        assert path[0][0] in game.board.legal_moves(Player.BLACK)
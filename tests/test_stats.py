@@ -0,0 +1,72 @@
+import pytest
+
+from checkers.ai.ab_pruning import AlphaBetaPruning
+from checkers.ai.engine import SearchOptions
+from checkers.ai.mcts import MonteCarloTreeSearch
+from checkers.ai.negamax import Negamax
+from checkers.ai.stats import SearchStats
+from checkers.ai.transposition import TranspositionTable
+from checkers.config.mock import MockGame
+from checkers.logic.game import Game
+from checkers.logic.piece import Player
+
+
+class TestSearchStats:
+    def test_empty(self) -> None:
+        stats = SearchStats()
+        assert stats.nps == 0 and stats.hit_rate is None
+        assert stats.first_cutoff_rate is None
+        assert "hit_rate=-" in str(stats)
+
+    def test_rates(self) -> None:
+        stats = SearchStats(nodes=5000, elapsed=250, probes=40, hits=10)
+        stats.cutoff(0)
+        stats.cutoff(0)
+        stats.cutoff(3)
+        assert stats.cutoffs == [2, 0, 0, 1]
+        assert stats.nps == 20000 and stats.hit_rate == 0.25
+        assert stats.first_cutoff_rate == 2 / 3
+        assert "nps=20000 hit_rate=25%" in str(stats)
+
+    @pytest.mark.parametrize("engine", [AlphaBetaPruning, Negamax])
+    def test_search(self, engine: type[AlphaBetaPruning]) -> None:
+        game = MockGame()
+        ai = engine(table=TranspositionTable(1))
+        streamed = []
+        ai.iterative_deepening(
+            game, game.player, max_depth=4, callback=lambda s: streamed.append(s.depth)
+        )
+
+        stats = ai.stats
+        assert streamed == [1, 2, 3, 4]
+        assert [iteration.depth for iteration in stats.iterations] == streamed
+        assert stats.nodes == ai.nodes == stats.iterations[-1].nodes
+        assert stats.evaluations > 0 and sum(stats.cutoffs) > 0
+        assert stats.max_ply >= stats.depth == 4
+        assert stats.hit_rate is not None and stats.probes > 0
+        assert stats.elapsed > 0
+
+    def test_without_table(self) -> None:
+        game = Game()
+        ai = Negamax()
+        ai.iterative_deepening(game, game.player, max_depth=2)
+        assert ai.stats.depth == 2 and ai.stats.hit_rate is None
+
+    def test_mcts(self) -> None:
+        game = Game()
+        ai = MonteCarloTreeSearch(playouts=30, seed=0)
+        streamed: list[SearchStats] = []
+        ai.iterative_deepening(game, game.player, callback=streamed.append)
+        assert streamed == [ai.stats]
+        assert ai.stats.nodes == ai.stats.evaluations == 30
+        assert ai.stats.max_ply >= ai.stats.depth >= 1
+
+    def test_ai_move(self) -> None:
+        game = Game()
+        streamed: list[SearchStats] = []
+        game.get_ai_move(
+            Player.BLACK,
+            SearchOptions(depth=3),
+            callback=lambda s: streamed.append(s.depth),
+        )
+        assert streamed == [1, 2, 3]
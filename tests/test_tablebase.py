@@ -0,0 +1,142 @@
+import pickle
+import random
+
+import pytest
+
+from checkers.ai.ab_pruning import AlphaBetaPruning
+from checkers.ai.negamax import Negamax
+from checkers.ai.tablebase import TB_WIN, Tablebase, generate, get_index, signatures
+from checkers.logic.bitboard import Bitboard
+from checkers.logic.game import Game
+from checkers.logic.piece import Piece, Player, Rank
+
+CELLS = [(x, y) for x in range(8) for y in range(8) if (x + y) % 2]
+
+# White to move wins in 11 plies
+WIN = {(0, 3): (Player.BLACK, Rank.KING), (1, 0): (Player.WHITE, Rank.KING)}
+
+
+def endgame(pieces: dict, player: Player) -> Game:
+    """
+    Return a game with the given pieces only.
+
+    :param dict pieces: {<position>: (<Player>, <Rank>)}
+    :param Player player: player to move
+    :return Game: game
+    """
+    game = Game()
+    for pos in list(game.board.pieces):
+        game.board.remove(pos)
+    for pos, (owner, rank) in pieces.items():
+        game.board.restore(pos, Piece(owner, rank))
+    game.player = player
+    return game
+
+
+@pytest.fixture(scope="module")
+def tablebase(tmp_path_factory: pytest.TempPathFactory) -> Tablebase:
+    path = tmp_path_factory.mktemp("tablebases")
+    generate(2, path)
+    return Tablebase(path)
+
+
+class TestTablebase:
+    def test_signatures(self) -> None:
+        assert signatures(2) == [(0, 1, 0, 1), (0, 1, 1, 0), (1, 0, 0, 1), (1, 0, 1, 0)]
+        assert signatures(3, kings=True) == [(0, 1, 0, 1), (0, 1, 0, 2), (0, 2, 0, 1)]
+
+    def test_index(self) -> None:
+        bitboard = Bitboard()
+        indexes = set()
+        for black in range(32):
+            for white in range(32):
+                if black == white:
+                    continue
+                bitboard.masks[(Player.BLACK, Rank.KING)] = 1 << black
+                bitboard.masks[(Player.WHITE, Rank.PAWN)] = 1 << white
+                for player in Player:
+                    indexes.add(get_index(bitboard.masks, player))
+
+        assert len(indexes) == 32 * 31 * 2
+        assert max(indexes) < 32 * 32 * 2
+
+    def test_files(self, tablebase: Tablebase) -> None:
+        assert tablebase.pieces == 2
+        assert all(signature in tablebase for signature in signatures(2))
+        assert (0, 2, 0, 1) not in tablebase
+
+    def test_probe(self, tablebase: Tablebase) -> None:
+        game = endgame(WIN, Player.WHITE)
+        assert tablebase.probe(game.board, Player.WHITE) == TB_WIN - 11
+        assert tablebase.probe(game.board, Player.BLACK) == 0
+
+        # Too many pieces
+        game = Game()
+        assert tablebase.probe(game.board, game.player) is None
+
+        # Game over
+        game = endgame({(3, 2): (Player.BLACK, Rank.KING)}, Player.WHITE)
+        assert tablebase.probe(game.board, Player.WHITE) == -TB_WIN
+
+    def test_consistency(self, tablebase: Tablebase) -> None:
+        """
+        Every score is the best score of the moves (one ply further), using the game rules.
+        """
+        rng = random.Random(0)
+
+        def shorten(score: int) -> int:
+            return 1 - score if score > 0 else -1 - score if score < 0 else 0
+
+        for _ in range(300):
+            black, white = rng.sample(CELLS, 2)
+            ranks = [rng.choice(list(Rank)) for _ in range(2)]
+            if black[0] == 0:
+                ranks[0] = Rank.KING
+            if white[0] == 7:
+                ranks[1] = Rank.KING
+            game = endgame(
+                {black: (Player.BLACK, ranks[0]), white: (Player.WHITE, ranks[1])},
+                rng.choice(list(Player)),
+            )
+
+            score = tablebase.probe(game.board, game.player)
+            if AlphaBetaPruning._is_game_over(game):
+                assert score == -TB_WIN
+                continue
+
+            best = -TB_WIN
+            for move in list(game.board.generate_moves(game.player)):
+                record = game.make_move(move)
+                best = max(best, shorten(tablebase.probe(game.board, game.player)))
+                game.unmake_move(record)
+            assert score == best
+
+    def test_pickle(self, tablebase: Tablebase) -> None:
+        game = endgame(
+            {(2, 1): (Player.BLACK, Rank.KING), (5, 4): (Player.WHITE, Rank.PAWN)},
+            Player.BLACK,
+        )
+        copy = pickle.loads(pickle.dumps(tablebase))
+        assert copy.path == tablebase.path
+        assert copy.probe(game.board, game.player) == tablebase.probe(
+            game.board, game.player
+        )
+
+    @pytest.mark.parametrize("depth", [1, 3])
+    def test_search(self, tablebase: Tablebase, depth: int) -> None:
+        game = endgame(WIN, Player.WHITE)
+        ai = Negamax(tablebase=tablebase)
+        move, score = ai.search(game, depth, game.player)
+
+        # The shortest win is played, even beyond the search depth
+        game.make_move(move)  # type: ignore
+        assert tablebase.probe(game.board, game.player) == 10 - TB_WIN
+        assert score == TB_WIN - 10
+
+    @pytest.mark.parametrize("max_player", list(Player))
+    def test_minimax(self, tablebase: Tablebase, max_player: Player) -> None:
+        game = endgame(WIN, Player.WHITE)
+        ai = AlphaBetaPruning(tablebase=tablebase)
+        maximizer = max_player is game.player
+        _, score = ai.minimax(game, 2, maximizer, max_player)
+        assert score == (TB_WIN - 10) * (1 if maximizer else -1)
@@ -0,0 +1,41 @@
+import pytest
+
+from checkers.logic.piece import Player
+from checkers.logic.tables import (
+    CELLS,
+    KING_CONTINUATIONS,
+    KING_JUMPS,
+    KING_STEPS,
+    PAWN_JUMPS,
+    PAWN_STEPS,
+    SQUARES,
+)
+
+
+class TestTables:
+    @pytest.mark.parametrize(
+        "cell, player, targets",
+        [
+            ((2, 1), Player.WHITE, [(3, 0), (3, 2)]),
+            ((2, 7), Player.WHITE, [(3, 6)]),
+            ((5, 0), Player.BLACK, [(4, 1)]),
+            ((0, 1), Player.BLACK, []),
+        ],
+    )
+    def test_pawn_steps(self, cell: tuple, player: Player, targets: list) -> None:
+        assert [CELLS[t] for t in PAWN_STEPS[player][SQUARES[cell]]] == targets
+
+    def test_king_steps(self) -> None:
+        assert len(KING_STEPS[SQUARES[(4, 3)]]) == 4
+        assert len(KING_STEPS[SQUARES[(7, 0)]]) == 1
+
+    def test_jumps(self) -> None:
+        jumps = [(CELLS[o], CELLS[l]) for _, o, l in KING_JUMPS[SQUARES[(2, 1)]]]
+        assert jumps == [((1, 2), (0, 3)), ((3, 2), (4, 3))]
+        assert PAWN_JUMPS[Player.BLACK][SQUARES[(1, 0)]] == ()
+
+    def test_king_continuations(self) -> None:
+        square = SQUARES[(4, 3)]
+        for direction, jumps in enumerate(KING_CONTINUATIONS[square]):
+            assert len(jumps) == 3
+            assert all(d != 3 - direction for d, _, _ in jumps)
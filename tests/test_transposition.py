@@ -0,0 +1,122 @@
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from checkers.ai.ab_pruning import AlphaBetaPruning
+from checkers.ai.transposition import ENTRY, Bound, TranspositionTable
+from checkers.config.mock import MockGame
+from checkers.logic.game import Game
+from checkers.logic.moves import Move
+
+
+class TestTranspositionTable:
+    @pytest.fixture
+    def table(self) -> TranspositionTable:
+        return TranspositionTable(megabytes=0.01)
+
+    def test_capacity(self, table: TranspositionTable) -> None:
+        assert table.capacity * ENTRY.itemsize <= 0.01 * 2**20
+        assert len(table) == 0
+
+    def test_store(self, table: TranspositionTable) -> None:
+        move = Move((21, 17))
+        table.store(42, 3, -5, Bound.LOWER, move)
+        assert table.probe(42) == (3, -5, Bound.LOWER, move)
+        assert table.probe(43) is None
+        assert (table.hits, table.misses) == (1, 1)
+        assert table.hit_rate == 0.5
+
+    def test_replace(self, table: TranspositionTable) -> None:
+        n = len(table._table)
+        table.store(1, 5, 10, Bound.EXACT, None)
+        # Shallower result for another position goes to the always-replace slot
+        table.store(1 + n, 2, 20, Bound.EXACT, None)
+        table.store(1 + 2 * n, 1, 30, Bound.EXACT, None)
+        assert table.probe(1) == (5, 10, Bound.EXACT, None)
+        assert table.probe(1 + n) is None
+        assert table.probe(1 + 2 * n) == (1, 30, Bound.EXACT, None)
+
+        # Entries from a previous search are replaced, and demoted
+        table.new_search()
+        table.store(1 + n, 2, 20, Bound.EXACT, None)
+        assert table.probe(1 + n) == (2, 20, Bound.EXACT, None)
+        assert table.probe(1) == (5, 10, Bound.EXACT, None)
+        assert len(table) == 2
+
+    def test_clear(self, table: TranspositionTable) -> None:
+        table.store(1, 5, 10, Bound.EXACT, None)
+        table.probe(1)
+        table.clear()
+        assert len(table) == 0 and table.hits == 0
+
+    def test_torn_entry(self, table: TranspositionTable) -> None:
+        table.store(1, 5, 10, Bound.EXACT, None)
+        table.store(1 + len(table._table), 3, 20, Bound.LOWER, Move((21, 17)))
+
+        # Another process wrote part of an entry only: the key no longer matches
+        table._table[1][0]["score"] = -30
+        table._table[1][1]["bound"] = Bound.UPPER
+        assert table.probe(1) is None
+        assert table.probe(1 + len(table._table)) is None
+
+    def test_save_load(self, table: TranspositionTable, tmp_path: Path) -> None:
+        path = tmp_path / "table.npy"
+        table.store(1, 5, 10, Bound.EXACT, Move((21, 17)))
+        table.store(2, 2, 20, Bound.UPPER, None)
+        table.store(3, 1, 30, Bound.LOWER, None)
+        table.save(path)
+
+        loaded = TranspositionTable.load(path)
+        assert loaded.capacity == table.capacity and len(loaded) == 3
+        assert loaded.probe(1) == (5, 10, Bound.EXACT, Move((21, 17)))
+
+        # Smaller table (one bucket): the deepest entries are kept
+        loaded = TranspositionTable.load(path, megabytes=ENTRY.itemsize * 2 / 2**20)
+        assert loaded.capacity == 2 and loaded.probe(3) is None
+        assert loaded.probe(1) == (5, 10, Bound.EXACT, Move((21, 17)))
+        assert loaded.probe(2) == (2, 20, Bound.UPPER, None)
+
+        np.save(path, np.zeros(4))
+        with pytest.raises(ValueError):
+            TranspositionTable.load(path)
+
+    def test_shared(self) -> None:
+        with TranspositionTable(megabytes=0.01, shared=True) as table:
+            assert table.shared and len(table) == 0
+            table.store(1, 5, 10, Bound.EXACT, None)
+
+            # Unpickled (e.g. in a worker process): maps the same entries
+            other = pickle.loads(pickle.dumps(table))
+            assert other.probe(1) == (5, 10, Bound.EXACT, None)
+            other.store(2, 3, -4, Bound.LOWER, None)
+            assert table.probe(2) == (3, -4, Bound.LOWER, None)
+            other.close()
+
+        assert not table.shared
+        assert not TranspositionTable(megabytes=0.01).shared
+
+    def test_shared_age(self) -> None:
+        with TranspositionTable(megabytes=0.01, shared=True) as table:
+            other = pickle.loads(pickle.dumps(table))
+            n = len(table._table)
+
+            # The age of the search is shared: the other process doesn't see the owner's
+            # deep entry as stale, and doesn't replace it with a shallow one
+            table.new_search()
+            table.store(1, 6, 10, Bound.EXACT, None)
+            other.store(1 + n, 2, 20, Bound.EXACT, None)
+            assert table.probe(1) == (6, 10, Bound.EXACT, None)
+            assert table._table[1][0]["depth"] == 6
+            assert other.probe(1 + n) == (2, 20, Bound.EXACT, None)
+            other.close()
+
+    @pytest.mark.parametrize("game", [Game(), MockGame()])
+    @pytest.mark.parametrize("depth", [1, 3, 5])
+    def test_minimax(self, game: Game, depth: int) -> None:
+        table = TranspositionTable(megabytes=1)
+        _, expected = AlphaBetaPruning().minimax(game, depth, True, game.player)
+        _, score = AlphaBetaPruning(table).minimax(game, depth, True, game.player)
+        assert score == expected
+        assert len(table) > 0